@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Artifact I/O
+
+Run-wide output profile for generated JSON/CSV artifacts (channels, structured data,
+cost models) and a shared reader that does not care how they were written.
+
+- format:   pretty (indent=2, the default) or compact (no whitespace)
+- compress: none, gzip (<path>.gz) or zstd (<path>.zst, needs the zstandard package)
+- the profile comes from --format/--compress, or $ARTIFACT_FORMAT/$ARTIFACT_COMPRESS
+- gzip headers carry the run clock, so reruns stay byte-identical
+- writing an artifact removes its other variants (e.g. the plain .json when writing
+  .json.gz), so readers never see a stale copy
+- open_artifact() takes the logical path (e.g. channel.json), finds whichever variant
+  exists and decompresses by magic bytes, not by file name
+
+Usage:
+    parser = argparse.ArgumentParser()
+    add_output_arguments(parser)
+    configure_output(parser.parse_args())
+
+    path = write_json(data, 'output/07_Conversations/teams/construction-vendors.json')
+    data = load_json('output/07_Conversations/teams/construction-vendors.json')
+    with open_artifact('output/03_Historical_Projects/historical_projects.jsonl') as f:
+        ...
+"""
+
+import gzip
+import io
+import json
+import os
+from typing import Any, Optional
+
+from run_context import get_clock
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+FORMATS = ('pretty', 'compact')
+COMPRESSIONS = ('none', 'gzip', 'zstd')
+
+SUFFIXES = {'none': '', 'gzip': '.gz', 'zstd': '.zst'}
+
+GZIP_MAGIC = b'\x1f\x8b'
+ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+class OutputProfile:
+    """How artifacts are serialized and compressed for this run."""
+
+    def __init__(self, format: Optional[str] = None, compress: Optional[str] = None, level: Optional[int] = None):
+        self.format = format or os.environ.get('ARTIFACT_FORMAT') or 'pretty'
+        self.compress = compress or os.environ.get('ARTIFACT_COMPRESS') or 'none'
+
+        if self.format not in FORMATS:
+            raise ValueError(f"Unknown artifact format: {self.format}")
+        if self.compress not in COMPRESSIONS:
+            raise ValueError(f"Unknown artifact compression: {self.compress}")
+        if self.compress == 'zstd' and zstandard is None:
+            raise ValueError("zstd compression needs the zstandard package (pip install zstandard)")
+
+        self.level = level if level is not None else (6 if self.compress == 'gzip' else 3)
+
+    @property
+    def suffix(self) -> str:
+        """Extension appended to artifact paths."""
+        return SUFFIXES[self.compress]
+
+    def json_options(self) -> dict:
+        """json.dump keyword arguments for this format."""
+        if self.format == 'compact':
+            return {'separators': (',', ':')}
+        return {'indent': 2}
+
+
+_profile = None
+
+
+def get_profile() -> OutputProfile:
+    """Return the output profile, creating the default on first use."""
+    global _profile
+    if _profile is None:
+        _profile = OutputProfile()
+    return _profile
+
+
+def set_profile(profile: OutputProfile):
+    """Install the output profile (call before writing artifacts)."""
+    global _profile
+    _profile = profile
+
+
+def resolve_artifact(path: str) -> Optional[str]:
+    """Existing file for a logical artifact path (plain, .gz or .zst), or None."""
+    for suffix in SUFFIXES.values():
+        if os.path.exists(path + suffix):
+            return path + suffix
+    return None
+
+
+def artifact_exists(path: str) -> bool:
+    """True when any variant of the artifact exists."""
+    return resolve_artifact(path) is not None
+
+
+def artifact_target(path: str) -> str:
+    """On-disk path the current profile writes a logical artifact path to."""
+    return path + get_profile().suffix
+
+
+def open_output(path: str, newline: Optional[str] = None):
+    """Open a text artifact for writing under the current profile (see artifact_target)."""
+    profile = get_profile()
+    target = artifact_target(path)
+    os.makedirs(os.path.dirname(target) or '.', exist_ok=True)
+
+    for suffix in SUFFIXES.values():
+        if path + suffix != target and os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    if profile.compress == 'none':
+        return open(target, 'w', newline=newline)
+
+    if profile.compress == 'gzip':
+        binary = gzip.GzipFile(target, mode='wb', compresslevel=profile.level, mtime=get_clock().timestamp())
+    else:
+        binary = zstandard.ZstdCompressor(level=profile.level).stream_writer(open(target, 'wb'))
+
+    return io.TextIOWrapper(binary, encoding='utf-8', newline=newline)
+
+
+def open_artifact(path: str, newline: Optional[str] = None):
+    """
+    Open an artifact for reading as text, whatever profile wrote it.
+
+    Args:
+        path: Logical path (e.g. foo.json); foo.json.gz / foo.json.zst are found too
+    """
+    actual = resolve_artifact(path)
+    if actual is None:
+        raise FileNotFoundError(path)
+
+    with open(actual, 'rb') as f:
+        magic = f.read(4)
+
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.open(actual, 'rt', encoding='utf-8', newline=newline)
+
+    if magic.startswith(ZSTD_MAGIC):
+        if zstandard is None:
+            raise RuntimeError(f"{actual} is zstd-compressed; install the zstandard package to read it")
+        binary = zstandard.ZstdDecompressor().stream_reader(open(actual, 'rb'), closefd=True)
+        return io.TextIOWrapper(binary, encoding='utf-8', newline=newline)
+
+    return open(actual, 'r', newline=newline)
+
+
+def write_json(data: Any, path: str) -> str:
+    """Write data as JSON under the current profile; returns the path written."""
+    with open_output(path) as f:
+        json.dump(data, f, **get_profile().json_options())
+    return artifact_target(path)
+
+
+def load_json(path: str) -> Any:
+    """Load a JSON artifact written under any profile."""
+    with open_artifact(path) as f:
+        return json.load(f)
+
+
+def add_output_arguments(parser):
+    """Add --format and --compress to a CLI parser."""
+    parser.add_argument('--format', choices=FORMATS, default=None,
+                        help='JSON artifact layout (default: $ARTIFACT_FORMAT or pretty)')
+    parser.add_argument('--compress', choices=COMPRESSIONS, default=None,
+                        help='Artifact compression (default: $ARTIFACT_COMPRESS or none)')
+
+
+def configure_output(args) -> OutputProfile:
+    """Install the output profile from parsed CLI args."""
+    try:
+        profile = OutputProfile(args.format, args.compress)
+    except ValueError as e:
+        raise SystemExit(f"error: {e}")
+    set_profile(profile)
+    return profile
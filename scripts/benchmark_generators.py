@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Conversation Generator Benchmarks
+
+Drives the conversation generators at the documented phase scales plus 10x and 100x
+synthetic scales, each case in a fresh process writing to a temporary output directory:
+
+    phase1 = 20 stores, phase2 = 100, phase3 = 300, 10x = 3,000, 100x = 30,000
+
+Each scale renders 5 artifacts per 6 stores (Phase 3: 250 meetings for 300 stores),
+cycling through the meeting types / Teams themes with a fixed seed and run clock, so
+every run does the same work.
+
+Reported per generator and scale:
+- artifacts/sec
+- index update time and its share of the run
+- peak RSS of the case's process
+- bytes on disk
+
+Results are compared against a stored baseline; a throughput drop beyond --tolerance
+fails the run (exit code 1), and so does a missing baseline unless --save-baseline
+records one (baselines are machine-specific and are not committed). Small cases are noisy, so --repeat N keeps the fastest of
+N runs. Cases that hit --time-budget stop early and report the throughput of what they
+finished.
+
+Usage:
+    python scripts/benchmark_generators.py
+    python scripts/benchmark_generators.py --scales phase3,10x --generators meetings_v2
+    python scripts/benchmark_generators.py --save-baseline --repeat 3
+    python scripts/benchmark_generators.py --baseline output/benchmarks/baseline.json --tolerance 0.2
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from generate_meeting_transcripts import MeetingTranscriptGenerator
+from generate_meeting_transcripts_v2 import EnhancedMeetingGenerator
+from generate_teams_conversations import TeamsConversationGenerator
+from run_context import RunClock, set_clock
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SCALES = {'phase1': 20, 'phase2': 100, 'phase3': 300, '10x': 3000, '100x': 30000}
+GENERATORS = ('meetings_v1', 'meetings_v2', 'teams')
+
+MEETING_TYPES = ['site_visit_debrief', 'vendor_negotiation', 'lessons_learned', 'design_review', 'weekly_dev_sync']
+STORE_MEETINGS = ('site_visit_debrief', 'lessons_learned')
+TEAMS_CHANNELS = [
+    'store-development-general', 'construction-vendors', 'design-standards-updates',
+    'columbus-market-planning', 'cincinnati-market-planning', 'finance-cost-tracking',
+    'project-management-tools', 'quality-and-compliance'
+]
+TEAMS_THEMES = ['supply-chain-delay', 'site-visit-followup', 'template-update', 'cost-variance-discussion']
+PARTICIPANT_POOL = ['Sarah Chen', 'Tom Wilson', 'Jennifer Liu', 'Mike Rodriguez', 'David Park']
+
+# Fixed workload inputs
+BENCH_SEED = 2025
+BENCH_EPOCH = 1735689600  # 2025-01-01T00:00:00Z
+BASE_DATE = datetime(2025, 1, 1)
+
+DEFAULT_BASELINE = 'output/benchmarks/baseline.json'
+
+
+def artifacts_for(stores: int) -> int:
+    """Number of artifacts rendered at a store scale."""
+    return max(1, round(stores * 5 / 6))
+
+
+def _meeting_jobs(stores: int) -> List[Dict]:
+    """Meeting type, store/topic and date for each artifact at a scale."""
+    store_ids = [f'Store-{101 + i}' for i in range(stores)]
+    jobs = []
+
+    for i in range(artifacts_for(stores)):
+        meeting_type = MEETING_TYPES[i % len(MEETING_TYPES)]
+        store_or_topic = store_ids[i % stores] if meeting_type in STORE_MEETINGS else f'bench-topic-{i}'
+        jobs.append({
+            'meeting_type': meeting_type,
+            'store_or_topic': store_or_topic,
+            'is_store': meeting_type in STORE_MEETINGS,
+            'date': (BASE_DATE + timedelta(days=i % 365)).strftime('%Y-%m-%d')
+        })
+
+    return jobs
+
+
+def _bench_meetings_v1(output_dir: str, stores: int, deadline: float, index_timings: List[float]) -> Dict:
+    """Classic MeetingTranscriptGenerator."""
+    generator = MeetingTranscriptGenerator(output_dir=output_dir, seed=BENCH_SEED)
+    _time_method(generator, '_update_conversation_index', index_timings)
+
+    done = 0
+    for job in _meeting_jobs(stores):
+        if time.perf_counter() > deadline:
+            break
+        generator.generate_transcript({
+            'meeting_type': job['meeting_type'],
+            'store_id_or_topic': job['store_or_topic'],
+            'date': job['date'],
+            'duration_minutes': 60,
+            'context': {}
+        })
+        done += 1
+
+    return {'artifacts': done, 'setup_seconds': 0.0}
+
+
+def _bench_meetings_v2(output_dir: str, stores: int, deadline: float, index_timings: List[float]) -> Dict:
+    """EnhancedMeetingGenerator, with the store context table built up front like the phase runners."""
+    setup = time.perf_counter()
+    generator = EnhancedMeetingGenerator(output_dir=output_dir, seed=BENCH_SEED)
+    if generator.context_table is not None:
+        generator.context_table.build([f'Store-{101 + i}' for i in range(stores)])
+    setup = time.perf_counter() - setup
+    _time_method(generator, '_add_index_entry', index_timings)
+
+    done = 0
+    for job in _meeting_jobs(stores):
+        if time.perf_counter() > deadline:
+            break
+        key = 'store_id' if job['is_store'] else 'topic'
+        generator.generate_transcript(job['meeting_type'], {
+            'meeting_type': job['meeting_type'],
+            key: job['store_or_topic'],
+            'date': job['date'],
+            'participants': ''
+        })
+        done += 1
+
+    return {'artifacts': done, 'setup_seconds': setup}
+
+
+def _bench_teams(output_dir: str, stores: int, deadline: float, index_timings: List[float]) -> Dict:
+    """TeamsConversationGenerator, one thread per call as the phase runners use it."""
+    generator = TeamsConversationGenerator(output_dir=output_dir, seed=BENCH_SEED)
+    _time_method(generator, '_update_conversation_index', index_timings)
+
+    done = 0
+    for i in range(artifacts_for(stores)):
+        if time.perf_counter() > deadline:
+            break
+        generator.generate_conversations({
+            'channel_name': TEAMS_CHANNELS[i % len(TEAMS_CHANNELS)],
+            'conversation_themes': [{
+                'theme': TEAMS_THEMES[i % len(TEAMS_THEMES)],
+                'store_id': f'Store-{101 + i % stores}',
+                'date': (BASE_DATE + timedelta(days=i % 365)).strftime('%Y-%m-%d')
+            }],
+            'participant_pool': PARTICIPANT_POOL
+        })
+        done += 1
+
+    return {'artifacts': done, 'setup_seconds': 0.0}
+
+
+BENCHMARKS = {
+    'meetings_v1': _bench_meetings_v1,
+    'meetings_v2': _bench_meetings_v2,
+    'teams': _bench_teams
+}
+
+
+def _time_method(obj, name: str, timings: List[float]):
+    """Wrap an instance method so each call's duration is appended to timings."""
+    original = getattr(obj, name)
+
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return original(*args, **kwargs)
+        finally:
+            timings.append(time.perf_counter() - start)
+
+    setattr(obj, name, timed)
+
+
+def _dir_size(path: str) -> int:
+    """Total size of all files under a directory."""
+    total = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            total += os.path.getsize(os.path.join(dirpath, filename))
+    return total
+
+
+def run_case(generator: str, scale: str, time_budget: float) -> Dict:
+    """Run one benchmark case (call in a fresh process so peak RSS is per case)."""
+    set_clock(RunClock(BENCH_EPOCH))
+
+    stores = SCALES[scale]
+    index_timings = []
+
+    with tempfile.TemporaryDirectory(prefix='bench_') as tmp:
+        output_dir = os.path.join(tmp, '07_Conversations')
+        start = time.perf_counter()
+
+        # Generators report every artifact; keep the benchmark output readable
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            result = BENCHMARKS[generator](output_dir, stores, start + time_budget, index_timings)
+
+        elapsed = time.perf_counter() - start
+        bytes_on_disk = _dir_size(output_dir)
+
+    index_seconds = sum(index_timings)
+    work_seconds = elapsed - result['setup_seconds']
+
+    return {
+        'generator': generator,
+        'scale': scale,
+        'stores': stores,
+        'artifacts': result['artifacts'],
+        'target_artifacts': artifacts_for(stores),
+        'partial': result['artifacts'] < artifacts_for(stores),
+        'seconds': round(elapsed, 3),
+        'setup_seconds': round(result['setup_seconds'], 3),
+        'artifacts_per_second': round(result['artifacts'] / work_seconds, 2) if work_seconds > 0 else None,
+        'index_seconds': round(index_seconds, 3),
+        'index_share': round(index_seconds / work_seconds, 3) if work_seconds > 0 else None,
+        'index_ms_per_artifact': round(1000 * index_seconds / result['artifacts'], 3) if result['artifacts'] else None,
+        'peak_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource is not None else None,
+        'bytes_on_disk': bytes_on_disk
+    }
+
+
+def compare(results: List[Dict], baseline: Dict, tolerance: float) -> List[str]:
+    """Throughput regressions of results against a baseline report."""
+    previous = {(case['generator'], case['scale']): case for case in baseline.get('results', [])}
+    regressions = []
+
+    for case in results:
+        before = previous.get((case['generator'], case['scale']))
+        if not before or not before.get('artifacts_per_second') or case['artifacts_per_second'] is None:
+            continue
+
+        ratio = case['artifacts_per_second'] / before['artifacts_per_second']
+        case['baseline_artifacts_per_second'] = before['artifacts_per_second']
+        case['vs_baseline'] = round(ratio, 3)
+
+        if ratio < 1 - tolerance:
+            regressions.append(
+                f"{case['generator']} @ {case['scale']}: {case['artifacts_per_second']} artifacts/sec "
+                f"vs baseline {before['artifacts_per_second']} ({(1 - ratio) * 100:.0f}% slower)"
+            )
+
+    return regressions
+
+
+def _parse_list(value: str, choices) -> List[str]:
+    """Comma-separated selection ('all' for every choice)."""
+    if value == 'all':
+        return list(choices)
+
+    items = [item.strip() for item in value.split(',') if item.strip()]
+    unknown = [item for item in items if item not in choices]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"Unknown: {', '.join(unknown)} (choose from {', '.join(choices)})")
+    return items
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Benchmark the conversation generators')
+    parser.add_argument('--scales', default='phase1,phase2,phase3',
+                        type=lambda v: _parse_list(v, SCALES),
+                        help=f"Comma-separated scales or 'all' ({', '.join(SCALES)}; default: the phase scales)")
+    parser.add_argument('--generators', default='all',
+                        type=lambda v: _parse_list(v, GENERATORS),
+                        help=f"Comma-separated generators or 'all' ({', '.join(GENERATORS)})")
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Run each case N times and keep the fastest (default: 1)')
+    parser.add_argument('--time-budget', type=float, default=300,
+                        help='Stop a case after this many seconds and report partial throughput (default: 300)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help=f'Baseline report (default: {DEFAULT_BASELINE})')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed throughput drop vs. baseline before failing (default: 0.2 = 20%%)')
+    parser.add_argument('--save-baseline', action='store_true', help='Store this run as the new baseline')
+    parser.add_argument('--out', default='output/benchmarks', help='Directory for benchmark reports')
+
+    args = parser.parse_args()
+
+    if not args.save_baseline and not os.path.exists(args.baseline):
+        print(f"✗ No baseline at {args.baseline}; record one with --save-baseline")
+        sys.exit(1)
+
+    # Fork keeps the parent's sys.path; each case still gets its own process
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('fork' if 'fork' in methods else 'spawn')
+
+    results = []
+    for scale in args.scales:
+        for generator in args.generators:
+            print(f"Running {generator} @ {scale} ({SCALES[scale]:,} stores, "
+                  f"{artifacts_for(SCALES[scale]):,} artifacts)...", flush=True)
+
+            runs = []
+            for _ in range(max(1, args.repeat)):
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    runs.append(pool.submit(run_case, generator, scale, args.time_budget).result())
+            case = max(runs, key=lambda run: run['artifacts_per_second'] or 0)
+            results.append(case)
+
+            partial = f" (stopped after {case['artifacts']:,}, time budget)" if case['partial'] else ''
+            print(f"  {case['artifacts_per_second']} artifacts/sec, index {case['index_ms_per_artifact']} ms/artifact "
+                  f"({case['index_share'] * 100:.0f}% of run), peak RSS {case['peak_rss_kb'] or 0:,} KB{partial}")
+
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': sys.version.split()[0],
+        'cpu_count': os.cpu_count(),
+        'results': results
+    }
+
+    regressions = []
+    if not args.save_baseline:
+        with open(args.baseline, 'r') as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        report['baseline'] = args.baseline
+        report['regressions'] = regressions
+
+    os.makedirs(args.out, exist_ok=True)
+    report_path = os.path.join(args.out, f"benchmark_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with open(report_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Report: {report_path}")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or '.', exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"✓ Saved baseline: {args.baseline}")
+
+    if regressions:
+        print(f"\n✗ Throughput regressions ({len(regressions)}):")
+        for regression in regressions:
+            print(f"  - {regression}")
+        sys.exit(1)
+
+    if not args.save_baseline:
+        print("✓ No throughput regressions")
+
+
+if __name__ == '__main__':
+    main()
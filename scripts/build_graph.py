@@ -0,0 +1,588 @@
+#!/usr/bin/env python3
+"""
+Incremental Build Graph
+
+Make-like runner for the generation scripts. Each stage declares its command, the
+files it reads and the files it writes; stages whose outputs another stage reads
+become its upstream, so the scripts no longer have to be run in the right order by hand:
+
+    01_Build_Templates ... 06_Vendor_Data  (generate_structured_data.py --only <folder>)
+            |                     |
+    budget_artifacts (folder 08)  conversations (Phase 3 meetings + Teams, folder 07)
+
+- a stage's key is the SHA-256 of its command, the environment that shapes its output
+  (SOURCE_DATE_EPOCH, ARTIFACT_*), the local modules it imports and the content of
+  every input file; a stage reruns only when its key changed or an output it wrote
+  is missing or was modified
+- upstream outputs are hashed after they are rebuilt, so a rebuild that reproduces
+  identical files does not ripple downstream
+- structured data stages are keyed on their folder builder's own code and data
+  rather than the whole generate_structured_data.py, so editing one regional
+  modifier rebuilds 04_Regional_Modifiers and its consumers only
+- independent stages run in parallel (--workers), each as a subprocess with its log
+  under output/.build_graph/logs/
+- file hashes are cached by size and mtime, so an up-to-date check does not re-read
+  the conversation corpus
+
+Layout:
+    output/.build_graph/state.json        stage -> key + output hashes, file hash cache
+    output/.build_graph/logs/<stage>.log  stdout/stderr of the last run
+
+Usage:
+    python build_graph.py                          # bring everything up to date
+    python build_graph.py budget_artifacts         # one target and its upstream stages
+    python build_graph.py --dry-run                # show what is stale
+    python build_graph.py --workers 4 --seed 7 --format compact --compress gzip
+    python build_graph.py --force 04_Regional_Modifiers
+"""
+
+import argparse
+import ast
+import fnmatch
+import glob
+import hashlib
+import inspect
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, List, Optional, Sequence
+
+from artifact_io import resolve_artifact
+
+SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(SCRIPTS_DIR)
+
+DEFAULT_STATE_DIR = 'output/.build_graph'
+STATE_VERSION = 1
+
+# Environment variables that change what the scripts write
+KEY_ENVIRONMENT = ('SOURCE_DATE_EPOCH', 'ARTIFACT_FORMAT', 'ARTIFACT_COMPRESS')
+
+# Never hashed as inputs or outputs
+IGNORED = ('*/__pycache__/*', '*.pyc', '*/.DS_Store')
+
+
+def _hash_file(path: str) -> str:
+    """SHA-256 of a file, read in 1 MB chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _digest(data) -> str:
+    """SHA-256 of canonical JSON."""
+    return hashlib.sha256(json.dumps(data, sort_keys=True, default=_stable_repr).encode('utf-8')).hexdigest()
+
+
+def _stable_repr(value) -> str:
+    """JSON fallback that does not embed memory addresses."""
+    if callable(value) and hasattr(value, '__qualname__'):
+        return f'{getattr(value, "__module__", "")}.{value.__qualname__}'
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    return str(value)
+
+
+# ============================================================================
+# Code dependencies
+# ============================================================================
+
+def module_dependencies(path: str) -> List[str]:
+    """
+    A script plus every sibling module it imports, transitively.
+
+    Args:
+        path: Script path (e.g. scripts/run_phase3_production.py)
+
+    Returns:
+        Sorted paths, in the same directory form as `path`
+    """
+    directory = os.path.dirname(path)
+    found, pending = set(), [path]
+
+    while pending:
+        current = pending.pop()
+        if current in found or not os.path.exists(current):
+            continue
+        found.add(current)
+
+        with open(current, 'r') as f:
+            tree = ast.parse(f.read(), filename=current)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                names = [node.module]
+            else:
+                continue
+            for name in names:
+                candidate = os.path.join(directory, name.split('.')[0] + '.py')
+                if os.path.exists(candidate):
+                    pending.append(candidate)
+
+    return sorted(found)
+
+
+def _code_names(code) -> List[str]:
+    """Global names used by a code object and the lambdas/comprehensions inside it."""
+    names = list(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names.extend(_code_names(const))
+    return names
+
+
+def _referenced(funcs: Sequence[Callable]):
+    """
+    Walk functions and the same-module functions they call.
+
+    Returns:
+        (source + data parts, set of other modules whose functions/classes are used)
+    """
+    parts, modules, seen = [], set(), set()
+    pending = list(funcs)
+
+    while pending:
+        func = pending.pop(0)
+        if func in seen:
+            continue
+        seen.add(func)
+        parts.append(inspect.getsource(func))
+        module_globals = func.__globals__
+
+        for name in sorted(set(_code_names(func.__code__))):
+            if name not in module_globals:
+                continue
+            value = module_globals[name]
+            if inspect.isfunction(value) and value.__module__ == func.__module__:
+                pending.append(value)
+            elif inspect.isfunction(value) or inspect.isclass(value):
+                modules.add(value.__module__)
+            elif not inspect.ismodule(value):
+                parts.append([name, value])
+
+    return parts, modules
+
+
+def code_fingerprint(*funcs: Callable) -> str:
+    """Hash of the functions' source and the module-level data they read."""
+    return _digest(_referenced(funcs)[0])
+
+
+def code_dependencies(*funcs: Callable) -> List[str]:
+    """Module files (with their imports) behind the functions/classes the functions use."""
+    paths = set()
+    for name in _referenced(funcs)[1]:
+        module = sys.modules.get(name)
+        path = getattr(module, '__file__', None)
+        if path and os.path.dirname(os.path.abspath(path)) == SCRIPTS_DIR:
+            paths.update(module_dependencies(os.path.join('scripts', os.path.basename(path))))
+    return sorted(paths)
+
+
+# ============================================================================
+# Stages
+# ============================================================================
+
+class Stage:
+    """One command with declared inputs and outputs."""
+
+    def __init__(self, name: str, command: List[str], inputs: List[str], outputs: List[str],
+                 forward: Sequence[str] = (), fingerprint: Optional[Callable[[], str]] = None):
+        """
+        Args:
+            name: Stage name (target on the command line)
+            command: argv after the Python interpreter, relative to the project root
+            inputs: Files, directories or globs read (artifact paths match .gz/.zst variants)
+            outputs: Files, directories or globs written
+            forward: Build options passed through to the command ('seed', 'output')
+            fingerprint: Extra key material for inputs not captured as files
+        """
+        self.name = name
+        self.command = command
+        self.inputs = inputs
+        self.outputs = outputs
+        self.forward = forward
+        self.fingerprint = fingerprint
+
+    def argv(self, options: Dict) -> List[str]:
+        """Full command line for this run's options."""
+        argv = [sys.executable] + self.command
+        if 'seed' in self.forward and options.get('seed') is not None:
+            argv += ['--seed', str(options['seed'])]
+        if 'output' in self.forward:
+            for flag in ('format', 'compress'):
+                if options.get(flag):
+                    argv += [f'--{flag}', options[flag]]
+        return argv
+
+
+def _within(path: str, pattern: str) -> bool:
+    """Whether a declared path/glob covers another (same file, inside a directory, glob match)."""
+    path, pattern = path.rstrip('/'), pattern.rstrip('/')
+    return (path == pattern or path.startswith(pattern + '/') or pattern.startswith(path + '/')
+            or fnmatch.fnmatch(path, pattern) or fnmatch.fnmatch(pattern, path))
+
+
+def default_stages() -> List[Stage]:
+    """The generation pipeline: structured data folders, budget artifacts, conversations."""
+    import generate_structured_data as structured
+
+    stages = []
+    for folder, spec in structured.BUILDERS.items():
+        build = spec['build']
+        stages.append(Stage(
+            folder,
+            ['scripts/generate_structured_data.py', '--only', folder],
+            inputs=code_dependencies(build, structured.generate, structured.main),
+            outputs=structured.output_paths(folder),
+            forward=('output',),
+            fingerprint=lambda build=build: code_fingerprint(build, structured.generate, structured.main)
+        ))
+
+    stages.append(Stage(
+        'budget_artifacts',
+        ['scripts/generate_budget_artifacts.py'],
+        inputs=module_dependencies('scripts/generate_budget_artifacts.py') + [
+            'output/01_Build_Templates/store_types.json',
+            'output/01_Build_Templates/base_template.json',
+            'output/03_Historical_Projects/historical_projects.csv',
+            'output/04_Regional_Modifiers/regional_modifiers.json',
+            'output/05_Cost_Models/cost_models.json',
+            'output/06_Vendor_Data/vendor_catalog.json',
+        ],
+        outputs=[f'output/08_Budget_Artifacts/{sub}'
+                 for sub in ('budget_plans', 'templates', 'strategy_worksheets', 'agent_tools')]
+    ))
+
+    stages.append(Stage(
+        'conversations',
+        ['scripts/run_phase3_production.py'],
+        inputs=module_dependencies('scripts/run_phase3_production.py') + [
+            'config',
+            'templates',
+            'output/03_Historical_Projects/historical_projects.json',
+            'output/03_Historical_Projects/historical_projects.jsonl',
+            'output/04_Regional_Modifiers/regional_modifiers.csv',
+            'output/04_Regional_Modifiers/regional_modifiers.json',
+            'output/06_Vendor_Data/vendor_catalog.json',
+            'output/06_Vendor_Data/vendor_pricing.csv',
+        ],
+        outputs=[f'output/07_Conversations/{sub}' for sub in ('meeting_transcripts', 'teams_channels', 'metadata')],
+        forward=('seed', 'output')
+    ))
+
+    return stages
+
+
+# ============================================================================
+# Graph
+# ============================================================================
+
+class BuildGraph:
+    """Stages ordered by their declared inputs/outputs, rebuilt when their key changes."""
+
+    def __init__(self, stages: List[Stage], state_dir: str = DEFAULT_STATE_DIR):
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Duplicate stage names")
+
+        self.upstream = {
+            stage.name: sorted(
+                other.name for other in stages
+                if other is not stage and any(_within(i, o) for i in stage.inputs for o in other.outputs)
+            )
+            for stage in stages
+        }
+        self.order = self._topological_order()
+
+        self.state_dir = state_dir
+        self.state_path = os.path.join(state_dir, 'state.json')
+        self.state = self._load_state()
+        self.hash_cache = self.state['files']
+        self.stats = {'built': 0, 'skipped': 0, 'failed': 0, 'hashed': 0}
+
+    def _topological_order(self) -> List[str]:
+        """Stage names, upstream first (declaration order among peers)."""
+        order, visiting, done = [], set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through stage {name}")
+            visiting.add(name)
+            for upstream in self.upstream[name]:
+                visit(upstream)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    def _load_state(self) -> Dict:
+        """Load state, starting fresh if missing or from another version."""
+        if os.path.exists(self.state_path):
+            with open(self.state_path, 'r') as f:
+                state = json.load(f)
+            if state.get('version') == STATE_VERSION:
+                return state
+        return {'version': STATE_VERSION, 'stages': {}, 'files': {}}
+
+    def save(self):
+        """Write state atomically."""
+        os.makedirs(self.state_dir, exist_ok=True)
+        tmp_path = self.state_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
+
+    # ------------------------------------------------------------------
+    # Hashing
+    # ------------------------------------------------------------------
+
+    def _expand(self, declared: str) -> List[str]:
+        """Files behind a declared path: artifact variant, directory tree or glob."""
+        if any(ch in declared for ch in '*?['):
+            paths = glob.glob(declared, recursive=True)
+        elif os.path.isdir(declared):
+            paths = [os.path.join(dirpath, filename)
+                     for dirpath, _, filenames in os.walk(declared) for filename in filenames]
+        else:
+            actual = resolve_artifact(declared)
+            paths = [actual] if actual else []
+
+        return sorted(path.replace(os.sep, '/') for path in paths
+                      if os.path.isfile(path) and not any(fnmatch.fnmatch(path, p) for p in IGNORED))
+
+    def file_hash(self, path: str) -> str:
+        """Content hash, reused while size and mtime are unchanged."""
+        st = os.stat(path)
+        cached = self.hash_cache.get(path)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns:
+            return cached[2]
+
+        digest = _hash_file(path)
+        self.hash_cache[path] = [st.st_size, st.st_mtime_ns, digest]
+        self.stats['hashed'] += 1
+        return digest
+
+    def hash_paths(self, declared: List[str]) -> Dict[str, str]:
+        """path -> hash for every file behind the declared paths (missing ones -> None)."""
+        hashes = {}
+        for entry in declared:
+            files = self._expand(entry)
+            if not files:
+                hashes[entry] = None
+            for path in files:
+                hashes[path] = self.file_hash(path)
+        return hashes
+
+    def stage_key(self, stage: Stage, options: Dict) -> str:
+        """Hash of everything that determines the stage's outputs."""
+        return _digest({
+            'argv': stage.argv(options)[1:],
+            'environment': {name: os.environ.get(name) for name in KEY_ENVIRONMENT},
+            'fingerprint': stage.fingerprint() if stage.fingerprint else None,
+            'inputs': self.hash_paths(stage.inputs)
+        })
+
+    def is_current(self, stage: Stage, key: str) -> bool:
+        """Same key as the last successful run and every recorded output untouched."""
+        previous = self.state['stages'].get(stage.name)
+        if not previous or previous['key'] != key:
+            return False
+        return all(os.path.exists(path) and self.file_hash(path) == digest
+                   for path, digest in previous['outputs'].items())
+
+    # ------------------------------------------------------------------
+    # Running
+    # ------------------------------------------------------------------
+
+    def select(self, targets: Optional[Sequence[str]] = None) -> List[str]:
+        """Targets plus everything upstream of them, in build order."""
+        if not targets:
+            return list(self.order)
+
+        unknown = [name for name in targets if name not in self.stages]
+        if unknown:
+            raise ValueError(f"Unknown stage(s): {', '.join(unknown)} (choose from {', '.join(self.order)})")
+
+        needed, pending = set(), list(targets)
+        while pending:
+            name = pending.pop()
+            if name not in needed:
+                needed.add(name)
+                pending.extend(self.upstream[name])
+        return [name for name in self.order if name in needed]
+
+    def plan(self, targets: Optional[Sequence[str]] = None, options: Optional[Dict] = None,
+             force: Sequence[str] = ()) -> Dict[str, str]:
+        """
+        Status per stage against the files on disk, without running anything.
+
+        Returns:
+            stage -> 'current', 'stale' or 'stale upstream' (rerun only if upstream outputs change)
+        """
+        options = options or {}
+        status = {}
+        for name in self.select(targets):
+            stage = self.stages[name]
+            if name in force or not self.is_current(stage, self.stage_key(stage, options)):
+                status[name] = 'stale'
+            elif any(status[upstream] != 'current' for upstream in self.upstream[name]):
+                status[name] = 'stale upstream'
+            else:
+                status[name] = 'current'
+        return status
+
+    def run(self, targets: Optional[Sequence[str]] = None, options: Optional[Dict] = None,
+            workers: int = 1, force: Sequence[str] = ()) -> Dict[str, str]:
+        """
+        Bring the selected stages up to date, running independent ones in parallel.
+
+        Args:
+            targets: Stage names (default: all)
+            options: Forwarded build options (seed, format, compress)
+            workers: Maximum stages running at once
+            force: Stages to rebuild even if current
+
+        Returns:
+            stage -> 'built', 'current', 'failed' or 'blocked'
+        """
+        options = options or {}
+        selected = self.select(targets)
+        result = {}
+        running = {}
+
+        os.makedirs(os.path.join(self.state_dir, 'logs'), exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            while len(result) < len(selected):
+                for name in selected:
+                    if name in result or name in (entry[0] for entry in running.values()):
+                        continue
+                    upstream = [result.get(u) for u in self.upstream[name] if u in selected]
+                    if any(status in ('failed', 'blocked') for status in upstream):
+                        result[name] = 'blocked'
+                        print(f"  ⚠ {name}: skipped, upstream failed")
+                        continue
+                    if None in upstream or len(running) >= max(1, workers):
+                        continue
+
+                    stage = self.stages[name]
+                    key = self.stage_key(stage, options)
+                    if name not in force and self.is_current(stage, key):
+                        result[name] = 'current'
+                        self.stats['skipped'] += 1
+                        print(f"  ✓ {name}: up to date")
+                        continue
+
+                    print(f"  → {name}: building")
+                    running[pool.submit(self._execute, stage, options)] = (name, key)
+
+                if not running:
+                    continue
+
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name, key = running.pop(future)
+                    ok, elapsed = future.result()
+                    result[name] = 'built' if ok else 'failed'
+                    self.stats['built' if ok else 'failed'] += 1
+                    if ok:
+                        self._record(self.stages[name], key)
+                        print(f"  ✓ {name}: built in {elapsed:.1f}s")
+                    else:
+                        self.state['stages'].pop(name, None)
+                        log_path = self._log_path(name)
+                        print(f"  ⚠ {name}: failed after {elapsed:.1f}s (see {log_path})")
+                        with open(log_path, 'r') as f:
+                            for line in f.readlines()[-10:]:
+                                print(f"      {line.rstrip()}")
+
+        self.save()
+        return result
+
+    def _log_path(self, name: str) -> str:
+        """Log file for a stage."""
+        return os.path.join(self.state_dir, 'logs', f"{name}.log")
+
+    def _execute(self, stage: Stage, options: Dict):
+        """Run one stage's command (worker thread); returns (succeeded, seconds)."""
+        started = time.perf_counter()
+        with open(self._log_path(stage.name), 'w') as log:
+            returncode = subprocess.call(stage.argv(options), stdout=log, stderr=subprocess.STDOUT)
+        return returncode == 0, time.perf_counter() - started
+
+    def _record(self, stage: Stage, key: str):
+        """Remember a successful build: its key and the hashes of what it wrote."""
+        outputs = {path: digest for path, digest in self.hash_paths(stage.outputs).items() if digest is not None}
+        self.state['stages'][stage.name] = {'key': key, 'outputs': outputs}
+
+    def summary(self) -> str:
+        """One-line summary of the last run."""
+        return (f"{self.stats['built']} built, {self.stats['skipped']} up to date, "
+                f"{self.stats['failed']} failed, {self.stats['hashed']} files hashed")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Rebuild generated data whose inputs changed')
+    parser.add_argument('targets', nargs='*', help='Stages to bring up to date (default: all)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Stages run at once (default: CPU count)')
+    parser.add_argument('--dry-run', action='store_true', help='Show stage status without building')
+    parser.add_argument('--force', nargs='*', metavar='STAGE',
+                        help='Rebuild these stages (all selected stages if none given) even if current')
+    parser.add_argument('--list', action='store_true', help='List stages with their upstream stages')
+    parser.add_argument('--state-dir', default=DEFAULT_STATE_DIR,
+                        help=f'Build state and logs (default: {DEFAULT_STATE_DIR})')
+    parser.add_argument('--seed', type=int, default=None, help='Root random seed passed to the conversation stage')
+    parser.add_argument('--format', choices=('pretty', 'compact'), default=None,
+                        help='JSON artifact layout passed to the stages')
+    parser.add_argument('--compress', choices=('none', 'gzip', 'zstd'), default=None,
+                        help='Artifact compression passed to the stages')
+
+    args = parser.parse_args()
+
+    # Stage paths are relative to the project root, wherever this is run from
+    os.chdir(PROJECT_ROOT)
+    graph = BuildGraph(default_stages(), args.state_dir)
+    try:
+        selected = graph.select(args.targets)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.list:
+        for name in graph.order:
+            upstream = ', '.join(graph.upstream[name]) or '-'
+            print(f"{name:<24} <- {upstream}")
+        return
+
+    options = {'seed': args.seed, 'format': args.format, 'compress': args.compress}
+    force = selected if args.force == [] else (args.force or [])
+
+    if args.dry_run:
+        for name, status in graph.plan(args.targets, options, force).items():
+            print(f"  {'✓' if status == 'current' else '⚠'} {name}: {status}")
+        graph.save()
+        return
+
+    print(f"Building {len(selected)} stage(s) with up to {args.workers} worker(s)...")
+    result = graph.run(args.targets, options, workers=args.workers, force=force)
+    print(f"\n✓ {graph.summary()}")
+
+    if any(status in ('failed', 'blocked') for status in result.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Conversation Index
+
+Shared writer for 07_Conversations/metadata/conversation_index.csv. Meeting transcripts
+and Teams threads add rows keyed by filename (a transcript file name, or
+<channel>.json#<thread_id> for a thread):
+
+- rows for a filename are replaced, not appended, so regenerating an artifact leaves
+  exactly one set of rows for it and reruns do not grow the index
+- new filenames are appended after the existing rows, in the order given
+
+Usage:
+    update_conversation_index('output/07_Conversations', [
+        {'store_id': 'Store-217', 'conversation_type': 'meeting', 'filename': '...', ...}
+    ])
+"""
+
+import os
+
+import pandas as pd
+
+INDEX_FILE = 'metadata/conversation_index.csv'
+
+
+def index_path(output_dir: str) -> str:
+    """Path of the conversation index under a 07_Conversations directory."""
+    return os.path.join(output_dir, INDEX_FILE)
+
+
+def update_conversation_index(output_dir: str, entries) -> int:
+    """
+    Write index rows, replacing any existing rows for the same filenames.
+
+    Args:
+        output_dir: 07_Conversations directory
+        entries: Index rows (list of dicts or a DataFrame)
+
+    Returns:
+        Number of rows written
+    """
+    new_rows = entries if isinstance(entries, pd.DataFrame) else pd.DataFrame(entries)
+    if not len(new_rows):
+        return 0
+
+    path = index_path(output_dir)
+    if os.path.exists(path):
+        df = pd.read_csv(path)
+        df = df[~df['filename'].isin(set(new_rows['filename']))]
+        df = pd.concat([df, new_rows], ignore_index=True)
+    else:
+        df = new_rows
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    df.to_csv(path, index=False)
+    return len(new_rows)
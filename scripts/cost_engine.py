@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Parametric Cost Engine
+
+Derives line-item cost models for every store type and size from one set of item
+definitions, instead of the single hand-written suburban_standard_3500sqft model:
+
+- quantities follow a driver per item: floor area (sqft), wall area (2 x sqft),
+  a count per sqft (fixtures, outlets, cameras, ...) or a fixed count (panel, POS, ...)
+- unit costs are the suburban baseline scaled per store type and category
+  (premium finishes for flagships, reuse of existing infrastructure for remodels, ...)
+- the whole store type x square footage grid is evaluated in one broadcast:
+  totals[type, size, item] = quantity[size, item] * unit_cost[type, item]
+
+Item definitions are calibrated on the suburban 3500 sqft model, so that model's line
+items come out unchanged; category totals are the sum of their line items.
+
+Usage:
+    grid = evaluate(STORE_TYPES, SQFT_GRID)
+    models = cost_models(grid)        # {'urban_flagship_5000sqft': {...}, ...}
+    rows = line_item_rows(grid)        # flat records for CSV/Parquet
+
+    python cost_engine.py --store-type urban_flagship --sqft 5000
+"""
+
+import argparse
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+CATEGORIES = ['construction', 'electrical', 'hvac', 'plumbing', 'fixtures', 'technology', 'soft_costs']
+
+# Calibration size: per-sqft counts are derived from the 3500 sqft model
+REFERENCE_SQFT = 3500
+
+# (category, item, unit, driver, reference quantity, suburban unit cost)
+# driver: sqft = floor area, wall = 2 x floor area, per_sqft = count scaling with area, fixed = same count
+LINE_ITEMS = [
+    ("construction", "Demolition", "sqft", "sqft", 3500, 5.50),
+    ("construction", "Framing", "sqft", "sqft", 3500, 12.00),
+    ("construction", "Drywall", "sqft", "wall", 7000, 8.50),
+    ("construction", "Flooring (LVT)", "sqft", "sqft", 3500, 18.00),
+    ("construction", "Ceiling", "sqft", "sqft", 3500, 7.50),
+    ("construction", "Paint", "sqft", "wall", 7000, 2.25),
+    ("electrical", "400A electrical panel", "each", "fixed", 1, 8500),
+    ("electrical", "LED lighting fixtures", "each", "per_sqft", 65, 412),
+    ("electrical", "Outlets and switches", "each", "per_sqft", 85, 125),
+    ("electrical", "Emergency lighting", "each", "per_sqft", 12, 385),
+    ("electrical", "Electrical rough-in", "sqft", "sqft", 3500, 7.50),
+    ("hvac", "Commercial HVAC unit (VRF)", "each", "fixed", 1, 16500),
+    ("hvac", "Ductwork", "sqft", "sqft", 3500, 8.50),
+    ("hvac", "HVAC controls", "system", "fixed", 1, 3250),
+    ("hvac", "Installation labor", "system", "fixed", 1, 2300),
+    ("plumbing", "Bathroom fixtures", "set", "fixed", 2, 2850),
+    ("plumbing", "Water heater", "each", "fixed", 1, 1250),
+    ("plumbing", "Water lines", "lf", "per_sqft", 280, 22),
+    ("plumbing", "Drainage", "lf", "per_sqft", 280, 28),
+    ("plumbing", "Plumbing labor", "sqft", "sqft", 3500, 3.25),
+    ("fixtures", "Wall display fixtures", "lf", "per_sqft", 320, 185),
+    ("fixtures", "Floor fixtures", "each", "per_sqft", 45, 725),
+    ("fixtures", "Mannequins", "each", "per_sqft", 18, 385),
+    ("fixtures", "Signage package", "package", "fixed", 1, 12500),
+    ("fixtures", "Checkout counter", "lf", "per_sqft", 24, 425),
+    ("fixtures", "Dressing rooms", "each", "per_sqft", 8, 1850),
+    ("fixtures", "Mirrors and accessories", "package", "fixed", 1, 8500),
+    ("technology", "POS system (3 terminals)", "system", "fixed", 1, 12500),
+    ("technology", "Security cameras", "each", "per_sqft", 16, 875),
+    ("technology", "WiFi infrastructure", "system", "fixed", 1, 4250),
+    ("technology", "Digital displays", "each", "per_sqft", 4, 2150),
+    ("technology", "Sound system", "system", "fixed", 1, 3850),
+    ("technology", "Technology wiring", "sqft", "sqft", 3500, 2.50),
+    ("soft_costs", "Architectural design", "project", "fixed", 1, 15000),
+    ("soft_costs", "Engineering", "project", "fixed", 1, 8500),
+    ("soft_costs", "Permits and fees", "project", "fixed", 1, 6250),
+    ("soft_costs", "Project management", "project", "fixed", 1, 8500),
+    ("soft_costs", "Contingency (10%)", "percent", "fixed", 1, 7075)
+]
+
+# Unit cost multipliers relative to suburban_standard, per category. Weighted by the
+# suburban category mix they roughly match the historical cost/sqft ratios (285, 145, 95, 325 vs 185).
+STORE_TYPE_FACTORS = {
+    "suburban_standard": {
+        "construction": 1.00, "electrical": 1.00, "hvac": 1.00, "plumbing": 1.00,
+        "fixtures": 1.00, "technology": 1.00, "soft_costs": 1.00
+    },
+    "urban_flagship": {  # Premium finishes, urban labor
+        "construction": 1.45, "electrical": 1.55, "hvac": 1.40, "plumbing": 1.35,
+        "fixtures": 1.70, "technology": 1.80, "soft_costs": 1.50
+    },
+    "express_compact": {  # Essential fixtures, minimal technology
+        "construction": 0.80, "electrical": 0.80, "hvac": 0.85, "plumbing": 0.85,
+        "fixtures": 0.70, "technology": 0.65, "soft_costs": 0.90
+    },
+    "remodel_refresh": {  # Existing infrastructure reused
+        "construction": 0.45, "electrical": 0.55, "hvac": 0.40, "plumbing": 0.35,
+        "fixtures": 0.60, "technology": 0.55, "soft_costs": 0.60
+    },
+    "prototype_innovation": {  # Custom everything
+        "construction": 1.55, "electrical": 1.75, "hvac": 1.60, "plumbing": 1.50,
+        "fixtures": 2.00, "technology": 2.40, "soft_costs": 1.90
+    }
+}
+
+STORE_TYPES = list(STORE_TYPE_FACTORS)
+
+# Sizes covering every store type's sqft_range (01_Build_Templates/store_types.json)
+SQFT_GRID = list(range(1500, 6001, 500))
+
+
+def quantities(sqfts: Sequence[int]) -> np.ndarray:
+    """(sizes, items) quantity matrix."""
+    sqft = np.asarray(sqfts, dtype=np.float64)[:, None]
+    reference = np.array([item[4] for item in LINE_ITEMS], dtype=np.float64)[None, :]
+    drivers = np.array([item[3] for item in LINE_ITEMS])[None, :]
+
+    scaled = np.rint(reference * sqft / REFERENCE_SQFT)
+    return np.select(
+        [drivers == 'sqft', drivers == 'wall', drivers == 'per_sqft'],
+        [np.broadcast_to(sqft, scaled.shape), 2 * sqft, np.maximum(scaled, 1)],
+        default=np.broadcast_to(reference, scaled.shape)
+    )
+
+
+def unit_costs(store_types: Sequence[str]) -> np.ndarray:
+    """(types, items) unit cost matrix."""
+    base = np.array([item[5] for item in LINE_ITEMS], dtype=np.float64)
+    category_index = np.array([CATEGORIES.index(item[0]) for item in LINE_ITEMS])
+    factors = np.array([[STORE_TYPE_FACTORS[t][c] for c in CATEGORIES] for t in store_types])
+    return np.round(base[None, :] * factors[:, category_index], 2)
+
+
+def evaluate(store_types: Sequence[str], sqfts: Sequence[int]) -> Dict:
+    """
+    Evaluate every store type x size in one pass.
+
+    Returns:
+        Dict with store_types, sqfts, quantity (S, I), unit_cost (T, I),
+        total (T, S, I) and category_total (T, S, C)
+    """
+    quantity = quantities(sqfts)
+    unit_cost = unit_costs(store_types)
+    total = np.rint(quantity[None, :, :] * unit_cost[:, None, :]).astype(np.int64)
+
+    category_index = np.array([CATEGORIES.index(item[0]) for item in LINE_ITEMS])
+    category_total = np.zeros(total.shape[:2] + (len(CATEGORIES),), dtype=np.int64)
+    np.add.at(category_total, (slice(None), slice(None), category_index), total)
+
+    return {
+        'store_types': list(store_types),
+        'sqfts': list(sqfts),
+        'quantity': quantity,
+        'unit_cost': unit_cost,
+        'total': total,
+        'category_total': category_total
+    }
+
+
+def model_key(store_type: str, sqft: int) -> str:
+    """Cost model name, e.g. suburban_standard_3500sqft."""
+    return f"{store_type}_{sqft}sqft"
+
+
+def cost_models(grid: Dict) -> Dict[str, Dict]:
+    """Cost models in the 05_Cost_Models base_costs layout, keyed by model_key."""
+    models = {}
+
+    for t, store_type in enumerate(grid['store_types']):
+        for s, sqft in enumerate(grid['sqfts']):
+            grand_total = int(grid['category_total'][t, s].sum())
+            breakdown = {}
+
+            for c, category in enumerate(CATEGORIES):
+                category_total = int(grid['category_total'][t, s, c])
+                breakdown[category] = {
+                    "total": category_total,
+                    "per_sqft": round(category_total / sqft, 2),
+                    "line_items": [
+                        {
+                            "item": item[1],
+                            "unit": item[2],
+                            "quantity": int(grid['quantity'][s, i]),
+                            "unit_cost": float(grid['unit_cost'][t, i]),
+                            "total": int(grid['total'][t, s, i])
+                        }
+                        for i, item in enumerate(LINE_ITEMS) if item[0] == category
+                    ]
+                }
+
+            models[model_key(store_type, sqft)] = {
+                "store_type": store_type,
+                "square_footage": sqft,
+                "total_base_cost": grand_total,
+                "cost_per_sqft": round(grand_total / sqft, 2),
+                "breakdown": breakdown
+            }
+
+    return models
+
+
+def line_item_rows(grid: Dict) -> List[Dict]:
+    """One flat row per store type x size x line item."""
+    rows = []
+    for t, store_type in enumerate(grid['store_types']):
+        for s, sqft in enumerate(grid['sqfts']):
+            for i, (category, item, unit, _, _, _) in enumerate(LINE_ITEMS):
+                rows.append({
+                    'model': model_key(store_type, sqft),
+                    'store_type': store_type,
+                    'square_footage': sqft,
+                    'category': category,
+                    'item': item,
+                    'unit': unit,
+                    'quantity': int(grid['quantity'][s, i]),
+                    'unit_cost': float(grid['unit_cost'][t, i]),
+                    'total': int(grid['total'][t, s, i])
+                })
+    return rows
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Evaluate parametric cost models')
+    parser.add_argument('--store-type', choices=STORE_TYPES, default='suburban_standard')
+    parser.add_argument('--sqft', type=int, default=REFERENCE_SQFT)
+
+    args = parser.parse_args()
+
+    model = cost_models(evaluate([args.store_type], [args.sqft]))[model_key(args.store_type, args.sqft)]
+    print(f"{model_key(args.store_type, args.sqft)}: ${model['total_base_cost']:,} "
+          f"(${model['cost_per_sqft']}/sqft)")
+    for category, data in model['breakdown'].items():
+        print(f"  {category:<12} ${data['total']:>10,}  ${data['per_sqft']:>7.2f}/sqft")
+
+
+if __name__ == '__main__':
+    main()
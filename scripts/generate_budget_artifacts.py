@@ -7,91 +7,236 @@ Creates Excel-based budget planning tools based on structured data (folders 01-0
 2. Reusable configuration templates
 3. Build strategy worksheets
 4. Agent integration tools
+
+Source data is loaded once and handed to a process pool; every workbook is an
+independent job, so a full refresh takes about as long as the slowest workbook.
+Each file is written to a temporary name and renamed into place, so readers never
+see a half-written workbook. The summary lists per-workbook build times.
+
+Usage:
+    python generate_budget_artifacts.py               # one worker per CPU
+    python generate_budget_artifacts.py --workers 1   # serial, in-process
 """
 
+import argparse
 import os
-import json
 import csv
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
 import pandas as pd
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils.dataframe import dataframe_to_rows
-from datetime import datetime
-
-# Create output directory
-output_dir = 'output/08_Budget_Artifacts'
-os.makedirs(f'{output_dir}/budget_plans', exist_ok=True)
-os.makedirs(f'{output_dir}/templates', exist_ok=True)
-os.makedirs(f'{output_dir}/strategy_worksheets', exist_ok=True)
-os.makedirs(f'{output_dir}/agent_tools', exist_ok=True)
+from openpyxl.writer.excel import ExcelWriter
+from artifact_io import artifact_exists, load_json
+from cost_engine import SQFT_GRID, STORE_TYPES, cost_models as parametric_cost_models, evaluate
+from historical_projects import read_projects
+from project_aggregates import aggregate_projects
+from run_context import get_clock, set_clock
+from workbook_builder import StyleRegistry, WorkbookBuilder
 
-# Load source data
-print("Loading source data...")
-with open('output/01_Build_Templates/store_types.json') as f:
-    store_types_data = json.load(f)
+# Run clock: honours SOURCE_DATE_EPOCH for byte-identical workbooks
+clock = get_clock()
 
-with open('output/01_Build_Templates/base_template.json') as f:
-    base_template = json.load(f)
-
-with open('output/03_Historical_Projects/historical_projects.json') as f:
-    historical_projects = json.load(f)
-
-with open('output/04_Regional_Modifiers/regional_modifiers.json') as f:
-    regional_modifiers = json.load(f)
+output_dir = 'output/08_Budget_Artifacts'
 
-with open('output/05_Cost_Models/cost_model_suburban_standard.json') as f:
-    cost_model = json.load(f)
+# Output subdirectory -> (progress heading, summary label)
+SECTIONS = {
+    'budget_plans': ('Generating store-type budget plans', 'store-type budget plans'),
+    'templates': ('Generating configuration templates', 'reusable configuration templates'),
+    'strategy_worksheets': ('Generating build strategy worksheets', 'build strategy worksheets'),
+    'agent_tools': ('Generating agent integration tools', 'agent integration tools'),
+}
+
+# Source data, set once per process by use_inputs()
+store_types_data = None
+base_template = None
+regional_modifiers = None
+cost_models = None
+vendor_data = None
+historical_averages = {}
+
+def calculate_historical_averages(projects):
+    """Averages, P10/median/P90 bands and sample counts for every store type in one group-by."""
+    categories = ['construction', 'electrical', 'hvac', 'plumbing', 'fixtures', 'technology', 'soft_costs']
+    stats = aggregate_projects(projects, ['store_type'], decimals=None)
+
+    averages = {}
+    for row in stats.to_dict('records'):
+        averages[row['store_type']] = {
+            'count': int(row['count']),
+            'total_cost': int(row['total_cost_mean']),
+            'cost_per_sqft': round(row['cost_per_sqft_mean'], 2),
+            'categories': {cat: int(row[f'{cat}_mean']) for cat in categories},
+            'bands': {
+                metric: {stat: row[f'{metric}_{stat}'] for stat in ('p10', 'median', 'p90')}
+                for metric in ['total_cost', 'cost_per_sqft'] + categories
+            }
+        }
+    return averages
 
-with open('output/06_Vendor_Data/vendor_catalog.json') as f:
-    vendor_data = json.load(f)
+def calculate_historical_average(store_type):
+    """Average costs from historical projects (None if the store type has none)."""
+    return historical_averages.get(store_type)
+
+def load_cost_models(data_dir='output'):
+    """
+    Parametric cost models from 05_Cost_Models/cost_models.json.
+
+    The grid is not committed with the repository, so when it has not been generated
+    the same models are evaluated in-process by cost_engine.
+    """
+    path = f'{data_dir}/05_Cost_Models/cost_models.json'
+    if artifact_exists(path):
+        return load_json(path)
+    return {'base_costs': parametric_cost_models(evaluate(STORE_TYPES, SQFT_GRID))}
+
+def load_inputs(data_dir='output'):
+    """
+    Load source data (plain or compressed, whatever output profile wrote it).
+
+    Returns:
+        Dict for use_inputs(); the project table is reduced to per-store-type averages
+        so the dict stays small enough to hand to every worker
+    """
+    # Columnar project table, streamed in chunks (scales to millions of projects)
+    projects = pd.concat(read_projects(f'{data_dir}/03_Historical_Projects/historical_projects.csv'),
+                         ignore_index=True)
 
-# Styling helpers
-def create_header_style():
-    """Create header cell style."""
     return {
+        'store_types_data': load_json(f'{data_dir}/01_Build_Templates/store_types.json'),
+        'base_template': load_json(f'{data_dir}/01_Build_Templates/base_template.json'),
+        'regional_modifiers': load_json(f'{data_dir}/04_Regional_Modifiers/regional_modifiers.json'),
+        # Parametric line-item models for every store type and size (cost_engine)
+        'cost_models': load_cost_models(data_dir),
+        'vendor_data': load_json(f'{data_dir}/06_Vendor_Data/vendor_catalog.json'),
+        'historical_averages': calculate_historical_averages(projects)
+    }
+
+def use_inputs(inputs):
+    """Make loaded source data visible to the workbook builders in this process."""
+    global store_types_data, base_template, regional_modifiers, cost_models, vendor_data, historical_averages
+    store_types_data = inputs['store_types_data']
+    base_template = inputs['base_template']
+    regional_modifiers = inputs['regional_modifiers']
+    cost_models = inputs['cost_models']
+    vendor_data = inputs['vendor_data']
+    historical_averages = inputs['historical_averages']
+
+# Cell styles, built once and registered per workbook as NamedStyles (see StyleRegistry)
+THIN = Side(style='thin')
+
+CELL_STYLES = {
+    # Section and column headers
+    'header': {
         'font': Font(bold=True, color='FFFFFF', size=12),
         'fill': PatternFill(start_color='366092', end_color='366092', fill_type='solid'),
         'alignment': Alignment(horizontal='center', vertical='center', wrap_text=True),
-        'border': Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
-    }
-
-def create_input_style():
-    """Create input cell style (blue)."""
-    return {
+        'border': Border(left=THIN, right=THIN, top=THIN, bottom=THIN)
+    },
+    # Input cells (blue)
+    'input': {
         'fill': PatternFill(start_color='D6DCE4', end_color='D6DCE4', fill_type='solid'),
         'font': Font(bold=True),
         'alignment': Alignment(horizontal='left', vertical='center')
-    }
-
-def create_output_style():
-    """Create output cell style (green)."""
-    return {
+    },
+    # Output cells (green)
+    'output': {
         'fill': PatternFill(start_color='C6E0B4', end_color='C6E0B4', fill_type='solid'),
         'font': Font(bold=True),
         'alignment': Alignment(horizontal='right', vertical='center')
-    }
-
-def create_formula_style():
-    """Create formula cell style (gray)."""
-    return {
+    },
+    # Formula cells (gray)
+    'formula': {
         'fill': PatternFill(start_color='F2F2F2', end_color='F2F2F2', fill_type='solid'),
         'alignment': Alignment(horizontal='right', vertical='center')
-    }
-
-def apply_style(cell, style_dict):
-    """Apply style dictionary to cell."""
-    for key, value in style_dict.items():
-        setattr(cell, key, value)
+    },
+    'title': {'font': Font(bold=True, size=16)},
+    'heading': {'font': Font(bold=True, size=14)},
+    'subheading': {'font': Font(bold=True, size=12)},
+    'category': {
+        'font': Font(bold=True, size=11),
+        'fill': PatternFill(start_color='E7E6E6', end_color='E7E6E6', fill_type='solid')
+    },
+    'band': {
+        'font': Font(bold=True, size=12, color='FFFFFF'),
+        'fill': PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    },
+    'highlight': {
+        'font': Font(bold=True, size=12, color='FFFFFF'),
+        'fill': PatternFill(start_color='00B050', end_color='00B050', fill_type='solid')
+    },
+    'bold': {'font': Font(bold=True)},
+    'italic': {'font': Font(italic=True)},
+    'small': {'font': Font(size=9)},
+    'note': {'font': Font(italic=True, size=9)},
+    'hint': {'font': Font(italic=True, color='0066CC')},
+    'link': {'font': Font(bold=True, color='0066CC')},
+    'code': {'font': Font(name='Courier New', size=9)},
+    'expression': {'font': Font(name='Courier New')},
+    'green': {'font': Font(color='00B050')},
+    'red': {'font': Font(color='C00000')},
+    'green_bold': {'font': Font(bold=True, color='00B050')},
+    'red_bold': {'font': Font(bold=True, color='C00000')},
+    'centered': {'alignment': Alignment(horizontal='center')},
+    'currency': {'number_format': '$#,##0'},
+    'currency_cents': {'number_format': '$#,##0.00'},
+    'percent': {'number_format': '0.0%'},
+    'variance': {'number_format': '+0.0%;-0.0%;0%'},
+}
+
+# NamedStyle name prefix in the xlsx files (Excel reserves 'Title', 'Note', 'Output', ...)
+STYLE_PREFIX = 'Budget '
+
+def budget_styles(wb):
+    """Style registry for a regular workbook."""
+    return StyleRegistry(wb, CELL_STYLES, prefix=STYLE_PREFIX)
+
+class FixedTimeZipFile(zipfile.ZipFile):
+    """ZipFile that stamps every member with the run clock instead of the wall clock."""
+
+    def writestr(self, zinfo_or_arcname, data, *args, **kwargs):
+        if not isinstance(zinfo_or_arcname, zipfile.ZipInfo):
+            zinfo = zipfile.ZipInfo(zinfo_or_arcname, date_time=clock.zip_date_time())
+            zinfo.compress_type = self.compression
+            zinfo.external_attr = 0o600 << 16
+            zinfo_or_arcname = zinfo
+        super().writestr(zinfo_or_arcname, data, *args, **kwargs)
+
+    def write(self, filename, arcname=None, *args, **kwargs):
+        with open(filename, 'rb') as f:
+            self.writestr(arcname or os.path.basename(filename), f.read())
+
+def save_workbook(wb, filename):
+    """
+    Save a workbook with document properties and zip timestamps taken from the run clock.
+
+    The file is written under a temporary name and renamed into place (atomic on POSIX).
+    """
+    wb.properties.created = clock.utcnow()
+    wb.properties.modified = clock.utcnow()
+
+    tmp_path = f'{filename}.{os.getpid()}.tmp'
+    try:
+        if clock.deterministic:
+            # openpyxl's save() overwrites 'modified' with the wall clock, so drive the writer directly
+            archive = FixedTimeZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True)
+            ExcelWriter(wb, archive).save()
+        else:
+            wb.save(tmp_path)
+        os.replace(tmp_path, filename)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
 
 # ============================================================================
 # 1. STORE-TYPE BUDGET PLANS
 # ============================================================================
-print("\n[1/4] Generating store-type budget plans...")
+def create_budget_workbook():
+    """Streaming workbook with the budget plan cell styles registered."""
+    return WorkbookBuilder(CELL_STYLES, prefix=STYLE_PREFIX)
 
 def create_budget_plan(store_type):
     """Create complete budget plan for a store type."""
@@ -100,76 +245,41 @@ def create_budget_plan(store_type):
     # Get historical average for this store type
     historical_avg = calculate_historical_average(store_type)
 
-    wb = Workbook()
-    wb.remove(wb.active)  # Remove default sheet
+    # Rows are streamed to disk sheet by sheet (write-only workbook)
+    book = create_budget_workbook()
 
     # Worksheet 1: Executive Summary
-    ws_summary = wb.create_sheet("Executive Summary")
-    create_executive_summary(ws_summary, store_info, historical_avg)
+    create_executive_summary(book, store_info, historical_avg)
 
     # Worksheet 2: Detailed Line Items
-    ws_details = wb.create_sheet("Detailed Line Items")
-    create_detailed_line_items(ws_details, store_info, historical_avg)
+    create_detailed_line_items(book, store_info, historical_avg)
 
     # Worksheet 3: Scenario Comparisons
-    ws_scenarios = wb.create_sheet("Scenario Comparisons")
-    create_scenario_comparisons(ws_scenarios, store_info, historical_avg)
+    create_scenario_comparisons(book, store_info, historical_avg)
 
     # Worksheet 4: Data Sources
-    ws_sources = wb.create_sheet("Data Sources")
-    create_data_sources(ws_sources, store_info)
+    create_data_sources(book, store_info)
 
     # Worksheet 5: Agent Instructions
-    ws_agent = wb.create_sheet("Agent Instructions")
-    create_agent_instructions(ws_agent, store_info)
+    create_agent_instructions(book, store_info)
 
     # Save
     filename = f"{output_dir}/budget_plans/Budget_Plan_{store_type}_{store_info['typical_sqft']}sqft.xlsx"
-    wb.save(filename)
-    print(f"  ✓ Created {filename}")
-
+    book.save(filename, saver=save_workbook)
     return filename
 
-def calculate_historical_average(store_type):
-    """Calculate average costs from historical projects."""
-    projects = [p for p in historical_projects['projects'] if p['store_type'] == store_type]
-
-    if not projects:
-        return None
-
-    avg_total = sum(p['total_cost'] for p in projects) / len(projects)
-    avg_psf = sum(p['cost_per_sqft'] for p in projects) / len(projects)
-
-    categories = {}
-    for cat in ['construction', 'electrical', 'hvac', 'plumbing', 'fixtures', 'technology', 'soft_costs']:
-        avg = sum(p['categories'][cat] for p in projects) / len(projects)
-        categories[cat] = int(avg)
-
-    return {
-        'count': len(projects),
-        'total_cost': int(avg_total),
-        'cost_per_sqft': round(avg_psf, 2),
-        'categories': categories
-    }
-
-def create_executive_summary(ws, store_info, historical_avg):
+def create_executive_summary(book, store_info, historical_avg):
     """Create executive summary worksheet."""
-    # Header
-    ws['A1'] = f"Budget Plan: {store_info['name']}"
-    ws['A1'].font = Font(bold=True, size=16)
-    ws.merge_cells('A1:D1')
+    sheet = book.add_sheet("Executive Summary", widths={'A': 25, 'B': 18, 'C': 15, 'D': 15})
 
-    ws['A2'] = f"Generated: {datetime.now().strftime('%Y-%m-%d')}"
-    ws['A2'].font = Font(italic=True)
-    ws.merge_cells('A2:D2')
+    # Header
+    sheet.append([f"Budget Plan: {store_info['name']}"], style='title', merge='D')
+    sheet.append([f"Generated: {clock.now().strftime('%Y-%m-%d')}"], style='italic', merge='D')
+    sheet.skip()
 
     # Store configuration
-    row = 4
-    ws[f'A{row}'] = "STORE CONFIGURATION"
-    apply_style(ws[f'A{row}'], create_header_style())
-    ws.merge_cells(f'A{row}:D{row}')
+    sheet.append(["STORE CONFIGURATION"], style='header', merge='D')
 
-    row += 1
     config_data = [
         ["Store Type:", store_info['name']],
         ["Typical Square Footage:", f"{store_info['typical_sqft']:,} sqft"],
@@ -179,31 +289,19 @@ def create_executive_summary(ws, store_info, historical_avg):
     ]
 
     for label, value in config_data:
-        ws[f'A{row}'] = label
-        ws[f'A{row}'].font = Font(bold=True)
-        ws[f'B{row}'] = value
-        ws.merge_cells(f'B{row}:D{row}')
-        row += 1
+        row = sheet.append([label, value], styles={'A': 'bold'})
+        sheet.merge(f'B{row}:D{row}')
 
     # Cost summary
-    row += 2
-    ws[f'A{row}'] = "COST SUMMARY"
-    apply_style(ws[f'A{row}'], create_header_style())
-    ws.merge_cells(f'A{row}:D{row}')
+    sheet.skip(2)
+    sheet.append(["COST SUMMARY"], style='header', merge='D')
 
     if historical_avg:
-        row += 1
-        ws[f'A{row}'] = "Category"
-        ws[f'B{row}'] = "Amount"
-        ws[f'C{row}'] = "% of Total"
-        ws[f'D{row}'] = "Cost/SqFt"
-        for col in ['A', 'B', 'C', 'D']:
-            apply_style(ws[f'{col}{row}'], create_header_style())
+        sheet.append(["Category", "Amount", "% of Total", "Cost/SqFt"], style='header')
 
         total = historical_avg['total_cost']
         sqft = store_info['typical_sqft']
 
-        row += 1
         categories_display = [
             ('Construction', historical_avg['categories']['construction']),
             ('Electrical', historical_avg['categories']['electrical']),
@@ -215,104 +313,63 @@ def create_executive_summary(ws, store_info, historical_avg):
         ]
 
         for cat_name, cat_cost in categories_display:
-            ws[f'A{row}'] = cat_name
-            ws[f'B{row}'] = cat_cost
-            ws[f'B{row}'].number_format = '$#,##0'
-            ws[f'C{row}'] = cat_cost / total
-            ws[f'C{row}'].number_format = '0.0%'
-            ws[f'D{row}'] = cat_cost / sqft
-            ws[f'D{row}'].number_format = '$#,##0.00'
-            row += 1
+            sheet.append([cat_name, cat_cost, cat_cost / total, cat_cost / sqft],
+                         styles={'B': 'currency', 'C': 'percent', 'D': 'currency_cents'})
 
         # Total
-        ws[f'A{row}'] = "TOTAL PROJECT COST"
-        ws[f'A{row}'].font = Font(bold=True)
-        ws[f'B{row}'] = total
-        ws[f'B{row}'].number_format = '$#,##0'
-        ws[f'B{row}'].font = Font(bold=True)
-        apply_style(ws[f'B{row}'], create_output_style())
-        ws[f'D{row}'] = historical_avg['cost_per_sqft']
-        ws[f'D{row}'].number_format = '$#,##0.00'
-        ws[f'D{row}'].font = Font(bold=True)
-
-        row += 2
-        ws[f'A{row}'] = f"Based on {historical_avg['count']} historical projects"
-        ws[f'A{row}'].font = Font(italic=True)
-        ws.merge_cells(f'A{row}:D{row}')
-
-    # Set column widths
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 18
-    ws.column_dimensions['C'].width = 15
-    ws.column_dimensions['D'].width = 15
+        sheet.append(["TOTAL PROJECT COST", total, None, historical_avg['cost_per_sqft']],
+                     styles={'A': 'bold', 'B': ('output', 'currency'), 'D': ('bold', 'currency_cents')})
 
-def create_detailed_line_items(ws, store_info, historical_avg):
-    """Create detailed line items worksheet."""
-    # Use suburban_standard cost model as template
-    model = cost_model['base_costs']['suburban_standard_3500sqft']
+        sheet.skip()
+        sheet.append([f"Based on {historical_avg['count']} historical projects"], style='italic', merge='D')
 
-    # Header
-    ws['A1'] = f"Detailed Line Items: {store_info['name']}"
-    ws['A1'].font = Font(bold=True, size=14)
-    ws.merge_cells('A1:G1')
+        band = historical_avg['bands']['total_cost']
+        sheet.append([f"Historical range (P10-P90): ${band['p10']:,.0f} - ${band['p90']:,.0f}, "
+                      f"median ${band['median']:,.0f}"], style='italic', merge='D')
 
-    row = 3
-    headers = ['Category', 'Item', 'Quantity', 'Unit', 'Unit Cost', 'Total', 'Source']
-    for col_idx, header in enumerate(headers, start=1):
-        cell = ws.cell(row=row, column=col_idx, value=header)
-        apply_style(cell, create_header_style())
+def create_detailed_line_items(book, store_info, historical_avg):
+    """Create detailed line items worksheet (one streamed row per cost model line item)."""
+    sheet = book.add_sheet("Detailed Line Items", widths={
+        'A': 18, 'B': 35, 'C': 12, 'D': 10, 'E': 12, 'F': 15, 'G': 30
+    })
 
-    row += 1
+    # Cost model for this store type at its typical size
+    model_name = f"{store_info['type_id']}_{store_info['typical_sqft']}sqft"
+    model = cost_models['base_costs'][model_name]
+    source = f"Cost Model: {model_name}"
+
+    # Header
+    sheet.append([f"Detailed Line Items: {store_info['name']}"], style='heading', merge='G')
+    sheet.skip()
+    sheet.append(['Category', 'Item', 'Quantity', 'Unit', 'Unit Cost', 'Total', 'Source'], style='header')
+
+    line_item_styles = {'E': 'currency_cents', 'F': 'currency', 'G': 'note'}
 
     # Iterate through categories
     for category, cat_data in model['breakdown'].items():
         # Category header
-        ws.cell(row=row, column=1, value=category.upper())
-        ws.cell(row=row, column=1).font = Font(bold=True, size=11)
-        ws.merge_cells(f'A{row}:G{row}')
-        ws.cell(row=row, column=1).fill = PatternFill(start_color='E7E6E6', end_color='E7E6E6', fill_type='solid')
-        row += 1
+        sheet.append([category.upper()], style='category', merge='G')
 
         # Line items
         for item in cat_data['line_items']:
-            ws.cell(row=row, column=1, value='')
-            ws.cell(row=row, column=2, value=item['item'])
-            ws.cell(row=row, column=3, value=item['quantity'])
-            ws.cell(row=row, column=4, value=item['unit'])
-            ws.cell(row=row, column=5, value=item['unit_cost'])
-            ws.cell(row=row, column=5).number_format = '$#,##0.00'
-            ws.cell(row=row, column=6, value=item['total'])
-            ws.cell(row=row, column=6).number_format = '$#,##0'
-            ws.cell(row=row, column=7, value="Cost Model: suburban_standard")
-            ws.cell(row=row, column=7).font = Font(size=9, italic=True)
-            row += 1
+            sheet.append(['', item['item'], item['quantity'], item['unit'], item['unit_cost'], item['total'], source],
+                         styles=line_item_styles)
 
         # Category subtotal
-        ws.cell(row=row, column=2, value=f"{category.title()} Subtotal")
-        ws.cell(row=row, column=2).font = Font(bold=True)
-        ws.cell(row=row, column=6, value=cat_data['total'])
-        ws.cell(row=row, column=6).number_format = '$#,##0'
-        ws.cell(row=row, column=6).font = Font(bold=True)
-        apply_style(ws.cell(row=row, column=6), create_output_style())
-        row += 2
-
-    # Set column widths
-    ws.column_dimensions['A'].width = 18
-    ws.column_dimensions['B'].width = 35
-    ws.column_dimensions['C'].width = 12
-    ws.column_dimensions['D'].width = 10
-    ws.column_dimensions['E'].width = 12
-    ws.column_dimensions['F'].width = 15
-    ws.column_dimensions['G'].width = 30
-
-def create_scenario_comparisons(ws, store_info, historical_avg):
+        sheet.append([None, f"{category.title()} Subtotal", None, None, None, cat_data['total']],
+                     styles={'B': 'bold', 'F': ('output', 'currency')})
+        sheet.skip()
+
+def create_scenario_comparisons(book, store_info, historical_avg):
     """Create scenario comparison worksheet."""
-    ws['A1'] = "Budget Scenarios Comparison"
-    ws['A1'].font = Font(bold=True, size=14)
-    ws.merge_cells('A1:E1')
+    widths = {'A': 22, 'B': 35, 'C': 15, 'D': 12, 'E': 40} if historical_avg else None
+    sheet = book.add_sheet("Scenario Comparisons", widths=widths)
+
+    sheet.append(["Budget Scenarios Comparison"], style='heading', merge='E')
+    sheet.skip()
 
     if not historical_avg:
-        ws['A3'] = "No historical data available for scenarios"
+        sheet.append(["No historical data available for scenarios"])
         return
 
     base_cost = historical_avg['total_cost']
@@ -351,80 +408,47 @@ def create_scenario_comparisons(ws, store_info, historical_avg):
         }
     ]
 
-    row = 3
-    headers = ['Scenario', 'Description', 'Total Cost', 'vs. Base', 'Notes']
-    for col_idx, header in enumerate(headers, start=1):
-        cell = ws.cell(row=row, column=col_idx, value=header)
-        apply_style(cell, create_header_style())
-
-    row += 1
+    sheet.append(['Scenario', 'Description', 'Total Cost', 'vs. Base', 'Notes'], style='header')
 
     for scenario in scenarios:
         cost = int(base_cost * scenario['multiplier'])
         variance = scenario['multiplier'] - 1.0
 
-        ws.cell(row=row, column=1, value=scenario['name'])
-        ws.cell(row=row, column=1).font = Font(bold=True)
-        ws.cell(row=row, column=2, value=scenario['description'])
-        ws.cell(row=row, column=3, value=cost)
-        ws.cell(row=row, column=3).number_format = '$#,##0'
-        ws.cell(row=row, column=4, value=variance)
-        ws.cell(row=row, column=4).number_format = '+0.0%;-0.0%;0%'
-
         # Color code variance
         if variance > 0:
-            ws.cell(row=row, column=4).font = Font(color='C00000')  # Red for over
+            variance_style = ('red', 'variance')
         elif variance < 0:
-            ws.cell(row=row, column=4).font = Font(color='00B050')  # Green for under
-
-        ws.cell(row=row, column=5, value=scenario['notes'])
-        ws.cell(row=row, column=5).font = Font(size=9, italic=True)
-        row += 1
+            variance_style = ('green', 'variance')
+        else:
+            variance_style = 'variance'
 
-    # Set column widths
-    ws.column_dimensions['A'].width = 22
-    ws.column_dimensions['B'].width = 35
-    ws.column_dimensions['C'].width = 15
-    ws.column_dimensions['D'].width = 12
-    ws.column_dimensions['E'].width = 40
+        sheet.append([scenario['name'], scenario['description'], cost, variance, scenario['notes']],
+                     styles={'A': 'bold', 'C': 'currency', 'D': variance_style, 'E': 'note'})
 
-def create_data_sources(ws, store_info):
+def create_data_sources(book, store_info):
     """Create data sources worksheet."""
-    ws['A1'] = "Data Sources & References"
-    ws['A1'].font = Font(bold=True, size=14)
-    ws.merge_cells('A1:C1')
+    sheet = book.add_sheet("Data Sources", widths={'A': 25, 'B': 45, 'C': 35})
 
-    row = 3
-    ws[f'A{row}'] = "Source Type"
-    ws[f'B{row}'] = "Location"
-    ws[f'C{row}'] = "Description"
-    for col in ['A', 'B', 'C']:
-        apply_style(ws[f'{col}{row}'], create_header_style())
+    sheet.append(["Data Sources & References"], style='heading', merge='C')
+    sheet.skip()
+    sheet.append(["Source Type", "Location", "Description"], style='header')
 
     sources = [
         ("Store Type Definition", "01_Build_Templates/store_types.json", f"type_id: {store_info['type_id']}"),
         ("Base Template", "01_Build_Templates/base_template.json", "Category structure and specifications"),
         ("Historical Projects", "03_Historical_Projects/historical_projects.csv", f"Filtered by store_type = {store_info['type_id']}"),
-        ("Cost Model", "05_Cost_Models/cost_model_suburban_standard.json", "Detailed line item costs and formulas"),
+        ("Cost Model", "05_Cost_Models/cost_models.json", f"{store_info['type_id']}_{store_info['typical_sqft']}sqft line items and formulas"),
         ("Regional Modifiers", "04_Regional_Modifiers/regional_modifiers.csv", "Market-specific multipliers"),
         ("Vendor Pricing", "06_Vendor_Data/vendor_pricing.csv", "Current vendor unit costs"),
         ("Meeting Transcripts", "07_Conversations/meeting_transcripts/vendor_negotiation/*", "Pricing discussions and negotiations"),
         ("Teams Conversations", "07_Conversations/teams_channels/construction-vendors.json", "Vendor performance and cost insights")
     ]
 
-    row += 1
     for source_type, location, description in sources:
-        ws[f'A{row}'] = source_type
-        ws[f'A{row}'].font = Font(bold=True)
-        ws[f'B{row}'] = location
-        ws[f'B{row}'].font = Font(name='Courier New', size=9)
-        ws[f'C{row}'] = description
-        row += 1
+        sheet.append([source_type, location, description], styles={'A': 'bold', 'B': 'code'})
 
-    row += 2
-    ws[f'A{row}'] = "Calculation Formulas"
-    apply_style(ws[f'A{row}'], create_header_style())
-    ws.merge_cells(f'A{row}:C{row}')
+    sheet.skip(2)
+    sheet.append(["Calculation Formulas"], style='header', merge='C')
 
     formulas = [
         ("Regional Adjustment", "base_cost × regional_modifier", "See 04_Regional_Modifiers"),
@@ -432,25 +456,15 @@ def create_data_sources(ws, store_info):
         ("Total Cost", "Σ(categories) × regional_modifier × timeline_factor", "Compound adjustments")
     ]
 
-    row += 1
     for formula_name, formula, note in formulas:
-        ws[f'A{row}'] = formula_name
-        ws[f'A{row}'].font = Font(bold=True)
-        ws[f'B{row}'] = formula
-        ws[f'B{row}'].font = Font(name='Courier New')
-        ws[f'C{row}'] = note
-        ws[f'C{row}'].font = Font(italic=True)
-        row += 1
-
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 45
-    ws.column_dimensions['C'].width = 35
+        sheet.append([formula_name, formula, note], styles={'A': 'bold', 'B': 'expression', 'C': 'italic'})
 
-def create_agent_instructions(ws, store_info):
+def create_agent_instructions(book, store_info):
     """Create agent instructions worksheet."""
-    ws['A1'] = "AI Agent Usage Instructions"
-    ws['A1'].font = Font(bold=True, size=14)
-    ws.merge_cells('A1:B1')
+    sheet = book.add_sheet("Agent Instructions", widths={'A': 25, 'B': 70})
+
+    sheet.append(["AI Agent Usage Instructions"], style='heading', merge='B')
+    sheet.skip()
 
     instructions = [
         ("Purpose", f"This budget plan provides a complete cost example for {store_info['name']} stores based on historical project data."),
@@ -487,49 +501,33 @@ def create_agent_instructions(ws, store_info):
         ("", "- Adjust regional modifiers annually")
     ]
 
-    row = 3
     for label, text in instructions:
-        if label:
-            ws[f'A{row}'] = label
-            ws[f'A{row}'].font = Font(bold=True)
-        ws[f'B{row}'] = text
-        if text.startswith("✓"):
-            ws[f'B{row}'].font = Font(color='00B050')
-        row += 1
-
-    ws.column_dimensions['A'].width = 25
-    ws.column_dimensions['B'].width = 70
-
-# Generate budget plans for each store type
-for store_type in store_types_data['store_types']:
-    create_budget_plan(store_type['type_id'])
-
-print(f"  ✓ Created {len(store_types_data['store_types'])} budget plan files")
+        sheet.append([label or None, text],
+                     styles={'A': 'bold', 'B': 'green' if text.startswith("✓") else None})
 
 # ============================================================================
 # 2. CONFIGURATION TEMPLATES
 # ============================================================================
-print("\n[2/4] Generating configuration templates...")
-
 def create_store_configuration_template():
     """Create reusable store configuration template."""
     wb = Workbook()
+    styles = budget_styles(wb)
     ws = wb.active
     ws.title = "Configuration Input"
 
     # Header
     ws['A1'] = "Store Build Configuration Template"
-    ws['A1'].font = Font(bold=True, size=16)
+    styles.apply(ws['A1'], 'title')
     ws.merge_cells('A1:D1')
 
     ws['A2'] = "Agent Input Zone - Enter project parameters below"
-    ws['A2'].font = Font(italic=True, color='0066CC')
+    styles.apply(ws['A2'], 'hint')
     ws.merge_cells('A2:D2')
 
     # Input section
     row = 4
     ws[f'A{row}'] = "INPUT PARAMETERS"
-    apply_style(ws[f'A{row}'], create_header_style())
+    styles.apply(ws[f'A{row}'], 'header')
     ws.merge_cells(f'A{row}:B{row}')
 
     inputs = [
@@ -543,17 +541,17 @@ def create_store_configuration_template():
     row += 1
     for label, default, note in inputs:
         ws[f'A{row}'] = label
-        ws[f'A{row}'].font = Font(bold=True)
+        styles.apply(ws[f'A{row}'], 'bold')
         ws[f'B{row}'] = default
-        apply_style(ws[f'B{row}'], create_input_style())
+        styles.apply(ws[f'B{row}'], 'input')
         ws[f'C{row}'] = note
-        ws[f'C{row}'].font = Font(italic=True, size=9)
+        styles.apply(ws[f'C{row}'], 'note')
         row += 1
 
     # Auto-calculation section
     row += 2
     ws[f'A{row}'] = "AUTO-CALCULATED BUDGET"
-    apply_style(ws[f'A{row}'], create_header_style())
+    styles.apply(ws[f'A{row}'], 'header')
     ws.merge_cells(f'A{row}:D{row}')
 
     row += 1
@@ -562,7 +560,7 @@ def create_store_configuration_template():
     ws[f'C{row}'] = "Regional Mult."
     ws[f'D{row}'] = "Adjusted Cost"
     for col in ['A', 'B', 'C', 'D']:
-        apply_style(ws[f'{col}{row}'], create_header_style())
+        styles.apply(ws[f'{col}{row}'], 'header')
 
     # Placeholder formulas (would reference lookup tables)
     categories = ['Construction', 'Electrical', 'HVAC', 'Plumbing', 'Fixtures', 'Technology', 'Soft Costs']
@@ -570,24 +568,23 @@ def create_store_configuration_template():
     for cat in categories:
         ws[f'A{row}'] = cat
         ws[f'B{row}'] = "[FORMULA]"
-        apply_style(ws[f'B{row}'], create_formula_style())
+        styles.apply(ws[f'B{row}'], 'formula')
         ws[f'C{row}'] = "[LOOKUP]"
-        apply_style(ws[f'C{row}'], create_formula_style())
+        styles.apply(ws[f'C{row}'], 'formula')
         ws[f'D{row}'] = "[B * C]"
-        apply_style(ws[f'D{row}'], create_output_style())
+        styles.apply(ws[f'D{row}'], 'output')
         row += 1
 
     # Total
     ws[f'A{row}'] = "TOTAL PROJECT COST"
-    ws[f'A{row}'].font = Font(bold=True, size=12)
+    styles.apply(ws[f'A{row}'], 'subheading')
     ws[f'D{row}'] = "[SUM]"
-    ws[f'D{row}'].font = Font(bold=True, size=12)
-    apply_style(ws[f'D{row}'], create_output_style())
+    styles.apply(ws[f'D{row}'], 'output')
 
     # Instructions worksheet
     ws_inst = wb.create_sheet("How to Use")
     ws_inst['A1'] = "Template Usage Instructions"
-    ws_inst['A1'].font = Font(bold=True, size=14)
+    styles.apply(ws_inst['A1'], 'heading')
 
     instructions = [
         "1. Enter project parameters in the blue INPUT PARAMETERS cells",
@@ -609,7 +606,7 @@ def create_store_configuration_template():
     for idx, instruction in enumerate(instructions, start=3):
         ws_inst[f'A{idx}'] = instruction
         if instruction.startswith("For AI") or instruction.startswith("Validation"):
-            ws_inst[f'A{idx}'].font = Font(bold=True)
+            styles.apply(ws_inst[f'A{idx}'], 'bold')
 
     ws_inst.column_dimensions['A'].width = 70
 
@@ -619,35 +616,36 @@ def create_store_configuration_template():
     ws.column_dimensions['D'].width = 20
 
     filename = f"{output_dir}/templates/Template_Config_Store_Configuration.xlsx"
-    wb.save(filename)
-    print(f"  ✓ Created {filename}")
+    save_workbook(wb, filename)
+    return filename
 
 def create_constraint_response_template():
     """Create constraint response template."""
     wb = Workbook()
+    styles = budget_styles(wb)
     ws = wb.active
     ws.title = "Constraint Impact"
 
     ws['A1'] = "Constraint Response Template"
-    ws['A1'].font = Font(bold=True, size=16)
+    styles.apply(ws['A1'], 'title')
     ws.merge_cells('A1:D1')
 
     row = 4
     ws[f'A{row}'] = "SELECT CONSTRAINT TYPE"
-    apply_style(ws[f'A{row}'], create_header_style())
+    styles.apply(ws[f'A{row}'], 'header')
     ws.merge_cells(f'A{row}:B{row}')
 
     row += 1
     ws[f'A{row}'] = "Constraint Type:"
-    ws[f'A{row}'].font = Font(bold=True)
+    styles.apply(ws[f'A{row}'], 'bold')
     ws[f'B{row}'] = "[DROPDOWN]"
-    apply_style(ws[f'B{row}'], create_input_style())
+    styles.apply(ws[f'B{row}'], 'input')
     ws[f'C{row}'] = "Options: landlord, budget, timeline, regional, operational"
-    ws[f'C{row}'].font = Font(italic=True, size=9)
+    styles.apply(ws[f'C{row}'], 'note')
 
     row += 2
     ws[f'A{row}'] = "COST IMPACT CALCULATION"
-    apply_style(ws[f'A{row}'], create_header_style())
+    styles.apply(ws[f'A{row}'], 'header')
     ws.merge_cells(f'A{row}:D{row}')
 
     row += 1
@@ -656,7 +654,7 @@ def create_constraint_response_template():
     ws[f'C{row}'] = "Multiplier"
     ws[f'D{row}'] = "Mitigation Strategy"
     for col in ['A', 'B', 'C', 'D']:
-        apply_style(ws[f'{col}{row}'], create_header_style())
+        styles.apply(ws[f'{col}{row}'], 'header')
 
     # Example impacts
     impacts = [
@@ -671,7 +669,7 @@ def create_constraint_response_template():
         ws[f'A{row}'] = impact
         ws[f'B{row}'] = categories
         ws[f'C{row}'] = mult
-        ws[f'C{row}'].alignment = Alignment(horizontal='center')
+        styles.apply(ws[f'C{row}'], 'centered')
         ws[f'D{row}'] = mitigation
         row += 1
 
@@ -681,27 +679,21 @@ def create_constraint_response_template():
     ws.column_dimensions['D'].width = 30
 
     filename = f"{output_dir}/templates/Template_Config_Constraint_Response.xlsx"
-    wb.save(filename)
-    print(f"  ✓ Created {filename}")
-
-create_store_configuration_template()
-create_constraint_response_template()
-
-print(f"  ✓ Created 2 configuration template files")
+    save_workbook(wb, filename)
+    return filename
 
 # ============================================================================
 # 3. BUILD STRATEGY WORKSHEETS
 # ============================================================================
-print("\n[3/4] Generating build strategy worksheets...")
-
 def create_fast_track_strategy():
     """Create fast-track build strategy worksheet."""
     wb = Workbook()
+    styles = budget_styles(wb)
     ws = wb.active
     ws.title = "Fast Track Strategy"
 
     ws['A1'] = "Fast-Track Build Strategy"
-    ws['A1'].font = Font(bold=True, size=16)
+    styles.apply(ws['A1'], 'title')
     ws.merge_cells('A1:E1')
 
     ws['A2'] = "Timeline Compression Techniques and Cost Impacts"
@@ -709,7 +701,7 @@ def create_fast_track_strategy():
 
     row = 4
     ws[f'A{row}'] = "STRATEGY OVERVIEW"
-    apply_style(ws[f'A{row}'], create_header_style())
+    styles.apply(ws[f'A{row}'], 'header')
     ws.merge_cells(f'A{row}:E{row}')
 
     overview = [
@@ -723,7 +715,7 @@ def create_fast_track_strategy():
     row += 1
     for label, value in overview:
         ws[f'A{row}'] = label
-        ws[f'A{row}'].font = Font(bold=True)
+        styles.apply(ws[f'A{row}'], 'bold')
         ws[f'B{row}'] = value
         ws.merge_cells(f'B{row}:E{row}')
         row += 1
@@ -731,7 +723,7 @@ def create_fast_track_strategy():
     # Cost impact table
     row += 2
     ws[f'A{row}'] = "COST IMPACT BY CATEGORY"
-    apply_style(ws[f'A{row}'], create_header_style())
+    styles.apply(ws[f'A{row}'], 'header')
     ws.merge_cells(f'A{row}:E{row}')
 
     row += 1
@@ -741,7 +733,7 @@ def create_fast_track_strategy():
     ws[f'D{row}'] = "Fast-Track Cost"
     ws[f'E{row}'] = "Justification"
     for col in ['A', 'B', 'C', 'D', 'E']:
-        apply_style(ws[f'{col}{row}'], create_header_style())
+        styles.apply(ws[f'{col}{row}'], 'header')
 
     # Example costs (based on suburban_standard)
     base_costs = {
@@ -785,10 +777,9 @@ def create_fast_track_strategy():
         ws[f'C{row}'] = premium
         ws[f'C{row}'].number_format = '0.0%'
         ws[f'D{row}'] = fast_track
-        ws[f'D{row}'].number_format = '$#,##0'
-        apply_style(ws[f'D{row}'], create_output_style())
+        styles.apply(ws[f'D{row}'], 'output', number_format='$#,##0')
         ws[f'E{row}'] = justifications[cat]
-        ws[f'E{row}'].font = Font(size=9)
+        styles.apply(ws[f'E{row}'], 'small')
         row += 1
 
     # Total
@@ -796,21 +787,18 @@ def create_fast_track_strategy():
     total_fast = sum(int(base_costs[cat] * (1 + premiums[cat])) for cat in base_costs)
 
     ws[f'A{row}'] = "TOTAL"
-    ws[f'A{row}'].font = Font(bold=True)
+    styles.apply(ws[f'A{row}'], 'bold')
     ws[f'B{row}'] = total_base
-    ws[f'B{row}'].number_format = '$#,##0'
-    ws[f'B{row}'].font = Font(bold=True)
+    styles.apply(ws[f'B{row}'], 'bold', number_format='$#,##0')
     ws[f'C{row}'] = (total_fast - total_base) / total_base
-    ws[f'C{row}'].number_format = '+0.0%'
-    ws[f'C{row}'].font = Font(bold=True, color='C00000')
+    styles.apply(ws[f'C{row}'], 'red_bold', number_format='+0.0%')
     ws[f'D{row}'] = total_fast
-    ws[f'D{row}'].number_format = '$#,##0'
-    ws[f'D{row}'].font = Font(bold=True)
+    styles.apply(ws[f'D{row}'], 'bold', number_format='$#,##0')
 
     # Applicability criteria
     row += 3
     ws[f'A{row}'] = "WHEN TO USE THIS STRATEGY"
-    apply_style(ws[f'A{row}'], create_header_style())
+    styles.apply(ws[f'A{row}'], 'header')
     ws.merge_cells(f'A{row}:E{row}')
 
     criteria = [
@@ -829,15 +817,15 @@ def create_fast_track_strategy():
         ws[f'A{row}'] = criterion
         ws.merge_cells(f'A{row}:E{row}')
         if criterion.startswith("✓"):
-            ws[f'A{row}'].font = Font(color='00B050')
+            styles.apply(ws[f'A{row}'], 'green')
         elif criterion.startswith("✗"):
-            ws[f'A{row}'].font = Font(color='C00000')
+            styles.apply(ws[f'A{row}'], 'red')
         row += 1
 
     # Historical references
     row += 2
     ws[f'A{row}'] = "HISTORICAL PROJECT EXAMPLES"
-    apply_style(ws[f'A{row}'], create_header_style())
+    styles.apply(ws[f'A{row}'], 'header')
     ws.merge_cells(f'A{row}:E{row}')
 
     row += 1
@@ -847,7 +835,7 @@ def create_fast_track_strategy():
     ws[f'D{row}'] = "Cost Premium"
     ws[f'E{row}'] = "Outcome"
     for col in ['A', 'B', 'C', 'D', 'E']:
-        apply_style(ws[f'{col}{row}'], create_header_style())
+        styles.apply(ws[f'{col}{row}'], 'header')
 
     examples = [
         ("Store-147", "Columbus", "8.5 weeks", "17%", "Success - opened on time"),
@@ -862,7 +850,7 @@ def create_fast_track_strategy():
         ws[f'C{row}'] = timeline
         ws[f'D{row}'] = premium
         ws[f'E{row}'] = outcome
-        ws[f'E{row}'].font = Font(size=9)
+        styles.apply(ws[f'E{row}'], 'small')
         row += 1
 
     ws.column_dimensions['A'].width = 18
@@ -872,17 +860,18 @@ def create_fast_track_strategy():
     ws.column_dimensions['E'].width = 40
 
     filename = f"{output_dir}/strategy_worksheets/Strategy_Fast_Track.xlsx"
-    wb.save(filename)
-    print(f"  ✓ Created {filename}")
+    save_workbook(wb, filename)
+    return filename
 
 def create_value_engineering_strategy():
     """Create value engineering strategy worksheet."""
     wb = Workbook()
+    styles = budget_styles(wb)
     ws = wb.active
     ws.title = "Value Engineering"
 
     ws['A1'] = "Value Engineering Strategy"
-    ws['A1'].font = Font(bold=True, size=16)
+    styles.apply(ws['A1'], 'title')
     ws.merge_cells('A1:E1')
 
     ws['A2'] = "Cost Reduction Opportunities by Category"
@@ -890,7 +879,7 @@ def create_value_engineering_strategy():
 
     row = 4
     ws[f'A{row}'] = "COST REDUCTION OPPORTUNITIES"
-    apply_style(ws[f'A{row}'], create_header_style())
+    styles.apply(ws[f'A{row}'], 'header')
     ws.merge_cells(f'A{row}:E{row}')
 
     row += 1
@@ -900,7 +889,7 @@ def create_value_engineering_strategy():
     ws[f'D{row}'] = "Savings"
     ws[f'E{row}'] = "Quality Impact"
     for col in ['A', 'B', 'C', 'D', 'E']:
-        apply_style(ws[f'{col}{row}'], create_header_style())
+        styles.apply(ws[f'{col}{row}'], 'header')
 
     opportunities = [
         ("Flooring", 63000, "LVT → Laminate", 0.22, "Minimal - 3yr vs 5yr lifespan"),
@@ -923,12 +912,11 @@ def create_value_engineering_strategy():
         ws[f'B{row}'] = standard
         ws[f'B{row}'].number_format = '$#,##0'
         ws[f'C{row}'] = approach
-        ws[f'C{row}'].font = Font(size=9)
+        styles.apply(ws[f'C{row}'], 'small')
         ws[f'D{row}'] = savings
-        ws[f'D{row}'].number_format = '$#,##0'
-        ws[f'D{row}'].font = Font(color='00B050', bold=True)
+        styles.apply(ws[f'D{row}'], 'green_bold', number_format='$#,##0')
         ws[f'E{row}'] = impact
-        ws[f'E{row}'].font = Font(size=9)
+        styles.apply(ws[f'E{row}'], 'small')
 
         total_standard += standard
         total_savings += savings
@@ -936,15 +924,13 @@ def create_value_engineering_strategy():
 
     # Total
     ws[f'A{row}'] = "TOTAL SAVINGS POTENTIAL"
-    ws[f'A{row}'].font = Font(bold=True)
+    styles.apply(ws[f'A{row}'], 'bold')
     ws[f'B{row}'] = total_standard
-    ws[f'B{row}'].number_format = '$#,##0'
-    ws[f'B{row}'].font = Font(bold=True)
+    styles.apply(ws[f'B{row}'], 'bold', number_format='$#,##0')
     ws[f'D{row}'] = total_savings
-    ws[f'D{row}'].number_format = '$#,##0'
-    ws[f'D{row}'].font = Font(bold=True, color='00B050')
+    styles.apply(ws[f'D{row}'], 'green_bold', number_format='$#,##0')
     ws[f'E{row}'] = f"{total_savings/total_standard:.1%} total reduction"
-    ws[f'E{row}'].font = Font(bold=True)
+    styles.apply(ws[f'E{row}'], 'bold')
 
     ws.column_dimensions['A'].width = 20
     ws.column_dimensions['B'].width = 18
@@ -953,36 +939,30 @@ def create_value_engineering_strategy():
     ws.column_dimensions['E'].width = 35
 
     filename = f"{output_dir}/strategy_worksheets/Strategy_Value_Engineering.xlsx"
-    wb.save(filename)
-    print(f"  ✓ Created {filename}")
-
-create_fast_track_strategy()
-create_value_engineering_strategy()
-
-print(f"  ✓ Created 2 build strategy worksheet files")
+    save_workbook(wb, filename)
+    return filename
 
 # ============================================================================
 # 4. AGENT TOOLS
 # ============================================================================
-print("\n[4/4] Generating agent integration tools...")
-
 def create_master_index():
     """Create master index of all budget artifacts."""
     wb = Workbook()
+    styles = budget_styles(wb)
     ws = wb.active
     ws.title = "Master Catalog"
 
     ws['A1'] = "Budget Artifacts Master Index"
-    ws['A1'].font = Font(bold=True, size=16)
+    styles.apply(ws['A1'], 'title')
     ws.merge_cells('A1:E1')
 
-    ws['A2'] = f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+    ws['A2'] = f"Generated: {clock.now().strftime('%Y-%m-%d %H:%M')}"
     ws.merge_cells('A2:E2')
 
     # Budget Plans
     row = 4
     ws[f'A{row}'] = "BUDGET PLANS"
-    apply_style(ws[f'A{row}'], create_header_style())
+    styles.apply(ws[f'A{row}'], 'header')
     ws.merge_cells(f'A{row}:E{row}')
 
     row += 1
@@ -992,7 +972,7 @@ def create_master_index():
     ws[f'D{row}'] = "Use Cases"
     ws[f'E{row}'] = "Avg Cost"
     for col in ['A', 'B', 'C', 'D', 'E']:
-        apply_style(ws[f'{col}{row}'], create_header_style())
+        styles.apply(ws[f'{col}{row}'], 'header')
 
     row += 1
     for store in store_types_data['store_types']:
@@ -1002,7 +982,7 @@ def create_master_index():
         ws[f'B{row}'] = store['name']
         ws[f'C{row}'] = f"{store['typical_sqft']:,} sqft"
         ws[f'D{row}'] = ", ".join(store['typical_use_cases'][:2])
-        ws[f'D{row}'].font = Font(size=9)
+        styles.apply(ws[f'D{row}'], 'small')
         if hist_avg:
             ws[f'E{row}'] = hist_avg['total_cost']
             ws[f'E{row}'].number_format = '$#,##0'
@@ -1011,7 +991,7 @@ def create_master_index():
     # Templates
     row += 2
     ws[f'A{row}'] = "CONFIGURATION TEMPLATES"
-    apply_style(ws[f'A{row}'], create_header_style())
+    styles.apply(ws[f'A{row}'], 'header')
     ws.merge_cells(f'A{row}:E{row}')
 
     templates_list = [
@@ -1025,13 +1005,13 @@ def create_master_index():
         ws[f'B{row}'] = description
         ws.merge_cells(f'B{row}:D{row}')
         ws[f'E{row}'] = use_case
-        ws[f'E{row}'].font = Font(size=9)
+        styles.apply(ws[f'E{row}'], 'small')
         row += 1
 
     # Strategies
     row += 2
     ws[f'A{row}'] = "BUILD STRATEGIES"
-    apply_style(ws[f'A{row}'], create_header_style())
+    styles.apply(ws[f'A{row}'], 'header')
     ws.merge_cells(f'A{row}:E{row}')
 
     strategies_list = [
@@ -1057,7 +1037,7 @@ def create_master_index():
     # Recommendation Matrix worksheet
     ws_rec = wb.create_sheet("Recommendation Matrix")
     ws_rec['A1'] = "Budget Artifact Recommendation Matrix"
-    ws_rec['A1'].font = Font(bold=True, size=14)
+    styles.apply(ws_rec['A1'], 'heading')
     ws_rec.merge_cells('A1:D1')
 
     ws_rec['A3'] = "IF project has..."
@@ -1065,7 +1045,7 @@ def create_master_index():
     ws_rec['C3'] = "THEN use..."
     ws_rec['D3'] = "Plus consider..."
     for col in ['A', 'B', 'C', 'D']:
-        apply_style(ws_rec[f'{col}3'], create_header_style())
+        styles.apply(ws_rec[f'{col}3'], 'header')
 
     recommendations = [
         ("New urban flagship", "Premium finish requirement", "Budget_Plan_urban_flagship_5000sqft.xlsx", "None"),
@@ -1081,9 +1061,9 @@ def create_master_index():
         ws_rec[f'A{row}'] = project
         ws_rec[f'B{row}'] = constraints
         ws_rec[f'C{row}'] = primary
-        ws_rec[f'C{row}'].font = Font(bold=True, color='0066CC')
+        styles.apply(ws_rec[f'C{row}'], 'link')
         ws_rec[f'D{row}'] = secondary
-        ws_rec[f'D{row}'].font = Font(italic=True)
+        styles.apply(ws_rec[f'D{row}'], 'italic')
         row += 1
 
     ws_rec.column_dimensions['A'].width = 25
@@ -1092,17 +1072,18 @@ def create_master_index():
     ws_rec.column_dimensions['D'].width = 35
 
     filename = f"{output_dir}/agent_tools/Master_Index_Budget_Artifacts.xlsx"
-    wb.save(filename)
-    print(f"  ✓ Created {filename}")
+    save_workbook(wb, filename)
+    return filename
 
 def create_sample_workflow():
     """Create sample agent workflow demonstration."""
     wb = Workbook()
+    styles = budget_styles(wb)
     ws = wb.active
     ws.title = "Sample Workflow"
 
     ws['A1'] = "Agent Workflow: Generate New Store Budget"
-    ws['A1'].font = Font(bold=True, size=16)
+    styles.apply(ws['A1'], 'title')
     ws.merge_cells('A1:C1')
 
     ws['A2'] = "Step-by-step example of using budget artifacts"
@@ -1155,24 +1136,22 @@ def create_sample_workflow():
 
         # Style step headers
         if col1.startswith("STEP"):
-            ws[f'A{row}'].font = Font(bold=True, size=12, color='FFFFFF')
-            ws[f'A{row}'].fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+            styles.apply(ws[f'A{row}'], 'band')
             ws.merge_cells(f'A{row}:C{row}')
 
         # Style key results
         if col1 in ["Base Cost (3500 sqft)", "Size Adjustment (3200/3500)", "Cincinnati Multiplier (1.06)", "Timeline Premium (1.15)"]:
-            ws[f'B{row}'].font = Font(bold=True)
+            styles.apply(ws[f'B{row}'], 'bold')
 
         if col1 == "FINAL ESTIMATED COST":
-            ws[f'A{row}'].font = Font(bold=True, size=12)
-            ws[f'B{row}'].font = Font(bold=True, size=12, color='FFFFFF')
-            ws[f'B{row}'].fill = PatternFill(start_color='00B050', end_color='00B050', fill_type='solid')
+            styles.apply(ws[f'A{row}'], 'subheading')
+            styles.apply(ws[f'B{row}'], 'highlight')
 
         # Style category breakdown
         if col1 in ["Construction", "Electrical", "HVAC", "Plumbing", "Fixtures", "Technology", "Soft Costs", "Contingency (10%)"]:
-            ws[f'A{row}'].font = Font(italic=True)
+            styles.apply(ws[f'A{row}'], 'italic')
             ws[f'B{row}'].number_format = '$#,##0'
-            ws[f'C{row}'].font = Font(italic=True, size=9)
+            styles.apply(ws[f'C{row}'], 'note')
 
         row += 1
 
@@ -1181,24 +1160,98 @@ def create_sample_workflow():
     ws.column_dimensions['C'].width = 25
 
     filename = f"{output_dir}/agent_tools/Sample_Workflow_Demo.xlsx"
-    wb.save(filename)
-    print(f"  ✓ Created {filename}")
-
-create_master_index()
-create_sample_workflow()
+    save_workbook(wb, filename)
+    return filename
 
-print(f"  ✓ Created 2 agent tool files")
 
 # ============================================================================
-# SUMMARY
+# PARALLEL BUILD
 # ============================================================================
-print("\n" + "="*60)
-print("BUDGET ARTIFACTS GENERATION COMPLETE")
-print("="*60)
-print(f"\n08_Budget_Artifacts/")
-print(f"  budget_plans/          {len(store_types_data['store_types'])} store-type budget plans")
-print(f"  templates/             2 reusable configuration templates")
-print(f"  strategy_worksheets/   2 build strategy worksheets")
-print(f"  agent_tools/           2 agent integration tools")
-print(f"\nTotal Excel files: {len(store_types_data['store_types']) + 2 + 2 + 2}")
-print("="*60 + "\n")
+
+def budget_artifact_jobs() -> List[Tuple]:
+    """(section, builder, args) for every workbook, in summary order."""
+    jobs = [('budget_plans', create_budget_plan, (store['type_id'],)) for store in store_types_data['store_types']]
+    jobs += [
+        ('templates', create_store_configuration_template, ()),
+        ('templates', create_constraint_response_template, ()),
+        ('strategy_worksheets', create_fast_track_strategy, ()),
+        ('strategy_worksheets', create_value_engineering_strategy, ()),
+        ('agent_tools', create_master_index, ()),
+        ('agent_tools', create_sample_workflow, ()),
+    ]
+    return jobs
+
+def _init_worker(inputs, run_clock):
+    """Install the parent's source data and run clock in a worker process."""
+    global clock
+    set_clock(run_clock)
+    clock = run_clock
+    use_inputs(inputs)
+
+def build_workbook(job) -> Tuple[str, float]:
+    """Build one workbook; returns (filename, seconds)."""
+    _, builder, args = job
+    start = time.perf_counter()
+    filename = builder(*args)
+    return filename, time.perf_counter() - start
+
+def build_workbooks(jobs: List[Tuple], inputs: Dict, workers: int = 1) -> List[Tuple[str, float]]:
+    """
+    Build every job, in a process pool when workers > 1.
+
+    Returns:
+        (filename, seconds) per job, in job order
+    """
+    workers = min(workers, len(jobs))
+    if workers <= 1:
+        return [build_workbook(job) for job in jobs]
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(inputs, clock)) as pool:
+        return list(pool.map(build_workbook, jobs))
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Generate budget planning artifacts (folder 08)')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes (default: one per CPU; 1 builds in-process)')
+
+    args = parser.parse_args()
+
+    for section in SECTIONS:
+        os.makedirs(f'{output_dir}/{section}', exist_ok=True)
+
+    print("Loading source data...")
+    inputs = load_inputs()
+    use_inputs(inputs)
+
+    jobs = budget_artifact_jobs()
+    workers = max(1, min(args.workers, len(jobs)))
+    print(f"Building {len(jobs)} workbooks with {workers} worker(s)...")
+
+    start = time.perf_counter()
+    results = build_workbooks(jobs, inputs, workers)
+    elapsed = time.perf_counter() - start
+
+    counts = {}
+    for n, (section, (heading, _)) in enumerate(SECTIONS.items(), 1):
+        print(f"\n[{n}/{len(SECTIONS)}] {heading}...")
+        built = [result for job, result in zip(jobs, results) if job[0] == section]
+        for filename, secs in built:
+            print(f"  ✓ Created {filename} ({secs:.2f}s)")
+        counts[section] = len(built)
+
+    slowest_file, slowest_secs = max(results, key=lambda result: result[1])
+
+    print("\n" + "="*60)
+    print("BUDGET ARTIFACTS GENERATION COMPLETE")
+    print("="*60)
+    print(f"\n08_Budget_Artifacts/")
+    for section, (_, label) in SECTIONS.items():
+        print(f"  {section + '/':<22} {counts[section]} {label}")
+    print(f"\nTotal Excel files: {len(results)}")
+    print(f"Wall clock: {elapsed:.2f}s with {workers} worker(s) "
+          f"(slowest workbook: {os.path.basename(slowest_file)}, {slowest_secs:.2f}s)")
+    print("="*60 + "\n")
+
+if __name__ == '__main__':
+    main()
@@ -7,14 +7,16 @@ This demonstrates how to improve dialogue quality to match Teams conversations.
 """
 
 import yaml
-import random
 from datetime import datetime, timedelta
+from run_context import get_clock, job_rng
 
 
 class EnhancedDialogueGenerator:
     """Generate realistic dialogue using scenario templates."""
 
-    def __init__(self):
+    def __init__(self, seed=None, clock=None):
+        self.seed = seed
+        self.clock = clock or get_clock()
         self.cost_directions = {
             'positive': 'under',
             'negative': 'over',
@@ -49,7 +51,7 @@ class EnhancedDialogueGenerator:
 
         # Calculate days since completion
         completion_date = datetime.strptime(historical_data['completion_date'], '%Y-%m-%d')
-        meeting_date = datetime.now()
+        meeting_date = self.clock.now()
         days_since = (meeting_date - completion_date).days
 
         # Generate realistic dialogue
@@ -112,6 +114,7 @@ class EnhancedDialogueGenerator:
         ]
 
         # Add timestamps
+        rng = job_rng(self.seed, 'lessons_learned', store_id)
         current_time = 0
         for item in dialogue:
             hours = current_time // 3600
@@ -120,7 +123,7 @@ class EnhancedDialogueGenerator:
             item['timestamp'] = f"[{hours:02d}:{minutes:02d}:{seconds:02d}]"
 
             # Increment time (30-180 seconds per exchange)
-            current_time += random.randint(30, 180)
+            current_time += rng.randint(30, 180)
 
         return dialogue
 
@@ -5,9 +5,14 @@ Meeting Transcript Generator
 Generates realistic meeting transcripts with proper formatting, persona-specific dialogue,
 and cross-references to structured data.
 
+Long meetings can be streamed: dialogue turns are generated lazily and written straight
+through to the output sink, with tags and action items collected as the turns pass, so
+memory does not grow with transcript length.
+
 Usage:
     python generate_meeting_transcripts.py --config config.json
     python generate_meeting_transcripts.py --meeting-type site_visit --store-id Store-217 --date 2024-03-15
+    python generate_meeting_transcripts.py --meeting-type design_review --store-id Store-217 --duration 480 --fill-duration --stream
 """
 
 import argparse
@@ -15,24 +20,44 @@ import json
 import os
 import re
 import yaml
-from datetime import datetime, timedelta
 from typing import Dict, List, Any
 import pandas as pd
 import random
+from conversation_index import update_conversation_index
+from output_sinks import DirectorySink, SINK_KINDS, create_sink, transcript_key
+from regional_matrix import RegionalModifierMatrix
+from run_context import add_run_arguments, configure_run, get_clock, job_rng
+
+# Action-oriented language picked out of dialogue turns
+ACTION_PATTERNS = [
+    r"I'?ll ([\w\s]+) by (\w+ \d+)",
+    r"(@[\w\s]+) (?:will|should) ([\w\s]+)",
+    r"(?:Need to|Must|Should) ([\w\s]+)"
+]
+MAX_ACTION_ITEMS = 5
+
+# Matches of ACTION_PATTERNS only span word characters, whitespace, ' and @; any other
+# character ends every match, so the joined dialogue can be scanned in pieces cut there
+ACTION_BREAK = re.compile(r"[^\w\s'@]")
 
 
 class MeetingTranscriptGenerator:
     """Generate realistic meeting transcripts."""
 
-    def __init__(self, config_dir='config', templates_dir='templates', output_dir='output/07_Conversations'):
+    def __init__(self, config_dir='config', templates_dir='templates', output_dir='output/07_Conversations',
+                 sink=None, seed=None, stream=False):
         self.config_dir = config_dir
         self.templates_dir = templates_dir
         self.output_dir = output_dir
+        self.sink = sink or DirectorySink(output_dir)
+        self.seed = seed
+        self.stream = stream
 
         # Load configuration
         self.personas = self._load_personas()
         self.temporal_rules = self._load_temporal_rules()
         self.vendor_registry = self._load_vendor_registry()
+        self._modifier_matrix = None
 
     def _load_personas(self) -> Dict:
         """Load participant personas from config."""
@@ -61,9 +86,10 @@ class MeetingTranscriptGenerator:
                 - participants: List[Dict] with name, role
                 - context: Dict with historical_reference, cost_focus, etc.
                 - duration_minutes: int
+                - fill_duration: bool, repeat the agenda until duration_minutes is reached
 
         Returns:
-            Dictionary with transcript data and metadata
+            Dictionary with transcript data and metadata ('transcript' is None when streaming)
         """
         # Load meeting template
         template = self._load_template(config['meeting_type'])
@@ -74,42 +100,29 @@ class MeetingTranscriptGenerator:
         # Select participants
         participants = self._select_participants(config, template)
 
-        # Generate dialogue
-        dialogue = self._generate_dialogue(template, participants, context_data, config)
-
-        # Generate tags and metadata
-        tags = self._extract_tags(dialogue, config)
-        action_items = self._extract_action_items(dialogue, participants)
-        references = self._map_references(tags, context_data)
+        # Generate dialogue lazily from this meeting's own random stream
+        rng = job_rng(self.seed, config['meeting_type'], config['store_id_or_topic'], config['date'])
+        turns = self._iter_dialogue(template, participants, context_data, config, rng=rng)
 
-        # Format transcript
-        transcript = self._format_transcript(
-            meeting_type=config['meeting_type'],
-            date=config['date'],
-            participants=participants,
-            dialogue=dialogue,
-            duration=config.get('duration_minutes', 60),
-            store_topic=config['store_id_or_topic'],
-            tags=tags,
-            action_items=action_items,
-            references=references
-        )
+        # Tags, action items and references are filled in as the turns stream past
+        metadata = {'participants': participants}
+        lines = self._iter_transcript_lines(config, participants, turns, context_data, metadata)
 
         # Save transcript
-        filename = self._save_transcript(transcript, config)
+        if self.stream:
+            transcript = None
+            filename = self._stream_transcript(lines, config)
+        else:
+            transcript = '\n'.join(lines)
+            filename = self._save_transcript(transcript, config)
 
         # Update conversation index
-        self._update_conversation_index(config, tags, references, filename)
+        self._update_conversation_index(config, metadata['tags'], metadata['references'], filename)
 
         return {
             'transcript': transcript,
             'filename': filename,
-            'metadata': {
-                'participants': participants,
-                'tags': tags,
-                'action_items': action_items,
-                'references': references
-            }
+            'metadata': metadata
         }
 
     def _load_template(self, meeting_type: str) -> Dict:
@@ -188,7 +201,13 @@ class MeetingTranscriptGenerator:
 
     def _load_regional_modifiers(self, market: str) -> Dict:
         """Load regional modifiers for market."""
-        # Mock implementation
+        if self._modifier_matrix is None and RegionalModifierMatrix.available():
+            self._modifier_matrix = RegionalModifierMatrix.load()
+        if self._modifier_matrix is not None:
+            # Only the categories this market actually adjusts
+            return {category: value for category, value in self._modifier_matrix.row(market).items() if value != 1.0}
+
+        # Structured data not generated yet
         modifiers = {
             'Cincinnati': {'electrical': 1.08, 'hvac': 1.05},
             'Columbus': {'electrical': 1.00, 'hvac': 1.02}
@@ -241,47 +260,56 @@ class MeetingTranscriptGenerator:
 
         return None
 
-    def _generate_dialogue(self, template: Dict, participants: List[Dict],
-                           context_data: Dict, config: Dict) -> List[Dict]:
-        """Generate dialogue based on template and context."""
-        dialogue = []
+    def _iter_dialogue(self, template: Dict, participants: List[Dict],
+                       context_data: Dict, config: Dict, rng=random):
+        """Yield dialogue turns one at a time, repeating the agenda when fill_duration is set."""
         current_timestamp = 0  # seconds
+        target = config.get('duration_minutes', 60) * 60 if config.get('fill_duration') else None
 
-        # Process each topic section from template
-        for topic_section in template.get('dialogue_flow', []):
-            section_name = topic_section['section']
-            topics = topic_section['topics']
-
-            # Generate dialogue turns for this section
-            for topic in topics:
-                # Determine speakers based on topic and participant roles
-                speakers = self._select_speakers_for_topic(topic, participants)
-
-                # Generate 2-4 dialogue turns per topic
-                num_turns = random.randint(2, 4)
-
-                for i in range(num_turns):
-                    speaker = speakers[i % len(speakers)]
-
-                    # Generate dialogue text
-                    text = self._generate_dialogue_text(
-                        speaker=speaker,
-                        topic=topic,
-                        context_data=context_data,
-                        config=config,
-                        turn_index=i
-                    )
-
-                    dialogue.append({
-                        'timestamp': self._format_timestamp(current_timestamp),
-                        'speaker': speaker['name'],
-                        'text': text
-                    })
+        while True:
+            turns_this_pass = 0
 
-                    # Increment timestamp (30-180 seconds per turn)
-                    current_timestamp += random.randint(30, 180)
+            # Process each topic section from template
+            for topic_section in template.get('dialogue_flow', []):
+                section_name = topic_section['section']
+                topics = topic_section['topics']
 
-        return dialogue
+                # Generate dialogue turns for this section
+                for topic in topics:
+                    # Determine speakers based on topic and participant roles
+                    speakers = self._select_speakers_for_topic(topic, participants)
+
+                    # Generate 2-4 dialogue turns per topic
+                    num_turns = rng.randint(2, 4)
+
+                    for i in range(num_turns):
+                        if target is not None and current_timestamp >= target:
+                            return
+
+                        speaker = speakers[i % len(speakers)]
+
+                        # Generate dialogue text
+                        text = self._generate_dialogue_text(
+                            speaker=speaker,
+                            topic=topic,
+                            context_data=context_data,
+                            config=config,
+                            turn_index=i,
+                            rng=rng
+                        )
+
+                        yield {
+                            'timestamp': self._format_timestamp(current_timestamp),
+                            'speaker': speaker['name'],
+                            'text': text
+                        }
+                        turns_this_pass += 1
+
+                        # Increment timestamp (30-180 seconds per turn)
+                        current_timestamp += rng.randint(30, 180)
+
+            if target is None or turns_this_pass == 0:
+                return
 
     def _select_speakers_for_topic(self, topic: str, participants: List[Dict]) -> List[Dict]:
         """Select appropriate speakers for a topic."""
@@ -310,7 +338,7 @@ class MeetingTranscriptGenerator:
         return speakers if speakers else participants
 
     def _generate_dialogue_text(self, speaker: Dict, topic: str, context_data: Dict,
-                                 config: Dict, turn_index: int) -> str:
+                                 config: Dict, turn_index: int, rng=random) -> str:
         """Generate dialogue text for a speaker."""
         persona = speaker['persona']
 
@@ -324,10 +352,10 @@ class MeetingTranscriptGenerator:
                 hist = context_data['historical_project']
                 cost = hist.get('electrical_actual_cost', 35000)
                 text = f"Based on what we did at {hist['store_id']}, we saw ${cost:,} for electrical work. "
-                text += random.choice(phrases) if phrases else ""
+                text += rng.choice(phrases) if phrases else ""
                 return text
             else:
-                return f"We're looking at around $35,000 for the electrical upgrade. {random.choice(phrases) if phrases else ''}"
+                return f"We're looking at around $35,000 for the electrical upgrade. {rng.choice(phrases) if phrases else ''}"
 
         elif 'constraint' in topic.lower():
             # Discuss constraints
@@ -348,7 +376,7 @@ class MeetingTranscriptGenerator:
                 "We should validate that against the historical data.",
                 "I'll follow up with more details by end of week."
             ]
-            return random.choice(templates)
+            return rng.choice(templates)
 
     def _format_timestamp(self, seconds: int) -> str:
         """Format timestamp as [HH:MM:SS]."""
@@ -357,8 +385,8 @@ class MeetingTranscriptGenerator:
         secs = seconds % 60
         return f"[{hours:02d}:{minutes:02d}:{secs:02d}]"
 
-    def _extract_tags(self, dialogue: List[Dict], config: Dict) -> List[str]:
-        """Extract tags from dialogue and config."""
+    def _initial_tags(self, config: Dict) -> set:
+        """Tags known from the meeting config before any dialogue."""
         tags = set()
 
         # Add store ID if present
@@ -374,43 +402,49 @@ class MeetingTranscriptGenerator:
             if config['context'].get('constraint_type'):
                 tags.add(config['context']['constraint_type'])
 
-        # Extract from dialogue (store IDs, vendors, etc.)
-        full_text = ' '.join([d['text'] for d in dialogue])
+        return tags
 
+    def _collect_tags(self, tags: set, text: str, tail: str = ''):
+        """
+        Add tags found in the next piece of the joined dialogue (store IDs, vendors, etc.).
+
+        Args:
+            text: Next piece of the joined dialogue
+            tail: End of the text before it, so vendor names split across turns still match
+        """
         # Extract store IDs
         store_pattern = r'Store-\d+'
-        tags.update(re.findall(store_pattern, full_text))
+        tags.update(re.findall(store_pattern, text))
 
         # Extract vendor names
+        window = tail + text
         for vendor in self.vendor_registry.get('vendors', []):
-            if vendor['canonical_name'] in full_text:
+            if vendor['canonical_name'] in window:
                 tags.add(vendor['canonical_name'])
 
-        return sorted(list(tags))
+    def _vendor_name_overlap(self) -> int:
+        """Characters of earlier dialogue to keep so a vendor name can straddle a turn boundary."""
+        lengths = [len(v['canonical_name']) for v in self.vendor_registry.get('vendors', [])]
+        return max(lengths, default=1) - 1
 
-    def _extract_action_items(self, dialogue: List[Dict], participants: List[Dict]) -> List[Dict]:
-        """Extract action items from dialogue."""
-        action_items = []
+    def _collect_action_items(self, buckets: List[List[Dict]], text: str, participants: List[Dict]):
+        """Add action items found in a piece of dialogue, keeping at most MAX_ACTION_ITEMS per pattern."""
+        for pattern, bucket in zip(ACTION_PATTERNS, buckets):
+            if len(bucket) >= MAX_ACTION_ITEMS:
+                continue
 
-        # Look for action-oriented language
-        action_patterns = [
-            r"I'?ll ([\w\s]+) by (\w+ \d+)",
-            r"(@[\w\s]+) (?:will|should) ([\w\s]+)",
-            r"(?:Need to|Must|Should) ([\w\s]+)"
-        ]
-
-        full_text = ' '.join([d['text'] for d in dialogue])
-
-        for pattern in action_patterns:
-            matches = re.finditer(pattern, full_text, re.IGNORECASE)
-            for match in matches:
-                action_items.append({
+            for match in re.finditer(pattern, text, re.IGNORECASE):
+                bucket.append({
                     'description': match.group(0),
                     'owner': participants[0]['name'],  # Default to first participant
                     'due_date': None  # Could extract from text
                 })
+                if len(bucket) >= MAX_ACTION_ITEMS:
+                    break
 
-        return action_items[:5]  # Limit to 5
+    def _merge_action_items(self, buckets: List[List[Dict]]) -> List[Dict]:
+        """Order action items by pattern, as a single pass over the full text would."""
+        return [item for bucket in buckets for item in bucket][:MAX_ACTION_ITEMS]
 
     def _map_references(self, tags: List[str], context_data: Dict) -> List[str]:
         """Map tags to structured data references."""
@@ -435,13 +469,61 @@ class MeetingTranscriptGenerator:
 
         return references
 
-    def _format_transcript(self, meeting_type: str, date: str, participants: List[Dict],
-                           dialogue: List[Dict], duration: int, store_topic: str,
-                           tags: List[str], action_items: List[Dict], references: List[str]) -> str:
-        """Format transcript as text."""
+    def _iter_transcript_lines(self, config: Dict, participants: List[Dict], turns,
+                               context_data: Dict, metadata: Dict):
+        """
+        Yield transcript lines while consuming dialogue turns one at a time.
+
+        Tags and action items match the same text as a single pass over the turns joined
+        with spaces: vendor names are checked against a window reaching back into the
+        previous turns, and action patterns are run over the pending text up to the last
+        ACTION_BREAK character. Once the turns are exhausted metadata gains 'tags',
+        'action_items' and 'references' and the footer is yielded.
+        """
+        tags = self._initial_tags(config)
+        action_buckets = [[] for _ in ACTION_PATTERNS]
+        overlap = self._vendor_name_overlap()
+        tail = ''
+        pending = ''
+
+        yield from self._format_header(
+            meeting_type=config['meeting_type'],
+            date=config['date'],
+            participants=participants,
+            duration=config.get('duration_minutes', 60),
+            store_topic=config['store_id_or_topic']
+        )
+
+        for index, d in enumerate(turns):
+            text = d['text'] if index == 0 else ' ' + d['text']
+
+            self._collect_tags(tags, text, tail)
+            tail = (tail + text)[-overlap:] if overlap else ''
+
+            pending += text
+            cut = None
+            for cut in ACTION_BREAK.finditer(text):
+                pass
+            if cut is not None:
+                split = len(pending) - len(text) + cut.end()
+                self._collect_action_items(action_buckets, pending[:split], participants)
+                pending = pending[split:]
+
+            yield self._format_turn(d)
+
+        self._collect_action_items(action_buckets, pending, participants)
+
+        metadata['tags'] = sorted(tags)
+        metadata['action_items'] = self._merge_action_items(action_buckets)
+        metadata['references'] = self._map_references(metadata['tags'], context_data)
+
+        yield from self._format_footer(metadata['tags'], metadata['action_items'], metadata['references'])
+
+    def _format_header(self, meeting_type: str, date: str, participants: List[Dict],
+                       duration: int, store_topic: str) -> List[str]:
+        """Format the transcript header lines."""
         lines = []
 
-        # Header
         lines.append(f"MEETING: {meeting_type.replace('_', ' ').title()}")
         lines.append(f"DATE: {date}")
         lines.append("PARTICIPANTS:")
@@ -452,9 +534,15 @@ class MeetingTranscriptGenerator:
         lines.append("---")
         lines.append("")
 
-        # Dialogue
-        for d in dialogue:
-            lines.append(f"{d['timestamp']} {d['speaker']}: {d['text']}")
+        return lines
+
+    def _format_turn(self, turn: Dict) -> str:
+        """Format one dialogue turn."""
+        return f"{turn['timestamp']} {turn['speaker']}: {turn['text']}"
+
+    def _format_footer(self, tags: List[str], action_items: List[Dict], references: List[str]) -> List[str]:
+        """Format the tags, action items and references footer."""
+        lines = []
 
         lines.append("")
         lines.append("---")
@@ -475,39 +563,37 @@ class MeetingTranscriptGenerator:
             for ref in references:
                 lines.append(f"  - {ref}")
 
-        return '\n'.join(lines)
+        return lines
+
+    def _transcript_filename(self, config: Dict) -> str:
+        """Build the transcript filename for a meeting."""
+        return f"{config['meeting_type']}_{config['store_id_or_topic']}_{config['date']}.txt"
 
     def _save_transcript(self, transcript: str, config: Dict) -> str:
-        """Save transcript to file."""
-        # Generate filename
-        meeting_type = config['meeting_type']
-        store_topic = config['store_id_or_topic']
-        date = config['date']
-
-        filename = f"{meeting_type}_{store_topic}_{date}.txt"
-        filepath = os.path.join(
-            self.output_dir,
-            'meeting_transcripts',
-            meeting_type,
-            filename
-        )
+        """Save transcript to the output sink."""
+        filename = self._transcript_filename(config)
 
-        # Create directory if needed
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        # Write through the sink (directory tree, shards, gzip, memory)
+        location = self.sink.write(transcript_key(config['meeting_type'], filename), transcript)
 
-        # Write file
-        with open(filepath, 'w') as f:
-            f.write(transcript)
+        print(f"✓ Saved transcript: {location}")
 
-        print(f"✓ Saved transcript: {filepath}")
+        return filename
+
+    def _stream_transcript(self, lines, config: Dict) -> str:
+        """Write transcript lines through to the output sink as they are produced."""
+        filename = self._transcript_filename(config)
+
+        with self.sink.open(transcript_key(config['meeting_type'], filename)) as out:
+            out.write_lines(lines)
+
+        print(f"✓ Saved transcript: {out.location}")
 
         return filename
 
     def _update_conversation_index(self, config: Dict, tags: List[str],
                                     references: List[str], filename: str):
         """Update conversation index CSV."""
-        index_path = f'{self.output_dir}/metadata/conversation_index.csv'
-
         # Create entry
         entry = {
             'store_id': config['store_id_or_topic'],
@@ -520,15 +606,7 @@ class MeetingTranscriptGenerator:
             'timeline_impact': 0
         }
 
-        # Append to CSV
-        if os.path.exists(index_path):
-            df = pd.read_csv(index_path)
-            df = pd.concat([df, pd.DataFrame([entry])], ignore_index=True)
-        else:
-            df = pd.DataFrame([entry])
-
-        os.makedirs(os.path.dirname(index_path), exist_ok=True)
-        df.to_csv(index_path, index=False)
+        update_conversation_index(self.output_dir, [entry])
 
         print(f"✓ Updated conversation index")
 
@@ -544,8 +622,16 @@ def main():
     parser.add_argument('--store-id', help='Store ID or topic')
     parser.add_argument('--date', help='Meeting date (YYYY-MM-DD)')
     parser.add_argument('--duration', type=int, default=60, help='Duration in minutes')
+    parser.add_argument('--fill-duration', action='store_true',
+                        help='Repeat the agenda until the meeting lasts --duration minutes')
+    parser.add_argument('--stream', action='store_true',
+                        help='Write dialogue through to the sink as it is generated (bounded memory)')
+    parser.add_argument('--sink', choices=SINK_KINDS, default='directory',
+                        help='Output sink for transcripts (default: directory)')
+    add_run_arguments(parser)
 
     args = parser.parse_args()
+    seed = configure_run(args)
 
     # Load config
     if args.config:
@@ -556,14 +642,16 @@ def main():
         config = {
             'meeting_type': args.meeting_type,
             'store_id_or_topic': args.store_id,
-            'date': args.date or datetime.now().strftime('%Y-%m-%d'),
+            'date': args.date or get_clock().today(),
             'duration_minutes': args.duration,
+            'fill_duration': args.fill_duration,
             'context': {}
         }
 
     # Generate transcript
-    generator = MeetingTranscriptGenerator()
-    result = generator.generate_transcript(config)
+    with create_sink(args.sink, 'output/07_Conversations') as sink:
+        generator = MeetingTranscriptGenerator(sink=sink, seed=seed, stream=args.stream)
+        result = generator.generate_transcript(config)
 
     print(f"\n✓ Generated transcript: {result['filename']}")
     print(f"  Tags: {', '.join(result['metadata']['tags'])}")
@@ -4,6 +4,10 @@ Enhanced Meeting Transcript Generator v2
 
 Generates realistic meeting transcripts using scenario-based dialogue templates.
 This version produces high-quality, contextual dialogue similar to Teams conversations.
+
+Setting duration_minutes in the meeting config repeats the scenario flow until the
+meeting reaches that length. With stream=True (--stream) turns are rendered lazily and
+written straight through to the output sink, so multi-hour meetings use constant memory.
 """
 
 import argparse
@@ -13,16 +17,40 @@ import random
 import yaml
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
-import pandas as pd
+from conversation_index import update_conversation_index
+from generation_cache import content_hash
+from output_sinks import DirectorySink, SINK_KINDS, create_sink, transcript_key
+from run_context import add_run_arguments, configure_run, get_clock, job_rng
+from run_metrics import NULL_METRICS
+from store_context import StoreContextTable
+
+# Bump when rendering logic changes so cached outputs are invalidated
+GENERATOR_VERSION = '2.2'
 
 
 class EnhancedMeetingGenerator:
     """Generate realistic meeting transcripts with scenario-based dialogue."""
 
-    def __init__(self, config_dir='config', templates_dir='templates', output_dir='output/07_Conversations'):
+    def __init__(self, config_dir='config', templates_dir='templates', output_dir='output/07_Conversations',
+                 sink=None, cache=None, seed=None, clock=None, stream=False,
+                 data_dir='output', context_table=None, defer_index=False, metrics=None):
         self.config_dir = config_dir
         self.templates_dir = templates_dir
         self.output_dir = output_dir
+        self.sink = sink or DirectorySink(output_dir)
+        self.cache = cache
+        self.seed = seed
+        self.clock = clock or get_clock()
+        self.stream = stream
+        # Batch runs collect index rows and write them once with flush_index()
+        self.defer_index = defer_index
+        self.pending_index = []
+        self.metrics = metrics or NULL_METRICS
+
+        # Per-store context from the structured data folders, when they have been generated
+        if context_table is None and StoreContextTable.available(data_dir):
+            context_table = StoreContextTable(data_dir)
+        self.context_table = context_table
 
         # Load configuration
         self.personas = self._load_json(f'{config_dir}/personas.json')
@@ -35,43 +63,120 @@ class EnhancedMeetingGenerator:
 
     def generate_transcript(self, meeting_type, config):
         """Generate enhanced meeting transcript."""
-        # Load enhanced template
-        template_path = f'{self.templates_dir}/meeting_templates/{meeting_type}_enhanced.yaml'
+        with self.metrics.job(meeting_type):
+            # Streamed transcripts are never held in memory, so they bypass the cache
+            if self.stream:
+                return self._generate_streamed(meeting_type, config)
 
-        if not os.path.exists(template_path):
-            raise FileNotFoundError(f"Enhanced template not found: {template_path}")
+            rendered = self.render_transcript(meeting_type, config)
 
-        with open(template_path, 'r') as f:
-            template = yaml.safe_load(f)
+            if rendered['cached'] != 'skipped':
+                self._save_transcript(rendered['transcript'], meeting_type, config)
+                self._add_index_entry(rendered['index_entry'])
 
-        # Prepare context data
-        context = self._prepare_context(meeting_type, config)
+        return {'transcript': rendered['transcript'], 'filename': rendered['filename'], 'cached': rendered['cached']}
 
-        # Generate dialogue
-        dialogue = self._generate_dialogue_from_scenarios(
-            template['dialogue_scenarios'],
-            context,
-            config
-        )
+    def _generate_streamed(self, meeting_type, config):
+        """Render dialogue straight into the sink (the render stage includes the writes)."""
+        with self.metrics.stage('template_load'):
+            _, template = self._load_template(meeting_type)
+        with self.metrics.stage('context_prep'):
+            context = self._prepare_context(meeting_type, config)
+        key = transcript_key(meeting_type, self._transcript_filename(meeting_type, config))
 
-        # Format transcript
-        transcript = self._format_transcript(
-            meeting_type=meeting_type,
-            dialogue=dialogue,
-            config=config,
-            context=context
+        lines = self._iter_transcript_lines(
+            meeting_type, template['dialogue_scenarios'], context, config, rng=self._job_rng(key)
         )
+        with self.metrics.stage('render'):
+            filename = self._stream_transcript(lines, meeting_type, config)
+        self._update_conversation_index(config, filename, context)
+        return {'transcript': None, 'filename': filename, 'cached': None}
 
-        # Save
-        filename = self._save_transcript(transcript, meeting_type, config)
+    def render_transcript(self, meeting_type, config):
+        """
+        Render a transcript and its index row without writing either.
 
-        # Update index
-        self._update_conversation_index(config, filename, context)
+        Returns:
+            Dictionary with the sink key, filename, transcript, index_entry and cache
+            status ('skipped': the sink already holds this output, 'copied': restored from cache)
+        """
+        with self.metrics.stage('template_load'):
+            template_text, template = self._load_template(meeting_type)
+
+        # Prepare context data
+        with self.metrics.stage('context_prep'):
+            context = self._prepare_context(meeting_type, config)
+
+        filename = self._transcript_filename(meeting_type, config)
+        key = transcript_key(meeting_type, filename)
+        with self.metrics.stage('index_update'):
+            index_entry = self._index_entry(config, filename, context)
+        rendered = {'key': key, 'filename': filename, 'index_entry': index_entry, 'cached': None}
+
+        # Reuse the previous output when no input has changed
+        job_key = None
+        if self.cache is not None:
+            job_key = self.cache.job_key(
+                template=template_text,
+                config=config,
+                context=context,
+                personas=self.personas,
+                seed=self.seed,
+                version=GENERATOR_VERSION
+            )
+            entry = self.cache.lookup(job_key)
+
+            if entry is not None:
+                existing = self.sink.read(key)
+                if existing is not None and content_hash(existing) == entry['output_hash']:
+                    self.cache.stats['hits'] += 1
+                    print(f"✓ Unchanged, skipped: {key}")
+                    rendered.update(transcript=existing, cached='skipped')
+                    return rendered
+
+                self.cache.stats['copied'] += 1
+                rendered.update(transcript=self.cache.load(entry), cached='copied')
+                return rendered
+
+        # Generate dialogue and format transcript
+        with self.metrics.stage('render'):
+            rendered['transcript'] = '\n'.join(self._iter_transcript_lines(
+                meeting_type, template['dialogue_scenarios'], context, config, rng=self._job_rng(key)
+            ))
+
+        if job_key is not None:
+            self.cache.store(job_key, key, rendered['transcript'])
+            self.cache.stats['misses'] += 1
+
+        return rendered
+
+    def _load_template(self, meeting_type):
+        """Load an enhanced template; returns its raw text (for cache keys) and parsed form."""
+        template_path = f'{self.templates_dir}/meeting_templates/{meeting_type}_enhanced.yaml'
 
-        return {'transcript': transcript, 'filename': filename}
+        if not os.path.exists(template_path):
+            raise FileNotFoundError(f"Enhanced template not found: {template_path}")
+
+        with open(template_path, 'r') as f:
+            template_text = f.read()
+        return template_text, yaml.safe_load(template_text)
+
+    def _job_rng(self, key):
+        """Per-transcript random stream, reproducible when a seed is set."""
+        return job_rng(self.seed, key)
 
     def _prepare_context(self, meeting_type, config):
         """Prepare context data for dialogue generation."""
+        context = self._default_context(meeting_type, config)
+
+        # Overlay values computed from historical projects, regional modifiers and vendors
+        if self.context_table is not None:
+            context.update(self.context_table.context(meeting_type, config))
+
+        return context
+
+    def _default_context(self, meeting_type, config):
+        """Fallback context values, used where the structured data has nothing to say."""
         context = {}
 
         if meeting_type == 'site_visit_debrief':
@@ -79,11 +184,14 @@ class EnhancedMeetingGenerator:
             context = {
                 'store_id': store_id,
                 'historical_store': f'Store-{int(store_id.split("-")[1]) - 12}',  # Reference store 12 earlier
+                'ref_market': 'Columbus',
+                'ref_market_clause': 'in the Columbus market where labor rates are lower',
                 'cost': 35000,
                 'historical_cost': 32000,
                 'market': 'Cincinnati',
                 'modifier': 1.08,
                 'modifier_pct': 8,
+                'modifier_direction': 'higher',
                 'modifier_reason': 'union contracts',
                 'labor': 15000,
                 'materials': 18000,
@@ -115,6 +223,9 @@ class EnhancedMeetingGenerator:
                 'variance_pct': 9,
                 'direction': 'under',
                 'backup_vendor': 'TempMaster',
+                'vendor_pricing_note': 'Their pricing came in 9% under our estimate and quality was excellent.',
+                'vendor_recommendation': "Based on this project, I'd recommend adding them to our preferred vendor "
+                                         "list. The 9% cost savings could be significant across our portfolio.",
                 'days_since_completion': 45,
                 'timeline_status': 'finished 2 days ahead of schedule',
                 'learning_financial': 'this saved us $3,000 and shows backup vendors can offer better value',
@@ -130,9 +241,9 @@ class EnhancedMeetingGenerator:
                 'time_period': 'last quarter',
                 'cost_increase': 5000,
                 'cost_increase_pct': 15,
-                'effective_date': (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d'),
+                'effective_date': (self.clock.now() + timedelta(days=30)).strftime('%Y-%m-%d'),
                 'technical_benefit': 'sufficient capacity for future electrical loads and equipment upgrades',
-                'communication_date': (datetime.now() + timedelta(days=7)).strftime('%Y-%m-%d')
+                'communication_date': (self.clock.now() + timedelta(days=7)).strftime('%Y-%m-%d')
             }
 
         elif meeting_type == 'weekly_dev_sync':
@@ -152,15 +263,43 @@ class EnhancedMeetingGenerator:
 
         return context
 
-    def _generate_dialogue_from_scenarios(self, scenarios, context, config):
-        """Generate dialogue from scenario templates."""
-        dialogue = []
+    def _plan_dialogue(self, scenarios, config, rng=random):
+        """
+        Work out the turn count, speakers and final timestamp before rendering.
+
+        The header needs the participants and duration ahead of the dialogue, so the
+        timing draws are replayed on a saved RNG state and the state is then restored;
+        the rendered turns consume exactly the same draws.
+        """
+        target = config.get('duration_minutes', 0) * 60
+        state = rng.getstate()
+
+        turns, current_time, last_time = 0, 0, 0
+        while scenarios and (current_time < target if target else turns < len(scenarios)):
+            last_time = current_time
+            current_time += rng.randint(30, 180)
+            turns += 1
+
+        rng.setstate(state)
+
+        # Speakers in order of first appearance
+        role_to_persona = self._map_roles_to_personas(scenarios)
+        participants = {}
+        for scenario in scenarios[:turns]:
+            persona = role_to_persona.get(scenario['speaker_role'], {'name': 'Unknown', 'role': scenario['speaker_role']})
+            participants.setdefault(persona['name'], persona['role'])
+
+        return {'turns': turns, 'last_time': last_time, 'participants': participants}
+
+    def _iter_dialogue(self, scenarios, context, turns, rng=random):
+        """Yield dialogue turns one at a time, cycling through the scenarios."""
         current_time = 0
 
         # Get participants for roles
         role_to_persona = self._map_roles_to_personas(scenarios)
 
-        for scenario in scenarios:
+        for turn in range(turns):
+            scenario = scenarios[turn % len(scenarios)]
             role = scenario['speaker_role']
             template_text = scenario['text']
 
@@ -175,17 +314,15 @@ class EnhancedMeetingGenerator:
             persona = role_to_persona.get(role, {'name': 'Unknown', 'role': role})
 
             # Create dialogue entry
-            dialogue.append({
+            yield {
                 'timestamp': self._format_timestamp(current_time),
                 'speaker': persona['name'],
                 'role': persona['role'],
                 'text': text
-            })
+            }
 
             # Increment time (30-180 seconds)
-            current_time += random.randint(30, 180)
-
-        return dialogue
+            current_time += rng.randint(30, 180)
 
     def _map_roles_to_personas(self, scenarios):
         """Map role names to specific personas."""
@@ -220,11 +357,19 @@ class EnhancedMeetingGenerator:
         secs = seconds % 60
         return f"[{hours:02d}:{minutes:02d}:{secs:02d}]"
 
-    def _format_transcript(self, meeting_type, dialogue, config, context):
-        """Format dialogue as meeting transcript."""
+    def _iter_transcript_lines(self, meeting_type, scenarios, context, config, rng=random):
+        """Yield transcript lines, rendering one dialogue turn at a time."""
+        plan = self._plan_dialogue(scenarios, config, rng)
+
+        yield from self._format_header(meeting_type, config, plan['participants'], plan['last_time'] // 60)
+        for d in self._iter_dialogue(scenarios, context, plan['turns'], rng):
+            yield self._format_turn(d)
+        yield from self._format_footer(meeting_type, config, context)
+
+    def _format_header(self, meeting_type, config, participants, total_minutes):
+        """Format the transcript header lines."""
         lines = []
 
-        # Header
         meeting_titles = {
             'site_visit_debrief': 'Site Visit Debrief',
             'vendor_negotiation': 'Vendor Negotiation',
@@ -237,28 +382,24 @@ class EnhancedMeetingGenerator:
         lines.append(f"DATE: {config['date']}")
         lines.append("PARTICIPANTS:")
 
-        # Extract unique participants
-        participants = {}
-        for d in dialogue:
-            if d['speaker'] not in participants:
-                participants[d['speaker']] = d['role']
-
         for speaker, role in participants.items():
             team = self._get_team_for_role(role)
             lines.append(f"  - {speaker} ({role}) - {team}")
 
-        # Calculate duration
-        last_timestamp = dialogue[-1]['timestamp'].strip('[]')
-        hours, minutes, _ = map(int, last_timestamp.split(':'))
-        total_minutes = hours * 60 + minutes
         lines.append(f"DURATION: {total_minutes // 60:02d}:{total_minutes % 60:02d}")
         lines.append(f"STORE/TOPIC: {config.get('store_id') or config.get('topic', 'General')}")
         lines.append("---")
         lines.append("")
 
-        # Dialogue
-        for d in dialogue:
-            lines.append(f"{d['timestamp']} {d['speaker']}: {d['text']}")
+        return lines
+
+    def _format_turn(self, turn):
+        """Format one dialogue turn."""
+        return f"{turn['timestamp']} {turn['speaker']}: {turn['text']}"
+
+    def _format_footer(self, meeting_type, config, context):
+        """Format the tags, action items and references footer."""
+        lines = []
 
         lines.append("")
         lines.append("---")
@@ -268,7 +409,7 @@ class EnhancedMeetingGenerator:
         lines.append(f"TAGS: {', '.join(tags)}")
 
         # Action items
-        action_items = self._generate_action_items(meeting_type, config, dialogue)
+        action_items = self._generate_action_items(meeting_type, config)
         if action_items:
             lines.append("ACTION ITEMS:")
             for item in action_items:
@@ -282,7 +423,7 @@ class EnhancedMeetingGenerator:
             for ref in references:
                 lines.append(f"  - {ref}")
 
-        return '\n'.join(lines)
+        return lines
 
     def _get_team_for_role(self, role):
         """Get team name for role."""
@@ -321,9 +462,9 @@ class EnhancedMeetingGenerator:
         elif meeting_type == 'weekly_dev_sync':
             tags.extend(['project-status', 'weekly-sync'])
 
-        return list(set(tags))  # Remove duplicates
+        return list(dict.fromkeys(tags))  # Remove duplicates, keep first-seen order
 
-    def _generate_action_items(self, meeting_type, config, dialogue):
+    def _generate_action_items(self, meeting_type, config):
         """Generate action items based on meeting type."""
         actions = []
         next_friday = self._get_next_friday(config['date'])
@@ -381,35 +522,50 @@ class EnhancedMeetingGenerator:
             days_ahead += 7
         return (date + timedelta(days=days_ahead)).strftime('%Y-%m-%d')
 
-    def _save_transcript(self, transcript, meeting_type, config):
-        """Save transcript to file."""
+    def _transcript_filename(self, meeting_type, config):
+        """Build the transcript filename for a meeting."""
         store_topic = config.get('store_id') or config.get('topic', 'general')
-        date = config['date']
-
-        filename = f"{meeting_type}_{store_topic}_{date}.txt"
-        filepath = os.path.join(
-            self.output_dir,
-            'meeting_transcripts',
-            meeting_type,
-            filename
-        )
+        return f"{meeting_type}_{store_topic}_{config['date']}.txt"
+
+    def _save_transcript(self, transcript, meeting_type, config):
+        """Save transcript to the output sink."""
+        filename = self._transcript_filename(meeting_type, config)
+        with self.metrics.stage('write'):
+            location = self.sink.write(transcript_key(meeting_type, filename), transcript)
+        self.metrics.add_bytes(len(transcript.encode('utf-8')))
+
+        print(f"✓ Saved enhanced transcript: {location}")
+        return filename
 
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+    def _stream_transcript(self, lines, meeting_type, config):
+        """Write transcript lines through to the output sink as they are rendered."""
+        filename = self._transcript_filename(meeting_type, config)
 
-        with open(filepath, 'w') as f:
-            f.write(transcript)
+        with self.sink.open(transcript_key(meeting_type, filename)) as out:
+            out.write_lines(lines)
 
-        print(f"✓ Saved enhanced transcript: {filepath}")
+        print(f"✓ Saved enhanced transcript: {out.location}")
         return filename
 
     def _update_conversation_index(self, config, filename, context):
         """Update conversation index."""
-        index_path = f'{self.output_dir}/metadata/conversation_index.csv'
+        self._add_index_entry(self._index_entry(config, filename, context))
+
+    def _add_index_entry(self, entry):
+        """Append a row to the index, or queue it when index writes are deferred."""
+        if self.defer_index:
+            self.pending_index.append(entry)
+            return
+
+        self.flush_index([entry])
+        print(f"✓ Updated conversation index")
 
+    def _index_entry(self, config, filename, context):
+        """Conversation index row for a transcript."""
         store_id = config.get('store_id') or context.get('store_id', 'General')
         tags = self._generate_tags(config.get('meeting_type', 'meeting'), config, context)
 
-        entry = {
+        return {
             'store_id': store_id,
             'conversation_type': 'meeting',
             'filename': filename,
@@ -420,17 +576,20 @@ class EnhancedMeetingGenerator:
             'timeline_impact': 0
         }
 
-        if os.path.exists(index_path):
-            df = pd.read_csv(index_path)
-            df = pd.concat([df, pd.DataFrame([entry])], ignore_index=True)
-        else:
-            df = pd.DataFrame([entry])
-
-        os.makedirs(os.path.dirname(index_path), exist_ok=True)
-        df.to_csv(index_path, index=False)
+    def take_index_entries(self):
+        """Return and clear the deferred index rows."""
+        entries, self.pending_index = self.pending_index, []
+        return entries
 
-        print(f"✓ Updated conversation index")
+    def flush_index(self, entries=None):
+        """Write index rows (default: the deferred ones) in a single write, replacing rows for the same files."""
+        if entries is None:
+            entries = self.take_index_entries()
+        if not len(entries):
+            return
 
+        with self.metrics.stage('index_update'):
+            update_conversation_index(self.output_dir, entries)
 
 def main():
     """Main entry point."""
@@ -442,19 +601,30 @@ def main():
     parser.add_argument('--store-id', help='Store ID')
     parser.add_argument('--topic', help='Topic (for non-store meetings)')
     parser.add_argument('--date', help='Meeting date (YYYY-MM-DD)')
+    parser.add_argument('--duration', type=int, default=None,
+                        help='Repeat the scenario flow until the meeting lasts this many minutes')
+    parser.add_argument('--stream', action='store_true',
+                        help='Write dialogue through to the sink as it is rendered (bounded memory)')
+    parser.add_argument('--sink', choices=SINK_KINDS, default='directory',
+                        help='Output sink for transcripts (default: directory)')
+    add_run_arguments(parser)
 
     args = parser.parse_args()
+    seed = configure_run(args)
 
     config = {
         'meeting_type': args.meeting_type,
         'store_id': args.store_id,
         'topic': args.topic,
-        'date': args.date or datetime.now().strftime('%Y-%m-%d'),
+        'date': args.date or get_clock().today(),
         'participants': ''
     }
+    if args.duration:
+        config['duration_minutes'] = args.duration
 
-    generator = EnhancedMeetingGenerator()
-    result = generator.generate_transcript(args.meeting_type, config)
+    with create_sink(args.sink, 'output/07_Conversations') as sink:
+        generator = EnhancedMeetingGenerator(sink=sink, seed=seed, stream=args.stream)
+        result = generator.generate_transcript(args.meeting_type, config)
 
     print(f"\n✅ Enhanced transcript generated: {result['filename']}")
 
@@ -4,36 +4,126 @@ Generate Structured Data (Folders 01-06)
 
 Creates foundational structured data that supports the conversational dataset
 and enables budget planning artifact generation.
+
+Each folder has its own builder, registered with the files it writes, so one folder
+can be regenerated without touching the others and the builders can be used as a
+library:
+
+- 01_Build_Templates:     store types, base template
+- 02_Constraints:         constraint catalog
+- 03_Historical_Projects: historical projects (--projects, --chunk-size), aggregates
+- 04_Regional_Modifiers:  regional modifiers
+- 05_Cost_Models:         suburban cost model, parametric cost model grid
+- 06_Vendor_Data:         vendor catalog, pricing sheet
+
+Declared outputs are logical paths; record outputs ("name.*" for every format,
+"name.{jsonl,parquet}" for some) expand to the --formats in effect.
+
+Usage:
+    python generate_structured_data.py
+    python generate_structured_data.py --only 04_Regional_Modifiers
+    python generate_structured_data.py --only 04 --only 06
+    python generate_structured_data.py --list
+    python generate_structured_data.py --projects 1000000 --chunk-size 100000
+    python generate_structured_data.py --format compact --compress gzip
+
+    from generate_structured_data import generate
+    generate(['04_Regional_Modifiers'])
 """
 
+import argparse
 import os
-import json
-import csv
-from datetime import datetime
-
-# Create output directories
-base_dir = 'output'
-folders = [
-    '01_Build_Templates',
-    '02_Constraints',
-    '03_Historical_Projects',
-    '04_Regional_Modifiers',
-    '05_Cost_Models',
-    '06_Vendor_Data'
-]
+import re
+from typing import Callable, Dict, List, Optional, Sequence
+
+from historical_projects import DEFAULT_CHUNK_SIZE, write_projects
+from project_aggregates import ProjectAggregator, write_aggregates
+from artifact_io import add_output_arguments, configure_output, write_json
+from cost_engine import SQFT_GRID, STORE_TYPES, cost_models as parametric_cost_models, evaluate, line_item_rows
+from record_writer import FORMATS, available_formats, write_records
+
+DEFAULT_BASE_DIR = 'output'
+DEFAULT_PROJECTS = 160
+
+# folder -> {'title', 'outputs', 'build'}, in generation order
+BUILDERS: Dict[str, Dict] = {}
+
+
+def builder(folder: str, title: str, outputs: List[str]):
+    """
+    Register a folder builder.
+
+    Args:
+        folder: Output folder, e.g. '04_Regional_Modifiers'
+        title: Progress label ("Creating <title>...")
+        outputs: Files written, relative to the folder; 'name.*' / 'name.{a,b}' are record outputs
+
+    The builder is called as build(out_dir, formats, **options), where formats maps each
+    record output name to its formats, and returns a short summary of what it wrote.
+    """
+    def register(build: Callable[..., str]) -> Callable[..., str]:
+        BUILDERS[folder] = {'title': title, 'outputs': outputs, 'build': build}
+        return build
+    return register
+
+
+def _record_output(output: str):
+    """Split 'name.*' / 'name.{a,b}' into (name, allowed formats); None for plain files."""
+    match = re.fullmatch(r'(.+)\.(\*|\{([a-z,]+)\})', output)
+    if not match:
+        return None
+    return match.group(1), FORMATS if match.group(2) == '*' else match.group(3).split(',')
+
 
-for folder in folders:
-    os.makedirs(f'{base_dir}/{folder}', exist_ok=True)
+def record_formats(folder: str, formats: Optional[Sequence[str]] = None) -> Dict[str, List[str]]:
+    """Formats each record output of a folder is written in."""
+    requested = [fmt for fmt in (formats or FORMATS) if fmt in available_formats()]
+    result = {}
+    for output in BUILDERS[folder]['outputs']:
+        record = _record_output(output)
+        if record:
+            result[record[0]] = [fmt for fmt in requested if fmt in record[1]]
+    return result
+
+
+def output_paths(folder: str, formats: Optional[Sequence[str]] = None, base_dir: str = DEFAULT_BASE_DIR) -> List[str]:
+    """Logical paths of every file a folder's builder writes."""
+    per_record = record_formats(folder, formats)
+    paths = []
+    for output in BUILDERS[folder]['outputs']:
+        record = _record_output(output)
+        if record:
+            paths.extend(f'{base_dir}/{folder}/{record[0]}.{fmt}' for fmt in per_record[record[0]])
+        else:
+            paths.append(f'{base_dir}/{folder}/{output}')
+    return paths
+
+
+def resolve_folders(names: Optional[Sequence[str]]) -> List[str]:
+    """
+    Folder names for --only values (full name or numeric prefix, comma-separated allowed).
+
+    Raises:
+        ValueError: For a name that matches no folder
+    """
+    if not names:
+        return list(BUILDERS)
+
+    selected = set()
+    for name in (part.strip() for value in names for part in value.split(',') if part.strip()):
+        matches = [folder for folder in BUILDERS if folder == name or folder.split('_')[0] == name]
+        if not matches:
+            raise ValueError(f"Unknown folder: {name} (choose from {', '.join(BUILDERS)})")
+        selected.update(matches)
+    return [folder for folder in BUILDERS if folder in selected]
 
-print("Creating structured data files...")
 
 # ============================================================================
 # 01_BUILD_TEMPLATES
 # ============================================================================
-print("\n[1/6] Creating build templates...")
 
 # Store type configurations
-store_types = {
+STORE_TYPE_TEMPLATES = {
     "store_types": [
         {
             "type_id": "urban_flagship",
@@ -113,11 +203,8 @@ store_types = {
     ]
 }
 
-with open(f'{base_dir}/01_Build_Templates/store_types.json', 'w') as f:
-    json.dump(store_types, f, indent=2)
-
 # Base configuration template
-base_config = {
+BASE_TEMPLATE = {
     "template_id": "base_template_v2.3",
     "version": "2.3",
     "effective_date": "2025-03-01",
@@ -201,17 +288,22 @@ base_config = {
     }
 }
 
-with open(f'{base_dir}/01_Build_Templates/base_template.json', 'w') as f:
-    json.dump(base_config, f, indent=2)
 
-print(f"  ✓ Created 2 build template files")
+@builder('01_Build_Templates', 'build templates', ['store_types.json', 'base_template.json'])
+def build_templates(out_dir: str, formats: Dict[str, List[str]], **options) -> str:
+    """Store type configurations and the base configuration template."""
+    write_json(STORE_TYPE_TEMPLATES, f'{out_dir}/store_types.json')
+    write_json(BASE_TEMPLATE, f'{out_dir}/base_template.json')
+
+    print(f"  ✓ Created 2 build template files")
+    return 'store types, base template'
+
 
 # ============================================================================
 # 02_CONSTRAINTS
 # ============================================================================
-print("\n[2/6] Creating constraint definitions...")
 
-constraints = {
+CONSTRAINT_CATALOG = {
     "constraint_types": [
         {
             "type": "landlord",
@@ -311,128 +403,47 @@ constraints = {
     ]
 }
 
-with open(f'{base_dir}/02_Constraints/constraint_catalog.json', 'w') as f:
-    json.dump(constraints, f, indent=2)
 
-print(f"  ✓ Created constraint catalog")
+@builder('02_Constraints', 'constraint definitions', ['constraint_catalog.json'])
+def build_constraints(out_dir: str, formats: Dict[str, List[str]], **options) -> str:
+    """Constraint catalog."""
+    write_json(CONSTRAINT_CATALOG, f'{out_dir}/constraint_catalog.json')
+
+    print(f"  ✓ Created constraint catalog")
+    return 'constraint catalog'
+
 
 # ============================================================================
 # 03_HISTORICAL_PROJECTS
 # ============================================================================
-print("\n[3/6] Creating historical projects data...")
-
-# Generate historical project data
-historical_projects = []
-
-# Define store type distribution
-store_type_examples = [
-    ("suburban_standard", 3500, 80),  # Most common
-    ("urban_flagship", 5000, 20),
-    ("express_compact", 2000, 30),
-    ("remodel_refresh", 3500, 25),
-    ("prototype_innovation", 4000, 5)
-]
 
-project_id = 50  # Start from Store-50
-
-for store_type, sqft, count in store_type_examples:
-    for i in range(count):
-        store_id = f"Store-{project_id}"
-
-        # Base costs per sqft by store type
-        base_cost_psf = {
-            "suburban_standard": 185,
-            "urban_flagship": 285,
-            "express_compact": 145,
-            "remodel_refresh": 95,
-            "prototype_innovation": 325
-        }
+@builder('03_Historical_Projects', 'historical projects data', ['historical_projects.*', 'project_aggregates.*'])
+def build_historical_projects(out_dir: str, formats: Dict[str, List[str]], projects: int = DEFAULT_PROJECTS,
+                              chunk_size: int = DEFAULT_CHUNK_SIZE, **options) -> str:
+    """Historical projects, generated and written in chunks, plus their group aggregates."""
+    # Generate historical project data (vectorized, one counter-based stream per project),
+    # written in chunks so memory does not grow with --projects
+    aggregator = ProjectAggregator()
+    writer = write_projects(
+        projects, f'{out_dir}/historical_projects',
+        formats=formats['historical_projects'], chunk_size=chunk_size, on_chunk=aggregator.add
+    )
 
-        # Add variation (+/- 15%)
-        import random
-        random.seed(project_id)
-        variation = random.uniform(0.85, 1.15)
-
-        total_cost = int(base_cost_psf[store_type] * sqft * variation)
-
-        # Break down by category (percentages)
-        construction_pct = 0.35
-        electrical_pct = 0.12
-        hvac_pct = 0.08
-        plumbing_pct = 0.05
-        fixtures_pct = 0.25
-        technology_pct = 0.08
-        soft_costs_pct = 0.07
-
-        project = {
-            "store_id": store_id,
-            "store_type": store_type,
-            "square_footage": sqft,
-            "market": random.choice(["Columbus", "Cincinnati", "Cleveland", "Indianapolis", "Louisville", "Pittsburgh", "Detroit"]),
-            "completion_date": f"2024-{random.randint(1,12):02d}-{random.randint(1,28):02d}",
-            "total_cost": total_cost,
-            "cost_per_sqft": round(total_cost / sqft, 2),
-            "categories": {
-                "construction": int(total_cost * construction_pct),
-                "electrical": int(total_cost * electrical_pct),
-                "hvac": int(total_cost * hvac_pct),
-                "plumbing": int(total_cost * plumbing_pct),
-                "fixtures": int(total_cost * fixtures_pct),
-                "technology": int(total_cost * technology_pct),
-                "soft_costs": int(total_cost * soft_costs_pct)
-            },
-            "timeline_days": random.randint(60, 120),
-            "variance_from_budget": random.randint(-5, 10),  # percentage
-            "lessons_learned": [
-                "Completed on schedule" if random.random() > 0.3 else "Delayed by permit issues",
-                "Vendor performance good" if random.random() > 0.2 else "Vendor substitution required"
-            ]
-        }
+    print(f"  ✓ Created {writer.count} historical project records")
 
-        historical_projects.append(project)
-        project_id += 1
-
-# Save as CSV for easy analysis
-with open(f'{base_dir}/03_Historical_Projects/historical_projects.csv', 'w', newline='') as f:
-    fieldnames = ['store_id', 'store_type', 'square_footage', 'market', 'completion_date',
-                  'total_cost', 'cost_per_sqft', 'construction', 'electrical', 'hvac', 'plumbing',
-                  'fixtures', 'technology', 'soft_costs', 'timeline_days', 'variance_from_budget']
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
-    writer.writeheader()
-
-    for project in historical_projects:
-        row = {
-            'store_id': project['store_id'],
-            'store_type': project['store_type'],
-            'square_footage': project['square_footage'],
-            'market': project['market'],
-            'completion_date': project['completion_date'],
-            'total_cost': project['total_cost'],
-            'cost_per_sqft': project['cost_per_sqft'],
-            'construction': project['categories']['construction'],
-            'electrical': project['categories']['electrical'],
-            'hvac': project['categories']['hvac'],
-            'plumbing': project['categories']['plumbing'],
-            'fixtures': project['categories']['fixtures'],
-            'technology': project['categories']['technology'],
-            'soft_costs': project['categories']['soft_costs'],
-            'timeline_days': project['timeline_days'],
-            'variance_from_budget': project['variance_from_budget']
-        }
-        writer.writerow(row)
+    # Summary statistics by store type, market, both and quarter, from the same chunks
+    aggregates = write_aggregates(aggregator.table(), f'{out_dir}/project_aggregates',
+                                  formats=formats['project_aggregates'])
 
-# Also save as JSON
-with open(f'{base_dir}/03_Historical_Projects/historical_projects.json', 'w') as f:
-    json.dump({"projects": historical_projects}, f, indent=2)
+    print(f"  ✓ Created {aggregates.count} project aggregate groups")
+    return f'{writer.count} projects, {aggregates.count} aggregate groups'
 
-print(f"  ✓ Created {len(historical_projects)} historical project records")
 
 # ============================================================================
 # 04_REGIONAL_MODIFIERS
 # ============================================================================
-print("\n[4/6] Creating regional modifier data...")
 
-regional_modifiers = {
+REGIONAL_MODIFIERS = {
     "markets": [
         {
             "market": "Columbus",
@@ -587,34 +598,36 @@ regional_modifiers = {
     ]
 }
 
-with open(f'{base_dir}/04_Regional_Modifiers/regional_modifiers.json', 'w') as f:
-    json.dump(regional_modifiers, f, indent=2)
+REGIONAL_COLUMNS = ['market', 'state', 'tier', 'construction', 'electrical', 'hvac',
+                    'plumbing', 'fixtures', 'technology', 'soft_costs', 'notes']
 
-# CSV version
-with open(f'{base_dir}/04_Regional_Modifiers/regional_modifiers.csv', 'w', newline='') as f:
-    fieldnames = ['market', 'state', 'tier', 'construction', 'electrical', 'hvac',
-                  'plumbing', 'fixtures', 'technology', 'soft_costs', 'notes']
-    writer = csv.DictWriter(f, fieldnames=fieldnames)
-    writer.writeheader()
 
-    for market in regional_modifiers['markets']:
-        row = {
+@builder('04_Regional_Modifiers', 'regional modifier data', ['regional_modifiers.*'])
+def build_regional_modifiers(out_dir: str, formats: Dict[str, List[str]], **options) -> str:
+    """Regional modifiers per market."""
+    # JSON, CSV (one row per market, modifiers inlined) and any other formats in one pass
+    writer = write_records(
+        f'{out_dir}/regional_modifiers', 'markets', REGIONAL_MODIFIERS['markets'],
+        formats=formats['regional_modifiers'],
+        columns=REGIONAL_COLUMNS,
+        flatten=lambda market: {
             'market': market['market'],
             'state': market['state'],
             'tier': market['tier'],
             **market['modifiers'],
             'notes': market['notes']
         }
-        writer.writerow(row)
+    )
+
+    print(f"  ✓ Created regional modifiers for {writer.count} markets")
+    return f'{writer.count} markets'
 
-print(f"  ✓ Created regional modifiers for {len(regional_modifiers['markets'])} markets")
 
 # ============================================================================
 # 05_COST_MODELS
 # ============================================================================
-print("\n[5/6] Creating cost models...")
 
-cost_models = {
+SUBURBAN_COST_MODEL = {
     "model_version": "2.3",
     "last_updated": "2025-03-01",
     "base_costs": {
@@ -714,17 +727,39 @@ cost_models = {
     }
 }
 
-with open(f'{base_dir}/05_Cost_Models/cost_model_suburban_standard.json', 'w') as f:
-    json.dump(cost_models, f, indent=2)
 
-print(f"  ✓ Created detailed cost model")
+@builder('05_Cost_Models', 'cost models',
+         ['cost_model_suburban_standard.json', 'cost_models.json', 'cost_model_line_items.{csv,jsonl,parquet}'])
+def build_cost_models(out_dir: str, formats: Dict[str, List[str]], **options) -> str:
+    """Hand-written suburban model plus the parametric store type x size grid."""
+    write_json(SUBURBAN_COST_MODEL, f'{out_dir}/cost_model_suburban_standard.json')
+
+    print(f"  ✓ Created detailed cost model")
+
+    # Parametric models for every store type x size, evaluated in one pass
+    cost_grid = evaluate(STORE_TYPES, SQFT_GRID)
+    grid_models = {
+        "model_version": SUBURBAN_COST_MODEL["model_version"],
+        "last_updated": SUBURBAN_COST_MODEL["last_updated"],
+        "store_types": STORE_TYPES,
+        "square_footages": SQFT_GRID,
+        "base_costs": parametric_cost_models(cost_grid),
+        "formulas": SUBURBAN_COST_MODEL["formulas"]
+    }
+    write_json(grid_models, f'{out_dir}/cost_models.json')
+    write_records(f'{out_dir}/cost_model_line_items', 'line_items', line_item_rows(cost_grid),
+                  formats=formats['cost_model_line_items'])
+
+    print(f"  ✓ Created {len(grid_models['base_costs'])} parametric cost models "
+          f"({len(STORE_TYPES)} store types x {len(SQFT_GRID)} sizes)")
+    return f"{len(grid_models['base_costs'])} cost models"
+
 
 # ============================================================================
 # 06_VENDOR_DATA
 # ============================================================================
-print("\n[6/6] Creating vendor pricing data...")
 
-vendor_data = {
+VENDOR_CATALOG = {
     "vendors": [
         {
             "vendor_id": "V001",
@@ -880,45 +915,128 @@ vendor_data = {
     ]
 }
 
-with open(f'{base_dir}/06_Vendor_Data/vendor_catalog.json', 'w') as f:
-    json.dump(vendor_data, f, indent=2)
-
-# CSV version
-with open(f'{base_dir}/06_Vendor_Data/vendor_pricing.csv', 'w', newline='') as f:
-    writer = csv.writer(f)
-    writer.writerow(['Vendor', 'Category', 'Item', 'Price', 'Unit', 'Lead Time', 'Notes'])
-
-    pricing_rows = [
-        ['CoolAir Systems', 'HVAC', 'Commercial unit 3500sqft', 16500, 'each', '10 weeks', 'Volume discounts available'],
-        ['TempMaster', 'HVAC', 'Commercial unit 3500sqft', 15000, 'each', '8 weeks', '9% under primary vendor'],
-        ['PowerTech Solutions', 'Electrical', '400A panel', 8500, 'each', '6 weeks', ''],
-        ['PowerTech Solutions', 'Electrical', 'LED fixture', 412, 'each', '6 weeks', ''],
-        ['FlowMaster Plumbing', 'Plumbing', 'Fixture set', 2850, 'set', '4 weeks', ''],
-        ['RetailFixtures Pro', 'Fixtures', 'Wall system', 185, 'lf', '8 weeks', ''],
-        ['RetailFixtures Pro', 'Fixtures', 'Floor fixture', 725, 'each', '8 weeks', ''],
-        ['RetailFixtures Pro', 'Fixtures', 'Mannequin', 385, 'each', '8 weeks', ''],
-        ['SmartStore Tech', 'Technology', 'POS system (3 terminals)', 12500, 'system', '6 weeks', ''],
-        ['SmartStore Tech', 'Technology', 'Security camera', 875, 'each', '6 weeks', ''],
-        ['SmartStore Tech', 'Technology', 'Digital display', 2150, 'each', '6 weeks', ''],
-        ['BuildSmart Design', 'Design', 'Design fee 3500sqft', 15000, 'project', '4 weeks', ''],
-        ['BuildSmart Design', 'Design', 'Engineering fee', 8500, 'project', '4 weeks', '']
-    ]
+# Pricing sheet
+PRICING_COLUMNS = ['Vendor', 'Category', 'Item', 'Price', 'Unit', 'Lead Time', 'Notes']
+PRICING_ROWS = [
+    ['CoolAir Systems', 'HVAC', 'Commercial unit 3500sqft', 16500, 'each', '10 weeks', 'Volume discounts available'],
+    ['TempMaster', 'HVAC', 'Commercial unit 3500sqft', 15000, 'each', '8 weeks', '9% under primary vendor'],
+    ['PowerTech Solutions', 'Electrical', '400A panel', 8500, 'each', '6 weeks', ''],
+    ['PowerTech Solutions', 'Electrical', 'LED fixture', 412, 'each', '6 weeks', ''],
+    ['FlowMaster Plumbing', 'Plumbing', 'Fixture set', 2850, 'set', '4 weeks', ''],
+    ['RetailFixtures Pro', 'Fixtures', 'Wall system', 185, 'lf', '8 weeks', ''],
+    ['RetailFixtures Pro', 'Fixtures', 'Floor fixture', 725, 'each', '8 weeks', ''],
+    ['RetailFixtures Pro', 'Fixtures', 'Mannequin', 385, 'each', '8 weeks', ''],
+    ['SmartStore Tech', 'Technology', 'POS system (3 terminals)', 12500, 'system', '6 weeks', ''],
+    ['SmartStore Tech', 'Technology', 'Security camera', 875, 'each', '6 weeks', ''],
+    ['SmartStore Tech', 'Technology', 'Digital display', 2150, 'each', '6 weeks', ''],
+    ['BuildSmart Design', 'Design', 'Design fee 3500sqft', 15000, 'project', '4 weeks', ''],
+    ['BuildSmart Design', 'Design', 'Engineering fee', 8500, 'project', '4 weeks', '']
+]
 
-    writer.writerows(pricing_rows)
 
-print(f"  ✓ Created vendor catalog with {len(vendor_data['vendors'])} vendors")
+# The catalog's tabular view is the pricing sheet, so no catalog CSV
+@builder('06_Vendor_Data', 'vendor pricing data', ['vendor_catalog.{json,jsonl,parquet}', 'vendor_pricing.*'])
+def build_vendor_data(out_dir: str, formats: Dict[str, List[str]], **options) -> str:
+    """Vendor catalog and pricing sheet."""
+    vendor_writer = write_records(f'{out_dir}/vendor_catalog', 'vendors', VENDOR_CATALOG['vendors'],
+                                  formats=formats['vendor_catalog'])
+
+    write_records(
+        f'{out_dir}/vendor_pricing', 'pricing',
+        [dict(zip(PRICING_COLUMNS, row)) for row in PRICING_ROWS],
+        formats=formats['vendor_pricing'], columns=PRICING_COLUMNS
+    )
+
+    print(f"  ✓ Created vendor catalog with {vendor_writer.count} vendors")
+    return f'{vendor_writer.count} vendors'
+
 
 # ============================================================================
-# SUMMARY
+# PIPELINE
 # ============================================================================
-print("\n" + "="*60)
-print("STRUCTURED DATA GENERATION COMPLETE")
-print("="*60)
-print(f"\n01_Build_Templates: 2 files (store types, base template)")
-print(f"02_Constraints: 1 file (constraint catalog)")
-print(f"03_Historical_Projects: 2 files ({len(historical_projects)} projects)")
-print(f"04_Regional_Modifiers: 2 files ({len(regional_modifiers['markets'])} markets)")
-print(f"05_Cost_Models: 1 file (detailed cost model)")
-print(f"06_Vendor_Data: 2 files ({len(vendor_data['vendors'])} vendors)")
-print(f"\nReady for budget artifact generation!")
-print("="*60 + "\n")
+
+def generate(folders: Optional[Sequence[str]] = None, base_dir: str = DEFAULT_BASE_DIR,
+             formats: Optional[Sequence[str]] = None, **options) -> Dict[str, Dict]:
+    """
+    Run the builders for some or all folders.
+
+    Args:
+        folders: Folder names (default: all, in order)
+        base_dir: Output root
+        formats: Record formats (default: all available)
+        **options: Builder options (projects, chunk_size)
+
+    Returns:
+        Dict of folder -> {'paths': declared outputs, 'summary': builder summary}
+    """
+    folders = list(folders or BUILDERS)
+    results = {}
+
+    for step, folder in enumerate(folders, 1):
+        spec = BUILDERS[folder]
+        out_dir = f'{base_dir}/{folder}'
+        os.makedirs(out_dir, exist_ok=True)
+
+        print(f"\n[{step}/{len(folders)}] Creating {spec['title']}...")
+        summary = spec['build'](out_dir, record_formats(folder, formats), **options)
+        results[folder] = {'paths': output_paths(folder, formats, base_dir), 'summary': summary}
+
+    return results
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Generate structured data (folders 01-06)')
+    parser.add_argument('--only', action='append', metavar='FOLDER',
+                        help='Regenerate only this folder (name or number, e.g. 04_Regional_Modifiers or 04); '
+                             'repeatable or comma-separated')
+    parser.add_argument('--list', action='store_true', help='List folders and the files they write, then exit')
+    parser.add_argument('--base-dir', default=DEFAULT_BASE_DIR, help=f'Output root (default: {DEFAULT_BASE_DIR})')
+    parser.add_argument('--projects', type=int, default=DEFAULT_PROJECTS,
+                        help=f'Number of historical projects to generate (default: {DEFAULT_PROJECTS})')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Historical projects generated and written per chunk (default: {DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('--formats', default=','.join(available_formats()),
+                        help=f'Comma-separated record formats for folders 03-06 '
+                             f'(default: {",".join(available_formats())})')
+    add_output_arguments(parser)
+    args = parser.parse_args()
+
+    formats = args.formats.split(',')
+    if set(formats) - set(FORMATS):
+        parser.error(f"--formats must be drawn from {', '.join(FORMATS)}")
+    try:
+        folders = resolve_folders(args.only)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.list:
+        for folder in folders:
+            print(f"{folder}: {BUILDERS[folder]['title']}")
+            for path in output_paths(folder, formats, args.base_dir):
+                print(f"  {path}")
+        return
+
+    configure_output(args)
+    if 'parquet' in formats and 'parquet' not in available_formats():
+        print("⚠ pyarrow is not installed, skipping parquet output")
+
+    print("Creating structured data files...")
+
+    results = generate(folders, args.base_dir, formats, projects=args.projects, chunk_size=args.chunk_size)
+
+    # ============================================================================
+    # SUMMARY
+    # ============================================================================
+    print("\n" + "="*60)
+    print("STRUCTURED DATA GENERATION COMPLETE")
+    print("="*60 + "\n")
+    for folder, result in results.items():
+        count = len(result['paths'])
+        print(f"{folder}: {count} file{'s' if count != 1 else ''} ({result['summary']})")
+    print(f"\nReady for budget artifact generation!")
+    print("="*60 + "\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -5,9 +5,14 @@ Teams Conversation Generator
 Generates realistic Teams channel conversations with threaded discussions, reactions,
 and temporal consistency with meeting transcripts.
 
+With a GenerationCache, a thread whose inputs (channel, theme, store, date, participant
+pool, seed) are unchanged since the last cached run and which the channel file still
+holds is skipped: the channel file and the conversation index are left untouched.
+
 Usage:
     python generate_teams_conversations.py --channel construction-vendors --theme supply-chain-delay
     python generate_teams_conversations.py --config teams_config.json
+    python generate_teams_conversations.py --channel construction-vendors --format compact --compress gzip
 """
 
 import argparse
@@ -15,16 +20,26 @@ import json
 import os
 import random
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
-import pandas as pd
+from typing import Dict, List, Any, Optional
+from artifact_io import add_output_arguments, artifact_exists, configure_output, load_json, write_json
+from conversation_index import update_conversation_index
+from generation_cache import content_hash
+from run_context import add_run_arguments, configure_run, get_clock, job_rng
+
+# Bump when thread rendering changes, so cached threads are regenerated
+GENERATOR_VERSION = '1.1'
 
 
 class TeamsConversationGenerator:
     """Generate realistic Teams conversations."""
 
-    def __init__(self, config_dir='config', output_dir='output/07_Conversations'):
+    def __init__(self, config_dir='config', output_dir='output/07_Conversations', seed=None, cache=None):
         self.config_dir = config_dir
         self.output_dir = output_dir
+        self.seed = seed
+        self.cache = cache
+        # Threads requested so far per (channel, theme, store, date); keys each thread's random stream
+        self.occurrences = {}
 
         # Load configuration
         self.personas = self._load_personas()
@@ -79,33 +94,88 @@ class TeamsConversationGenerator:
         channel_file = self._get_channel_file(config['channel_name'])
 
         # Load existing channel or create new
-        if os.path.exists(channel_file):
-            with open(channel_file, 'r') as f:
-                channel_data = json.load(f)
+        if artifact_exists(channel_file):
+            channel_data = load_json(channel_file)
         else:
             channel_data = {
                 'channel': config['channel_name'],
                 'threads': []
             }
 
+        # Hashes of the threads already in the channel, for skipping unchanged cached threads
+        existing = {_thread_hash(thread) for thread in channel_data['threads']} if self.cache is not None else set()
+
         # Generate threads for each theme
+        new_threads = []
         for theme_config in config.get('conversation_themes', []):
-            thread = self._generate_thread(
-                channel_name=config['channel_name'],
-                theme_config=theme_config,
-                participant_pool=config.get('participant_pool', [])
-            )
+            thread = self._render_thread(config['channel_name'], theme_config,
+                                         config.get('participant_pool', []), existing)
+            if thread is None:
+                continue
 
             channel_data['threads'].append(thread)
+            new_threads.append(thread)
 
-        # Save channel
-        self._save_channel(channel_data, config['channel_name'])
+        if new_threads:
+            # Save channel
+            self._save_channel(channel_data, config['channel_name'])
 
-        # Update conversation index
-        self._update_conversation_index(channel_data, config)
+            # Update conversation index
+            self._update_conversation_index(channel_data, new_threads)
 
         return channel_data
 
+    def _render_thread(self, channel_name: str, theme_config: Dict, participant_pool: List[str],
+                       existing: set) -> Optional[Dict]:
+        """
+        Generate one thread, restoring it from the cache when its inputs are unchanged.
+
+        Args:
+            existing: Content hashes of the threads already in the channel
+
+        Returns:
+            The thread to append, or None when the channel already holds it unchanged
+        """
+        # Each thread draws from its own stream keyed by its inputs and how often they
+        # were requested before in this run, not by what the channel file already holds
+        occurrence_key = (channel_name, theme_config['theme'], theme_config.get('store_id'), theme_config['date'])
+        occurrence = self.occurrences.get(occurrence_key, 0)
+        self.occurrences[occurrence_key] = occurrence + 1
+
+        job_key = None
+        if self.cache is not None:
+            job_key = self.cache.job_key(
+                channel=channel_name,
+                theme_config=theme_config,
+                participant_pool=participant_pool,
+                occurrence=occurrence,
+                personas=self.personas,
+                seed=self.seed,
+                version=GENERATOR_VERSION
+            )
+            entry = self.cache.lookup(job_key)
+
+            if entry is not None:
+                if entry['output_hash'] in existing:
+                    self.cache.stats['hits'] += 1
+                    return None
+
+                self.cache.stats['copied'] += 1
+                return json.loads(self.cache.load(entry))
+
+        thread = self._generate_thread(
+            channel_name=channel_name,
+            theme_config=theme_config,
+            participant_pool=participant_pool,
+            rng=job_rng(self.seed, *occurrence_key, occurrence)
+        )
+
+        if job_key is not None:
+            self.cache.store(job_key, f"{channel_name}.json#{thread['thread_id']}", _thread_text(thread))
+            self.cache.stats['misses'] += 1
+
+        return thread
+
     def _get_channel_file(self, channel_name: str) -> str:
         """Get path to channel JSON file."""
         return os.path.join(
@@ -115,13 +185,13 @@ class TeamsConversationGenerator:
         )
 
     def _generate_thread(self, channel_name: str, theme_config: Dict,
-                         participant_pool: List[str]) -> Dict:
+                         participant_pool: List[str], rng=random) -> Dict:
         """Generate a single conversation thread."""
         theme = theme_config['theme']
         theme_template = self.conversation_themes.get(theme, {})
 
         # Generate thread ID
-        thread_id = self._generate_thread_id(channel_name, theme_config['date'])
+        thread_id = self._generate_thread_id(channel_name, theme_config['date'], rng=rng)
 
         # Select participants
         participants = self._select_participants(
@@ -134,7 +204,8 @@ class TeamsConversationGenerator:
             theme=theme,
             theme_config=theme_config,
             participants=participants,
-            message_count=random.randint(*theme_template.get('message_count', (3, 5)))
+            message_count=rng.randint(*theme_template.get('message_count', (3, 5))),
+            rng=rng
         )
 
         # Generate thread metadata
@@ -154,12 +225,12 @@ class TeamsConversationGenerator:
 
         return thread
 
-    def _generate_thread_id(self, channel_name: str, date: str) -> str:
+    def _generate_thread_id(self, channel_name: str, date: str, rng=random) -> str:
         """Generate unique thread ID."""
         # Format: {channel_prefix}_{YYYYMMDD}_{###}
         prefix = ''.join([word[0] for word in channel_name.split('-')])
         date_str = date.replace('-', '')
-        counter = random.randint(1, 999)
+        counter = rng.randint(1, 999)
         return f"{prefix}_{date_str}_{counter:03d}"
 
     def _select_participants(self, required_roles: List[str],
@@ -206,7 +277,7 @@ class TeamsConversationGenerator:
         return None
 
     def _generate_messages(self, theme: str, theme_config: Dict,
-                            participants: List[Dict], message_count: int) -> List[Dict]:
+                            participants: List[Dict], message_count: int, rng=random) -> List[Dict]:
         """Generate messages for thread."""
         messages = []
 
@@ -228,7 +299,7 @@ class TeamsConversationGenerator:
             )
 
             # Generate reactions (more for important messages)
-            reactions = self._generate_reactions(i, message_count)
+            reactions = self._generate_reactions(i, message_count, rng=rng)
 
             # Extract tags
             tags = self._extract_tags_from_message(text, theme_config)
@@ -245,7 +316,7 @@ class TeamsConversationGenerator:
             messages.append(message)
 
             # Increment time (15 minutes to 3 hours between messages)
-            current_time += timedelta(minutes=random.randint(15, 180))
+            current_time += timedelta(minutes=rng.randint(15, 180))
 
         return messages
 
@@ -287,21 +358,21 @@ class TeamsConversationGenerator:
             "Let me follow up on that."
         ])
 
-    def _generate_reactions(self, message_index: int, total_messages: int) -> List[Dict]:
+    def _generate_reactions(self, message_index: int, total_messages: int, rng=random) -> List[Dict]:
         """Generate reactions for a message."""
         # First and last messages get more reactions
         if message_index == 0 or message_index == total_messages - 1:
-            reaction_count = random.randint(3, 5)
+            reaction_count = rng.randint(3, 5)
         else:
-            reaction_count = random.randint(0, 3)
+            reaction_count = rng.randint(0, 3)
 
         emojis = ['👍', '👏', '💡', '😬', '✅', '🙏']
 
         reactions = []
         for _ in range(reaction_count):
             reactions.append({
-                'emoji': random.choice(emojis),
-                'count': random.randint(1, 4)
+                'emoji': rng.choice(emojis),
+                'count': rng.randint(1, 4)
             })
 
         return reactions
@@ -379,7 +450,7 @@ class TeamsConversationGenerator:
         # Extract vendor names
         vendor_pattern = r'([A-Z][a-zA-Z]+ (?:Systems|Solutions|Construction|Master))'
         vendors = re.findall(vendor_pattern, full_text)
-        references['vendors'] = list(set(vendors))
+        references['vendors'] = sorted(set(vendors))
 
         # Add meeting references if theme is followup
         if theme_config.get('theme') == 'site-visit-followup' and theme_config.get('store_id'):
@@ -397,24 +468,27 @@ class TeamsConversationGenerator:
         return references
 
     def _save_channel(self, channel_data: Dict, channel_name: str):
-        """Save channel to JSON file."""
-        filepath = self._get_channel_file(channel_name)
-
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-        with open(filepath, 'w') as f:
-            json.dump(channel_data, f, indent=2)
+        """Save channel to JSON file (layout and compression per the output profile)."""
+        filepath = write_json(channel_data, self._get_channel_file(channel_name))
 
         print(f"✓ Saved channel: {filepath}")
         print(f"  Threads: {len(channel_data['threads'])}")
 
-    def _update_conversation_index(self, channel_data: Dict, config: Dict):
-        """Update conversation index with Teams threads."""
-        index_path = f'{self.output_dir}/metadata/conversation_index.csv'
+    def _update_conversation_index(self, channel_data: Dict, threads: List[Dict]):
+        """
+        Write index rows for newly added threads (replacing any rows for the same thread ids).
 
+        Rows are rebuilt from every channel thread sharing a new thread's filename, so a
+        thread id reused on the same day does not drop the earlier thread's rows.
+        """
+        filenames = {f"{channel_data['channel']}.json#{thread['thread_id']}" for thread in threads}
         entries = []
 
         for thread in channel_data['threads']:
+            filename = f"{channel_data['channel']}.json#{thread['thread_id']}"
+            if filename not in filenames:
+                continue
+
             # Extract stores from references
             stores = thread['references'].get('stores', [])
 
@@ -422,27 +496,28 @@ class TeamsConversationGenerator:
                 entry = {
                     'store_id': store_id,
                     'conversation_type': 'teams_thread',
-                    'filename': f"{channel_data['channel']}.json#{thread['thread_id']}",
+                    'filename': filename,
                     'date': thread['date'],
                     'participants': '|'.join([p['name'] for p in thread['participants']]),
-                    'key_topics': '|'.join(set([tag for msg in thread['messages'] for tag in msg['tags']])),
+                    'key_topics': '|'.join(sorted(set([tag for msg in thread['messages'] for tag in msg['tags']]))),
                     'cost_impact': 0,
                     'timeline_impact': 0
                 }
                 entries.append(entry)
 
         if entries:
-            # Append to CSV
-            if os.path.exists(index_path):
-                df = pd.read_csv(index_path)
-                df = pd.concat([df, pd.DataFrame(entries)], ignore_index=True)
-            else:
-                df = pd.DataFrame(entries)
+            update_conversation_index(self.output_dir, entries)
+            print(f"✓ Updated conversation index ({len(entries)} entries)")
 
-            os.makedirs(os.path.dirname(index_path), exist_ok=True)
-            df.to_csv(index_path, index=False)
 
-            print(f"✓ Updated conversation index ({len(entries)} entries)")
+def _thread_text(thread: Dict) -> str:
+    """JSON of a thread as stored in the generation cache (key order kept, so a restored thread is written as before)."""
+    return json.dumps(thread, ensure_ascii=False)
+
+
+def _thread_hash(thread: Dict) -> str:
+    """Content hash of a thread, comparable with its cache entry's output_hash."""
+    return content_hash(_thread_text(thread))
 
 
 def main():
@@ -453,8 +528,12 @@ def main():
     parser.add_argument('--theme', help='Conversation theme')
     parser.add_argument('--store-id', help='Store ID')
     parser.add_argument('--date', help='Conversation date (YYYY-MM-DD)')
+    add_run_arguments(parser)
+    add_output_arguments(parser)
 
     args = parser.parse_args()
+    seed = configure_run(args)
+    configure_output(args)
 
     # Load config
     if args.config:
@@ -468,13 +547,13 @@ def main():
                 {
                     'theme': args.theme or 'supply-chain-delay',
                     'store_id': args.store_id or 'Store-217',
-                    'date': args.date or datetime.now().strftime('%Y-%m-%d')
+                    'date': args.date or get_clock().today()
                 }
             ]
         }
 
     # Generate conversations
-    generator = TeamsConversationGenerator()
+    generator = TeamsConversationGenerator(seed=seed)
     result = generator.generate_conversations(config)
 
     print(f"\n✓ Generated {len(result['threads'])} threads for channel: {result['channel']}")
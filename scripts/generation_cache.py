@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Content-Addressed Generation Cache
+
+Remembers which generation jobs have already been rendered so reruns only redo
+jobs whose inputs changed. A job key is the SHA-256 of its canonicalized inputs
+(template content, configuration, resolved context, seed, generator version);
+rendered outputs are stored by their own SHA-256 under objects/ and the manifest
+maps job key -> output key + output hash.
+
+Layout:
+    <cache_dir>/manifest.json
+    <cache_dir>/objects/ab/abcdef...   rendered output bodies
+
+Usage:
+    cache = GenerationCache('output/.generation_cache')
+    key = cache.job_key(template=template_text, config=config, context=context, seed=seed, version='2.1')
+    entry = cache.lookup(key)
+    ...
+    cache.store(key, output_key, transcript)
+    cache.save()
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, Optional
+
+MANIFEST_VERSION = 1
+
+
+def content_hash(text) -> str:
+    """SHA-256 hex digest of text or bytes."""
+    if isinstance(text, str):
+        text = text.encode('utf-8')
+    return hashlib.sha256(text).hexdigest()
+
+
+class GenerationCache:
+    """Job-key -> output manifest backed by a content-addressed object store."""
+
+    def __init__(self, cache_dir: str = 'output/.generation_cache'):
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, 'objects')
+        self.manifest_path = os.path.join(cache_dir, 'manifest.json')
+        self.manifest = self._load_manifest()
+        self.stats = {'hits': 0, 'copied': 0, 'misses': 0}
+        # Entries stored since the last drain(), for handing back from worker processes
+        self.added = {}
+
+    def _load_manifest(self) -> Dict:
+        """Load the manifest, starting fresh if missing or from another version."""
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r') as f:
+                manifest = json.load(f)
+            if manifest.get('version') == MANIFEST_VERSION:
+                return manifest
+
+        return {'version': MANIFEST_VERSION, 'jobs': {}}
+
+    def job_key(self, **inputs) -> str:
+        """Hash the canonical JSON form of all job inputs."""
+        canonical = json.dumps(inputs, sort_keys=True, separators=(',', ':'), default=str)
+        return content_hash(canonical)
+
+    def lookup(self, job_key: str) -> Optional[Dict]:
+        """Return the manifest entry for a job, if its output is still in the object store."""
+        entry = self.manifest['jobs'].get(job_key)
+        if entry and os.path.exists(self._object_path(entry['output_hash'])):
+            return entry
+        return None
+
+    def _object_path(self, output_hash: str) -> str:
+        """Path of a stored output body."""
+        return os.path.join(self.objects_dir, output_hash[:2], output_hash)
+
+    def load(self, entry: Dict) -> str:
+        """Read a cached output body."""
+        with open(self._object_path(entry['output_hash']), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def store(self, job_key: str, output_key: str, text: str) -> Dict:
+        """Record a freshly rendered output for a job."""
+        output_hash = content_hash(text)
+        path = self._object_path(output_hash)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Write-then-rename: parallel workers may store the same object at once
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(text)
+            os.replace(tmp_path, path)
+
+        entry = {'output_key': output_key, 'output_hash': output_hash}
+        self.manifest['jobs'][job_key] = entry
+        self.added[job_key] = entry
+        return entry
+
+    def drain(self) -> Dict:
+        """Return and reset the entries and stats recorded since the last drain."""
+        delta = {'jobs': self.added, 'stats': self.stats}
+        self.added = {}
+        self.stats = {'hits': 0, 'copied': 0, 'misses': 0}
+        return delta
+
+    def absorb(self, delta: Dict):
+        """Merge a drain() result from another process into this cache."""
+        self.manifest['jobs'].update(delta['jobs'])
+        self.added.update(delta['jobs'])
+        for name, count in delta['stats'].items():
+            self.stats[name] += count
+
+    def save(self):
+        """Atomically write the manifest."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self.manifest_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.manifest, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.manifest_path)
+
+    def summary(self) -> str:
+        """One-line hit/miss summary."""
+        return (f"{self.stats['hits']} unchanged, {self.stats['copied']} restored from cache, "
+                f"{self.stats['misses']} rendered")
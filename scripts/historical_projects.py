@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+"""
+Historical Project Generator
+
+Vectorized generator for the 03_Historical_Projects dataset. All N projects are drawn
+at once with NumPy from counter-based random streams:
+
+- each project has its own Philox4x32-10 stream keyed by (project id, seed); draw k
+  of a project is block k // 4 of its stream, so it never depends on other projects
+- any single project, or any slice of projects, can be regenerated on its own and
+  the values are identical however the run is chunked
+- store types are laid out in contiguous blocks proportional to the classic mix
+  (160 projects: 80 suburban_standard, 20 urban_flagship, 30 express_compact,
+  25 remodel_refresh, 5 prototype_innovation), starting at Store-50
+
+Large datasets are written chunk by chunk (CSV, JSON and a JSONL equivalent) so
+memory stays flat regardless of N, and read_projects() streams them back the same way.
+
+Usage:
+    projects = generate_projects(160)                       # DataFrame, CSV columns
+    chunk = generate_projects(1_000_000, start=500_000, count=10_000)
+    records = project_records(projects)                     # nested dicts for JSON
+
+    write_projects(1_000_000, 'output/projects', formats=['csv', 'jsonl'])
+    for chunk in read_projects('projects.jsonl', chunksize=50_000):
+        ...
+
+    python historical_projects.py --projects 160 --show Store-75
+"""
+
+import argparse
+import json
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from artifact_io import add_output_arguments, configure_output, open_artifact
+from record_writer import RecordWriter
+
+FIRST_PROJECT_ID = 50
+DEFAULT_SEED = 0
+DEFAULT_CHUNK_SIZE = 50_000
+
+# (store_type, square_footage, projects per 160)
+STORE_TYPE_MIX = [
+    ("suburban_standard", 3500, 80),  # Most common
+    ("urban_flagship", 5000, 20),
+    ("express_compact", 2000, 30),
+    ("remodel_refresh", 3500, 25),
+    ("prototype_innovation", 4000, 5)
+]
+
+# Base costs per sqft by store type
+BASE_COST_PSF = {
+    "suburban_standard": 185,
+    "urban_flagship": 285,
+    "express_compact": 145,
+    "remodel_refresh": 95,
+    "prototype_innovation": 325
+}
+
+# Break down by category (share of total cost)
+CATEGORY_SHARES = {
+    "construction": 0.35,
+    "electrical": 0.12,
+    "hvac": 0.08,
+    "plumbing": 0.05,
+    "fixtures": 0.25,
+    "technology": 0.08,
+    "soft_costs": 0.07
+}
+
+MARKETS = ["Columbus", "Cincinnati", "Cleveland", "Indianapolis", "Louisville", "Pittsburgh", "Detroit"]
+
+CSV_COLUMNS = ['store_id', 'store_type', 'square_footage', 'market', 'completion_date',
+               'total_cost', 'cost_per_sqft'] + list(CATEGORY_SHARES) + ['timeline_days', 'variance_from_budget']
+
+# Draw slots within each project's stream (two Philox blocks)
+DRAW_VARIATION, DRAW_MARKET, DRAW_MONTH, DRAW_DAY, DRAW_TIMELINE, DRAW_VARIANCE, DRAW_SCHEDULE, DRAW_VENDOR = range(8)
+DRAWS_PER_PROJECT = 8
+
+# Philox4x32-10 constants (Salmon et al., "Parallel random numbers: as easy as 1, 2, 3")
+PHILOX_M0 = np.uint64(0xD2511F53)
+PHILOX_M1 = np.uint64(0xCD9E8D57)
+PHILOX_W0 = np.uint32(0x9E3779B9)
+PHILOX_W1 = np.uint32(0xBB67AE85)
+PHILOX_ROUNDS = 10
+MASK32 = np.uint64(0xFFFFFFFF)
+
+
+def philox4x32(counter: np.ndarray, key: np.ndarray) -> np.ndarray:
+    """
+    Philox4x32-10 block function, vectorized over rows.
+
+    Args:
+        counter: (n, 4) uint32 counters
+        key: (n, 2) uint32 keys
+
+    Returns:
+        (n, 4) uint32 random words
+    """
+    c0, c1, c2, c3 = (counter[:, i].astype(np.uint32) for i in range(4))
+    k0, k1 = key[:, 0].astype(np.uint32), key[:, 1].astype(np.uint32)
+
+    with np.errstate(over='ignore'):
+        for round_no in range(PHILOX_ROUNDS):
+            p0 = c0.astype(np.uint64) * PHILOX_M0
+            p1 = c2.astype(np.uint64) * PHILOX_M1
+            hi0, lo0 = (p0 >> np.uint64(32)).astype(np.uint32), (p0 & MASK32).astype(np.uint32)
+            hi1, lo1 = (p1 >> np.uint64(32)).astype(np.uint32), (p1 & MASK32).astype(np.uint32)
+
+            c0, c1, c2, c3 = hi1 ^ c1 ^ k0, lo1, hi0 ^ c3 ^ k1, lo0
+
+            if round_no < PHILOX_ROUNDS - 1:
+                k0 = k0 + PHILOX_W0
+                k1 = k1 + PHILOX_W1
+
+    return np.stack([c0, c1, c2, c3], axis=1)
+
+
+def project_uniforms(project_ids: np.ndarray, seed: int = DEFAULT_SEED,
+                     draws: int = DRAWS_PER_PROJECT) -> np.ndarray:
+    """
+    Uniform (0, 1) draws from each project's own stream.
+
+    Returns:
+        (n, draws) float64 array; row i depends only on project_ids[i] and seed
+    """
+    project_ids = np.asarray(project_ids, dtype=np.uint64)
+    n = len(project_ids)
+    key = np.stack([(project_ids & MASK32).astype(np.uint32),
+                    (project_ids >> np.uint64(32)).astype(np.uint32)], axis=1)
+
+    blocks = []
+    for block in range((draws + 3) // 4):
+        counter = np.zeros((n, 4), dtype=np.uint32)
+        counter[:, 0] = block
+        counter[:, 2] = seed & 0xFFFFFFFF
+        counter[:, 3] = (seed >> 32) & 0xFFFFFFFF
+        blocks.append(philox4x32(counter, key))
+
+    words = np.concatenate(blocks, axis=1)[:, :draws]
+    return (words.astype(np.float64) + 0.5) / 2.0 ** 32
+
+
+def _randint(u: np.ndarray, low: int, high: int) -> np.ndarray:
+    """Map uniforms to integers in [low, high]."""
+    return low + np.floor(u * (high - low + 1)).astype(np.int64)
+
+
+def store_type_counts(total: int) -> List[int]:
+    """Projects per store type for a dataset of `total` projects (largest remainder)."""
+    weights = np.array([count for _, _, count in STORE_TYPE_MIX], dtype=np.float64)
+    exact = weights / weights.sum() * total
+    counts = np.floor(exact).astype(np.int64)
+    remainder = total - counts.sum()
+    counts[np.argsort(-(exact - counts), kind='stable')[:remainder]] += 1
+    return counts.tolist()
+
+
+def generate_projects(total: int, start: int = 0, count: Optional[int] = None,
+                      seed: int = DEFAULT_SEED) -> pd.DataFrame:
+    """
+    Generate projects [start, start + count) of a `total`-project dataset.
+
+    Returns:
+        DataFrame with CSV_COLUMNS plus the two lessons_learned flags
+    """
+    count = total - start if count is None else min(count, total - start)
+    positions = np.arange(start, start + count, dtype=np.int64)
+    project_ids = FIRST_PROJECT_ID + positions
+
+    # Store type and size from the block layout
+    bounds = np.cumsum(store_type_counts(total))
+    type_index = np.searchsorted(bounds, positions, side='right')
+    type_names = np.array([name for name, _, _ in STORE_TYPE_MIX], dtype=object)
+    sqft = np.array([size for _, size, _ in STORE_TYPE_MIX], dtype=np.int64)[type_index]
+    base_psf = np.array([BASE_COST_PSF[name] for name, _, _ in STORE_TYPE_MIX], dtype=np.float64)[type_index]
+
+    u = project_uniforms(project_ids, seed)
+
+    # Cost with +/- 15% variation
+    variation = 0.85 + 0.30 * u[:, DRAW_VARIATION]
+    total_cost = np.floor(base_psf * sqft * variation).astype(np.int64)
+
+    month = _randint(u[:, DRAW_MONTH], 1, 12)
+    day = _randint(u[:, DRAW_DAY], 1, 28)
+    completion = pd.to_datetime({'year': np.full(count, 2024), 'month': month, 'day': day})
+
+    projects = pd.DataFrame({
+        'store_id': 'Store-' + pd.Series(project_ids).astype(str),
+        'store_type': type_names[type_index],
+        'square_footage': sqft,
+        'market': np.array(MARKETS, dtype=object)[_randint(u[:, DRAW_MARKET], 0, len(MARKETS) - 1)],
+        'completion_date': completion.dt.strftime('%Y-%m-%d'),
+        'total_cost': total_cost,
+        'cost_per_sqft': np.round(total_cost / sqft, 2)
+    })
+    for category, share in CATEGORY_SHARES.items():
+        projects[category] = np.floor(total_cost * share).astype(np.int64)
+
+    projects['timeline_days'] = _randint(u[:, DRAW_TIMELINE], 60, 120)
+    projects['variance_from_budget'] = _randint(u[:, DRAW_VARIANCE], -5, 10)  # percentage
+    projects['on_schedule'] = u[:, DRAW_SCHEDULE] > 0.3
+    projects['vendor_ok'] = u[:, DRAW_VENDOR] > 0.2
+
+    return projects
+
+
+def project_records(projects: pd.DataFrame) -> List[Dict]:
+    """Nested project dicts in the historical_projects.json layout."""
+    records = []
+    categories = list(CATEGORY_SHARES)
+
+    for row in projects.itertuples(index=False):
+        values = row._asdict()
+        records.append({
+            "store_id": values['store_id'],
+            "store_type": values['store_type'],
+            "square_footage": int(values['square_footage']),
+            "market": values['market'],
+            "completion_date": values['completion_date'],
+            "total_cost": int(values['total_cost']),
+            "cost_per_sqft": float(values['cost_per_sqft']),
+            "categories": {name: int(values[name]) for name in categories},
+            "timeline_days": int(values['timeline_days']),
+            "variance_from_budget": int(values['variance_from_budget']),
+            "lessons_learned": [
+                "Completed on schedule" if values['on_schedule'] else "Delayed by permit issues",
+                "Vendor performance good" if values['vendor_ok'] else "Vendor substitution required"
+            ]
+        })
+
+    return records
+
+
+def write_projects(total: int, stem: str, formats: Optional[Sequence[str]] = None,
+                   chunk_size: int = DEFAULT_CHUNK_SIZE, seed: int = DEFAULT_SEED,
+                   on_chunk: Optional[Callable[[pd.DataFrame], None]] = None) -> RecordWriter:
+    """
+    Generate a `total`-project dataset chunk by chunk and write each chunk to
+    <stem>.csv/.json/.jsonl/.parquet. Only one chunk is held in memory at a time.
+
+    Args:
+        on_chunk: Called with each generated chunk (e.g. ProjectAggregator.add)
+
+    Returns:
+        The closed RecordWriter (paths, count)
+    """
+    with RecordWriter(stem, 'projects', formats=formats, columns=CSV_COLUMNS) as writer:
+        for start in range(0, total, chunk_size):
+            chunk = generate_projects(total, start=start, count=chunk_size, seed=seed)
+            writer.write(project_records(chunk), table=chunk)
+            if on_chunk is not None:
+                on_chunk(chunk)
+
+    return writer
+
+
+def read_projects(path: str, chunksize: int = DEFAULT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """
+    Stream a projects CSV or JSONL file back as DataFrames of up to `chunksize` rows.
+
+    JSONL records are flattened like pd.json_normalize (categories.construction, ...),
+    with lessons_learned kept as a list. Compressed variants (.gz/.zst) are read too.
+    """
+    with open_artifact(path) as f:
+        if path.endswith('.csv'):
+            yield from pd.read_csv(f, chunksize=chunksize)
+            return
+
+        while True:
+            lines = list(islice(f, chunksize))
+            if not lines:
+                return
+            yield pd.json_normalize([json.loads(line) for line in lines])
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Generate historical projects')
+    parser.add_argument('--projects', type=int, default=160, help='Dataset size (default: 160)')
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='Stream seed (default: 0)')
+    parser.add_argument('--show', help='Print one project (e.g. Store-75), regenerated on its own')
+    parser.add_argument('--output', help='Write <OUTPUT>.csv/.json/.jsonl(/.parquet) in chunks instead of a summary')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help=f'Projects per chunk when writing (default: {DEFAULT_CHUNK_SIZE})')
+    add_output_arguments(parser)
+
+    args = parser.parse_args()
+    configure_output(args)
+
+    if args.show:
+        position = int(args.show.split('-')[-1]) - FIRST_PROJECT_ID
+        if not 0 <= position < args.projects:
+            parser.error(f"{args.show} is not in a {args.projects}-project dataset")
+        project = project_records(generate_projects(args.projects, start=position, count=1, seed=args.seed))[0]
+        print(json.dumps(project, indent=2))
+        return
+
+    if args.output:
+        writer = write_projects(args.projects, args.output, chunk_size=args.chunk_size, seed=args.seed)
+        print(f"✓ Wrote {writer.count} projects to {', '.join(writer.paths.values())}")
+        return
+
+    projects = generate_projects(args.projects, seed=args.seed)
+    print(projects.groupby('store_type', sort=False).agg(
+        projects=('store_id', 'size'), mean_cost=('total_cost', 'mean')
+    ).round(0).to_string())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,399 @@
+#!/usr/bin/env python3
+"""
+Transcript Output Sinks
+
+Pluggable destinations for generated transcripts. Generators write every transcript
+under a logical key that mirrors the classic directory layout
+(e.g. 'meeting_transcripts/site_visit_debrief/site_visit_debrief_Store-201_2025-03-01.txt')
+and the sink decides how it is physically stored:
+
+- directory: one .txt file per transcript (the original layout)
+- gzip:      one .txt.gz file per transcript
+- tar / zip: rolling shard files holding many transcripts each
+- archive:   append-only shards with an offset index (see transcript_archive.py)
+- memory:    an in-process dict, for tests and benchmarks
+
+Long transcripts can be streamed instead of built in memory: open() returns a
+writer that accepts text incrementally and commits it on close.
+
+Usage:
+    sink = create_sink('tar', 'output/07_Conversations', max_items=5000)
+    sink.write(transcript_key('design_review', filename), transcript)
+
+    with sink.open(transcript_key('design_review', filename)) as out:
+        out.write_lines(lines)
+    print(out.location)
+
+    sink.close()
+"""
+
+import gzip
+import io
+import os
+import tarfile
+import tempfile
+import zipfile
+from typing import Dict, Optional
+
+from run_context import get_clock
+
+
+def transcript_key(meeting_type: str, filename: str) -> str:
+    """Build the logical key for a meeting transcript."""
+    return f"meeting_transcripts/{meeting_type}/{filename}"
+
+
+class StreamWriter:
+    """Incremental writer returned by OutputSink.open(); the entry is committed on close."""
+
+    def __init__(self, fileobj, finish):
+        self.fileobj = fileobj
+        self._finish = finish
+        self.location = None
+
+    def write(self, text: str):
+        """Append text to the entry."""
+        self.fileobj.write(text)
+
+    def write_lines(self, lines):
+        """Append lines joined by newlines (no trailing newline), like '\\n'.join(lines)."""
+        first = True
+        for line in lines:
+            if not first:
+                self.fileobj.write('\n')
+            self.fileobj.write(line)
+            first = False
+
+    def close(self) -> str:
+        """Commit the entry and return its physical location."""
+        if self.location is None:
+            self.location = self._finish()
+        return self.location
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class OutputSink:
+    """Base class for transcript destinations."""
+
+    kind = 'base'
+
+    def write(self, key: str, text: str) -> str:
+        """Store text under a logical key and return its physical location."""
+        raise NotImplementedError
+
+    def open(self, key: str) -> StreamWriter:
+        """Open a streaming writer for a key (buffers in memory unless the sink can stream)."""
+        buffer = io.StringIO()
+        return StreamWriter(buffer, lambda: self.write(key, buffer.getvalue()))
+
+    def read(self, key: str) -> Optional[str]:
+        """Return previously written text for a key, or None if the sink cannot tell."""
+        return None
+
+    def sync(self):
+        """Force everything written so far to stable storage."""
+
+    def close(self):
+        """Flush and release any open resources."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class DirectorySink(OutputSink):
+    """Write each transcript to its own file under a root directory."""
+
+    kind = 'directory'
+
+    def __init__(self, root: str):
+        self.root = root
+        self._created_dirs = set()
+        self._unsynced = []
+
+    def _path(self, key: str) -> str:
+        """Map a logical key to a file path."""
+        return os.path.join(self.root, *key.split('/'))
+
+    def _ensure_dir(self, path: str):
+        """Create the parent directory once per run instead of once per file."""
+        directory = os.path.dirname(path)
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+
+    def write(self, key: str, text: str) -> str:
+        path = self._path(key)
+        self._ensure_dir(path)
+
+        with open(path, 'w') as f:
+            f.write(text)
+
+        self._unsynced.append(path)
+        return path
+
+    def open(self, key: str) -> StreamWriter:
+        path = self._path(key)
+        self._ensure_dir(path)
+        f = open(path, 'w')
+
+        def finish():
+            f.close()
+            self._unsynced.append(path)
+            return path
+
+        return StreamWriter(f, finish)
+
+    def sync(self):
+        """fsync files written since the last sync, then their directories."""
+        paths, self._unsynced = self._unsynced, []
+        for path in paths + sorted({os.path.dirname(p) for p in paths}):
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def read(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+
+        with open(path, 'r') as f:
+            return f.read()
+
+
+class GzipSink(DirectorySink):
+    """Write each transcript as a gzip-compressed file (<key>.gz)."""
+
+    kind = 'gzip'
+
+    def __init__(self, root: str, compresslevel: int = 6):
+        super().__init__(root)
+        self.compresslevel = compresslevel
+
+    def _path(self, key: str) -> str:
+        return super()._path(key) + '.gz'
+
+    def write(self, key: str, text: str) -> str:
+        path = self._path(key)
+        self._ensure_dir(path)
+
+        with self.open(key) as out:
+            out.write(text)
+
+        return path
+
+    def open(self, key: str) -> StreamWriter:
+        path = self._path(key)
+        self._ensure_dir(path)
+
+        # Stamp the gzip header with the run clock so reruns are byte-identical
+        raw = open(path, 'wb')
+        compressed = gzip.GzipFile(filename='', fileobj=raw, mode='wb', compresslevel=self.compresslevel,
+                                   mtime=get_clock().timestamp())
+        text = io.TextIOWrapper(compressed, encoding='utf-8', newline='')
+
+        def finish():
+            text.close()
+            raw.close()
+            self._unsynced.append(path)
+            return path
+
+        return StreamWriter(text, finish)
+
+    def read(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+
+        with gzip.open(path, 'rt') as f:
+            return f.read()
+
+
+class ShardSink(OutputSink):
+    """
+    Append transcripts to rolling tar or zip shards.
+
+    A new shard is started once the current one holds max_items members or
+    max_bytes of uncompressed content. Shards are named
+    <root>/shards/<prefix>-00000.<fmt>, <prefix>-00001.<fmt>, ...
+    and member names are the logical keys.
+    """
+
+    FORMATS = ('tar', 'zip')
+
+    def __init__(self, root: str, fmt: str = 'tar', prefix: str = 'transcripts',
+                 max_items: int = 10000, max_bytes: int = 256 * 1024 * 1024):
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Unsupported shard format: {fmt}")
+
+        self.kind = fmt
+        self.root = root
+        self.fmt = fmt
+        self.prefix = prefix
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+
+        self.clock = get_clock()
+        self.shard_dir = os.path.join(root, 'shards')
+        self.shard_index = self._next_shard_index()
+        self._archive = None
+        self._path = None
+        self._items = 0
+        self._bytes = 0
+
+    def _next_shard_index(self) -> int:
+        """Continue numbering after the highest shard left by a previous run (gaps are not reused)."""
+        if not os.path.isdir(self.shard_dir):
+            return 0
+
+        head, tail = f'{self.prefix}-', f'.{self.fmt}'
+        indices = [
+            int(name[len(head):-len(tail)]) for name in os.listdir(self.shard_dir)
+            if name.startswith(head) and name.endswith(tail) and name[len(head):-len(tail)].isdigit()
+        ]
+        return max(indices) + 1 if indices else 0
+
+    def _open_shard(self):
+        """Start a new shard file."""
+        os.makedirs(self.shard_dir, exist_ok=True)
+        self._path = os.path.join(self.shard_dir, f'{self.prefix}-{self.shard_index:05d}.{self.fmt}')
+
+        if self.fmt == 'tar':
+            self._archive = tarfile.open(self._path, 'w')
+        else:
+            self._archive = zipfile.ZipFile(self._path, 'w', compression=zipfile.ZIP_DEFLATED)
+
+        self._items = 0
+        self._bytes = 0
+
+    def _close_shard(self):
+        """Finalize the current shard and advance the shard counter."""
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+            self.shard_index += 1
+
+    def _reserve(self, size: int):
+        """Roll to a new shard if the next member would overflow the current one."""
+        if self._archive is not None and (
+                self._items >= self.max_items or self._bytes + size > self.max_bytes):
+            self._close_shard()
+
+        if self._archive is None:
+            self._open_shard()
+
+    def _add_tar_member(self, key: str, fileobj, size: int):
+        """Append a tar member read from fileobj."""
+        info = tarfile.TarInfo(name=key)
+        info.size = size
+        info.mtime = self.clock.timestamp()
+        self._archive.addfile(info, fileobj)
+
+    def _zip_info(self, key: str) -> zipfile.ZipInfo:
+        """Zip member header stamped with the run clock."""
+        info = zipfile.ZipInfo(key, date_time=self.clock.zip_date_time())
+        info.compress_type = zipfile.ZIP_DEFLATED
+        return info
+
+    def write(self, key: str, text: str) -> str:
+        data = text.encode('utf-8')
+        self._reserve(len(data))
+
+        if self.fmt == 'tar':
+            self._add_tar_member(key, io.BytesIO(data), len(data))
+        else:
+            self._archive.writestr(self._zip_info(key), data)
+
+        self._items += 1
+        self._bytes += len(data)
+
+        return f"{self._path}:{key}"
+
+    def open(self, key: str) -> StreamWriter:
+        # The final size is unknown, so only the item limit can trigger a roll up front
+        self._reserve(0)
+        path = self._path
+
+        if self.fmt == 'zip':
+            member = self._archive.open(self._zip_info(key), 'w', force_zip64=True)
+            text = io.TextIOWrapper(member, encoding='utf-8', newline='')
+
+            def finish():
+                text.close()
+                self._items += 1
+                self._bytes += self._archive.getinfo(key).file_size
+                return f"{path}:{key}"
+
+            return StreamWriter(text, finish)
+
+        # Tar headers carry the member size, so spool (to disk past 8 MB) and append on close
+        spool = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+        text = io.TextIOWrapper(spool, encoding='utf-8', newline='')
+
+        def finish():
+            text.flush()
+            size = spool.tell()
+            spool.seek(0)
+            self._add_tar_member(key, spool, size)
+            text.close()
+            self._items += 1
+            self._bytes += size
+            return f"{path}:{key}"
+
+        return StreamWriter(text, finish)
+
+    def sync(self):
+        if self._archive is not None:
+            fileobj = self._archive.fileobj if self.fmt == 'tar' else self._archive.fp
+            fileobj.flush()
+            os.fsync(fileobj.fileno())
+
+    def close(self):
+        self._close_shard()
+
+
+class MemorySink(OutputSink):
+    """Keep transcripts in a dict keyed by logical key."""
+
+    kind = 'memory'
+
+    def __init__(self):
+        self.files: Dict[str, str] = {}
+
+    def write(self, key: str, text: str) -> str:
+        self.files[key] = text
+        return f"memory://{key}"
+
+    def read(self, key: str) -> Optional[str]:
+        return self.files.get(key)
+
+
+SINK_KINDS = ('directory', 'gzip', 'tar', 'zip', 'archive', 'memory')
+
+
+def create_sink(kind: str, root: Optional[str] = None, **options) -> OutputSink:
+    """Create an output sink by name."""
+    if kind == 'directory':
+        return DirectorySink(root)
+    if kind == 'gzip':
+        return GzipSink(root, **options)
+    if kind in ('tar', 'zip'):
+        return ShardSink(root, fmt=kind, **options)
+    if kind == 'archive':
+        from transcript_archive import ArchiveSink
+        return ArchiveSink(os.path.join(root, 'archive'), **options)
+    if kind == 'memory':
+        return MemorySink()
+
+    raise ValueError(f"Unknown sink kind: {kind} (expected one of {', '.join(SINK_KINDS)})")
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Parallel Meeting Generation
+
+Runs a list of meeting jobs (meeting type + config) for the phase runners, either
+serially, across N worker processes, or through the write-behind pipeline
+(rendering in an executor, writes batched behind a bounded queue; see write_pipeline).
+
+- Every job has a sequence number (its position in the serial job list).
+- Each worker renders transcripts straight to the output directory and appends
+  its index rows and errors, tagged with the job sequence, to its own shard files.
+- After all jobs finish the shards are merged in sequence order and written to
+  conversation_index.csv in one write, so the index and error list match a serial run.
+- New generation-cache entries and run metrics are handed back to the parent.
+
+Transcripts only depend on the job (per-job random streams, see run_context), so
+with --seed the parallel output is byte-identical to the serial output.
+
+Usage:
+    jobs = [meeting_job('site_visit_debrief', config, 'Site visit Store-101', 'Store-101'), ...]
+    sections = [('Generating 50 site visit debriefs...', jobs), ...]
+    for result in run_meeting_jobs(generator, sections, workers=4):   # or pipeline=True
+        if result['error']: ...
+"""
+
+import glob
+import json
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import pandas as pd
+
+from generate_meeting_transcripts_v2 import EnhancedMeetingGenerator
+from generation_cache import GenerationCache
+from output_sinks import DirectorySink
+from run_context import set_clock
+from run_metrics import RunMetrics
+from write_pipeline import WriteBehindPipeline
+
+SHARD_DIRNAME = 'index_shards'
+
+# Per-process state, set up once by _init_worker
+_worker = {}
+
+
+def meeting_job(meeting_type: str, config: Dict, label: str, store_id: Optional[str] = None) -> Dict:
+    """One transcript to render; label prefixes its error message, store_id counts towards coverage."""
+    return {'meeting_type': meeting_type, 'config': config, 'label': label, 'store_id': store_id}
+
+
+def run_meeting_jobs(generator: EnhancedMeetingGenerator, sections: List, workers: int = 1,
+                     pipeline: bool = False) -> List[Dict]:
+    """
+    Run (heading, jobs) sections in order.
+
+    Returns:
+        One {'job', 'error'} result per job, in serial job order
+    """
+    jobs = [job for _, section_jobs in sections for job in section_jobs]
+
+    if pipeline and workers > 1:
+        raise ValueError("Choose either worker processes or the write-behind pipeline, not both")
+
+    if pipeline:
+        errors = _run_pipelined(generator, sections, jobs)
+    elif workers > 1 and len(jobs) > 1:
+        errors = _run_parallel(generator, sections, jobs, workers)
+    else:
+        errors = _run_serial(generator, sections)
+
+    print(f"✓ Updated conversation index ({len(jobs) - len(errors)} rows)")
+    return [{'job': job, 'error': errors.get(seq)} for seq, job in enumerate(jobs)]
+
+
+def _run_serial(generator: EnhancedMeetingGenerator, sections: List) -> Dict[int, str]:
+    """Render jobs in the calling process, writing the index once at the end."""
+    errors = {}
+    seq = 0
+    deferred = generator.defer_index
+    generator.defer_index = True
+
+    try:
+        for n, (heading, section_jobs) in enumerate(sections, 1):
+            prefix = '' if n == 1 else '\n'
+            print(f"{prefix}[{n}/{len(sections)}] {heading}")
+            for job in section_jobs:
+                try:
+                    generator.generate_transcript(job['meeting_type'], job['config'])
+                except Exception as e:
+                    errors[seq] = f"{job['label']}: {str(e)}"
+                seq += 1
+    finally:
+        generator.flush_index()
+        generator.defer_index = deferred
+
+    return errors
+
+
+def _run_pipelined(generator: EnhancedMeetingGenerator, sections: List, jobs: List[Dict]) -> Dict[int, str]:
+    """Render jobs in an executor while a writer task stores finished transcripts."""
+    if generator.stream:
+        raise ValueError("The write-behind pipeline needs whole transcripts; it cannot be combined with streaming")
+
+    for n, (heading, _) in enumerate(sections, 1):
+        print(f"[{n}/{len(sections)}] {heading}")
+    print(f"\nRendering {len(jobs)} meetings with write-behind I/O...")
+
+    def render(job):
+        with generator.metrics.job(job['meeting_type']):
+            rendered = generator.render_transcript(job['meeting_type'], job['config'])
+        if rendered['cached'] == 'skipped':
+            return None
+        return {'key': rendered['key'], 'text': rendered['transcript'], 'index_entry': rendered['index_entry']}
+
+    writer = WriteBehindPipeline(generator.sink, metrics=generator.metrics)
+    results = writer.run(jobs, render)
+    print(f"✓ Transcripts: {writer.summary()}")
+
+    errors = {}
+    entries = []
+    for seq, result in enumerate(results):
+        if result['error'] is not None:
+            errors[seq] = f"{jobs[seq]['label']}: {str(result['error'])}"
+        elif result['artifact'] is not None:
+            entries.append(result['artifact']['index_entry'])
+
+    generator.flush_index(entries)
+    return errors
+
+
+def _run_parallel(generator: EnhancedMeetingGenerator, sections: List, jobs: List[Dict],
+                  workers: int) -> Dict[int, str]:
+    """Render jobs across worker processes and merge their shards."""
+    if not isinstance(generator.sink, DirectorySink):
+        raise ValueError("Parallel generation needs a directory sink (archive sinks have a single writer)")
+
+    for n, (heading, _) in enumerate(sections, 1):
+        print(f"[{n}/{len(sections)}] {heading}")
+    print(f"\nRendering {len(jobs)} meetings across {workers} worker processes...")
+
+    shard_dir = os.path.join(generator.output_dir, 'metadata', SHARD_DIRNAME)
+    if os.path.exists(shard_dir):
+        shutil.rmtree(shard_dir)
+    os.makedirs(shard_dir)
+
+    settings = {
+        'config_dir': generator.config_dir,
+        'templates_dir': generator.templates_dir,
+        'output_dir': generator.output_dir,
+        'sink_root': generator.sink.root,
+        'seed': generator.seed,
+        'stream': generator.stream,
+        'cache_dir': generator.cache.cache_dir if generator.cache is not None else None,
+        'metrics': generator.metrics.enabled
+    }
+    initargs = (settings, generator.clock, generator.context_table, shard_dir)
+    chunksize = max(1, len(jobs) // (workers * 4))
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=initargs) as pool:
+        for delta in pool.map(_run_job, enumerate(jobs), chunksize=chunksize):
+            if delta['cache'] is not None:
+                generator.cache.absorb(delta['cache'])
+            if delta['metrics'] is not None:
+                generator.metrics.absorb(delta['metrics'])
+
+    return _merge_shards(generator, shard_dir)
+
+
+def _init_worker(settings: Dict, clock, context_table, shard_dir: str):
+    """Build this worker's generator and shard paths."""
+    set_clock(clock)
+    cache = GenerationCache(settings['cache_dir']) if settings['cache_dir'] else None
+
+    _worker['generator'] = EnhancedMeetingGenerator(
+        config_dir=settings['config_dir'],
+        templates_dir=settings['templates_dir'],
+        output_dir=settings['output_dir'],
+        sink=DirectorySink(settings['sink_root']),
+        cache=cache,
+        seed=settings['seed'],
+        clock=clock,
+        stream=settings['stream'],
+        context_table=context_table,
+        defer_index=True,
+        metrics=RunMetrics() if settings['metrics'] else None
+    )
+    _worker['index_shard'] = os.path.join(shard_dir, f'index-{os.getpid()}.csv')
+    _worker['error_shard'] = os.path.join(shard_dir, f'errors-{os.getpid()}.jsonl')
+
+
+def _run_job(numbered_job) -> Dict:
+    """Render one job in a worker; returns new cache entries and metrics for the parent."""
+    seq, job = numbered_job
+    generator = _worker['generator']
+
+    try:
+        generator.generate_transcript(job['meeting_type'], job['config'])
+    except Exception as e:
+        with open(_worker['error_shard'], 'a') as f:
+            f.write(json.dumps({'seq': seq, 'error': f"{job['label']}: {str(e)}"}) + '\n')
+
+    entries = generator.take_index_entries()
+    if entries:
+        shard = _worker['index_shard']
+        rows = pd.DataFrame(entries)
+        rows.insert(0, 'seq', seq)
+        rows.to_csv(shard, mode='a', header=not os.path.exists(shard), index=False)
+
+    return {
+        'cache': generator.cache.drain() if generator.cache is not None else None,
+        'metrics': generator.metrics.drain() if generator.metrics.enabled else None
+    }
+
+
+def _merge_shards(generator: EnhancedMeetingGenerator, shard_dir: str) -> Dict[int, str]:
+    """Append worker index rows in job order and collect worker errors."""
+    frames = [pd.read_csv(path) for path in sorted(glob.glob(os.path.join(shard_dir, 'index-*.csv')))]
+    if frames:
+        rows = pd.concat(frames, ignore_index=True).sort_values('seq', kind='stable')
+        generator.flush_index(rows.drop(columns='seq').reset_index(drop=True))
+
+    errors = {}
+    for path in glob.glob(os.path.join(shard_dir, 'errors-*.jsonl')):
+        with open(path, 'r') as f:
+            for line in f:
+                record = json.loads(line)
+                errors[record['seq']] = record['error']
+
+    shutil.rmtree(shard_dir)
+    return errors
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Historical Project Aggregates
+
+Summary statistics of 03_Historical_Projects, materialized next to the projects when
+they are generated, so consumers load one small table instead of scanning every project:
+
+- groupings: all projects, store_type, market, (store_type, market), completion quarter
+- metrics:   total_cost, cost_per_sqft, every cost category, timeline_days,
+             variance_from_budget
+- per group: count, then mean, median, p10 and p90 of each metric
+
+ProjectAggregator is fed the same chunks write_projects() writes, keeping only the
+metric columns and group codes (~100 bytes per project), so percentiles are exact
+without holding the project records.
+
+Layout (project_aggregates.csv, one row per group):
+    grouping, store_type, market, quarter, count, total_cost_mean, total_cost_median,
+    total_cost_p10, total_cost_p90, cost_per_sqft_mean, ...
+The JSON variants nest the same values: {"grouping", "group", "count", "metrics": {...}}.
+
+Usage:
+    aggregator = ProjectAggregator()
+    write_projects(160, stem, on_chunk=aggregator.add)
+    write_aggregates(aggregator.table(), 'output/03_Historical_Projects/project_aggregates')
+
+    table = load_aggregates('output')
+    group_stats(table, 'store_type', store_type='urban_flagship')['total_cost_median']
+
+    python project_aggregates.py --grouping store_type_market
+"""
+
+import argparse
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+from artifact_io import open_artifact
+from historical_projects import CATEGORY_SHARES
+from record_writer import RecordWriter
+
+AGGREGATES_FILE = '03_Historical_Projects/project_aggregates.csv'
+
+METRICS = ['total_cost', 'cost_per_sqft'] + list(CATEGORY_SHARES) + ['timeline_days', 'variance_from_budget']
+
+# grouping name -> group key columns
+GROUPINGS = {
+    'all': [],
+    'store_type': ['store_type'],
+    'market': ['market'],
+    'store_type_market': ['store_type', 'market'],
+    'quarter': ['quarter'],
+}
+
+KEY_COLUMNS = ['store_type', 'market', 'quarter']
+
+# statistic -> quantile (None for the mean)
+STATISTICS = {'mean': None, 'median': 0.5, 'p10': 0.1, 'p90': 0.9}
+
+AGGREGATE_COLUMNS = ['grouping'] + KEY_COLUMNS + ['count'] + [
+    f'{metric}_{stat}' for metric in METRICS for stat in STATISTICS
+]
+
+
+def completion_quarter(dates: pd.Series) -> pd.Series:
+    """'2024-Q1' style quarter labels for YYYY-MM-DD completion dates."""
+    return pd.to_datetime(dates).dt.to_period('Q').astype(str).str.replace('Q', '-Q', regex=False)
+
+
+def aggregate_projects(projects: pd.DataFrame, groupings: Optional[Sequence[str]] = None,
+                       decimals: Optional[int] = 2) -> pd.DataFrame:
+    """
+    Group statistics in one group-by per grouping over a columnar project table.
+
+    Args:
+        projects: Flat projects (CSV columns, or json_normalize'd with categories.<name>)
+        groupings: Names from GROUPINGS (default: all of them)
+        decimals: Rounding of the statistics (None keeps full precision)
+
+    Returns:
+        DataFrame with AGGREGATE_COLUMNS, one row per group
+    """
+    groupings = list(groupings or GROUPINGS)
+    table = projects.rename(columns={f'categories.{name}': name for name in CATEGORY_SHARES})
+    if 'quarter' not in table.columns and any('quarter' in GROUPINGS[g] for g in groupings):
+        table = table.assign(quarter=completion_quarter(table['completion_date']))
+
+    frames = []
+    for grouping in groupings:
+        keys = GROUPINGS[grouping]
+        grouped = table.groupby(keys or np.zeros(len(table), dtype=np.int8), sort=True, observed=True)
+
+        # One metric at a time, so quantile sorting never copies every metric column at once
+        stats = {'count': grouped.size()}
+        quantiles = [q for q in STATISTICS.values() if q is not None]
+        for metric in METRICS:
+            column = grouped[metric]
+            metric_quantiles = column.quantile(quantiles)
+            for stat, q in STATISTICS.items():
+                values = column.mean() if q is None else metric_quantiles.xs(q, level=-1)
+                stats[f'{metric}_{stat}'] = values if decimals is None else values.round(decimals)
+
+        frame = pd.DataFrame(stats)
+        frame = frame.reset_index() if keys else frame.reset_index(drop=True)
+        frame.insert(0, 'grouping', grouping)
+        frames.append(frame)
+
+    result = pd.concat(frames, ignore_index=True)
+    for column in KEY_COLUMNS:
+        if column not in result.columns:
+            result[column] = None
+    return result[AGGREGATE_COLUMNS]
+
+
+class ProjectAggregator:
+    """Collects the columns aggregate_projects() needs, chunk by chunk."""
+
+    def __init__(self):
+        self._chunks: List[pd.DataFrame] = []
+
+    def add(self, chunk: pd.DataFrame):
+        """Keep one generated chunk's group keys (as categories) and metric columns."""
+        kept = chunk[METRICS].copy()
+        kept['store_type'] = chunk['store_type'].astype('category')
+        kept['market'] = chunk['market'].astype('category')
+        kept['quarter'] = completion_quarter(chunk['completion_date']).astype('category')
+        self._chunks.append(kept)
+
+    def table(self, groupings: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Aggregates over every chunk added so far."""
+        if not self._chunks:
+            return pd.DataFrame(columns=AGGREGATE_COLUMNS)
+        # Chunks can see different key values, so their categories are unioned, not cast to strings
+        projects = pd.concat([chunk[METRICS] for chunk in self._chunks], ignore_index=True)
+        for column in KEY_COLUMNS:
+            projects[column] = union_categoricals([chunk[column] for chunk in self._chunks], sort_categories=True)
+        return aggregate_projects(projects, groupings)
+
+
+def aggregate_records(table: pd.DataFrame) -> List[Dict]:
+    """Nested records for the JSON variants."""
+    records = []
+    for row in table.to_dict('records'):
+        keys = GROUPINGS[row['grouping']]
+        records.append({
+            'grouping': row['grouping'],
+            'group': {key: row[key] for key in keys},
+            'count': int(row['count']),
+            'metrics': {metric: {stat: float(row[f'{metric}_{stat}']) for stat in STATISTICS}
+                        for metric in METRICS}
+        })
+    return records
+
+
+def write_aggregates(table: pd.DataFrame, stem: str, formats: Optional[Sequence[str]] = None) -> RecordWriter:
+    """Write the aggregates table to <stem>.csv/.json/.jsonl(/.parquet); returns the closed writer."""
+    with RecordWriter(stem, 'aggregates', formats=formats, columns=AGGREGATE_COLUMNS) as writer:
+        writer.write(aggregate_records(table), table=table)
+    return writer
+
+
+def load_aggregates(data_dir: str = 'output') -> pd.DataFrame:
+    """Load the aggregates table (any compression)."""
+    with open_artifact(f'{data_dir}/{AGGREGATES_FILE}') as f:
+        return pd.read_csv(f)
+
+
+def group_stats(table: pd.DataFrame, grouping: str, **keys) -> Optional[Dict]:
+    """
+    One group's row as a dict.
+
+    Args:
+        table: Aggregates table
+        grouping: Name from GROUPINGS
+        **keys: Group key values, e.g. store_type='urban_flagship', market='Columbus'
+
+    Returns:
+        Row dict, or None if the group has no projects
+    """
+    mask = table['grouping'] == grouping
+    for key, value in keys.items():
+        mask &= table[key] == value
+    rows = table[mask]
+    return rows.iloc[0].to_dict() if len(rows) else None
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Show historical project aggregates')
+    parser.add_argument('--data-dir', default='output', help='Structured data directory (default: output)')
+    parser.add_argument('--grouping', choices=list(GROUPINGS), default='store_type')
+    parser.add_argument('--metric', choices=METRICS, default='total_cost')
+
+    args = parser.parse_args()
+
+    table = load_aggregates(args.data_dir)
+    rows = table[table['grouping'] == args.grouping]
+    columns = GROUPINGS[args.grouping] + ['count'] + [f'{args.metric}_{stat}' for stat in STATISTICS]
+    print(rows[columns].to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
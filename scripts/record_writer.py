@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Record Writer
+
+Writes one stream of records to several formats in a single pass, so each dataset in
+generate_structured_data.py is described once instead of hand-writing every file:
+
+- json:    {"<root_key>": [...]}, streamed item by item (indent=2, or compact under
+           the --format compact output profile)
+- jsonl:   one compact record per line
+- csv:     flat rows (flatten(record) or pd.json_normalize), header on the first chunk
+- parquet: same flat rows, one row group per chunk (only when pyarrow is installed)
+
+Text formats go through artifact_io, so --compress gzip|zstd applies to them too.
+
+Each chunk is buffered once: the nested records feed json/jsonl, and a single flat
+DataFrame built from them feeds csv/parquet. Adding a format adds a file write, not
+another pass over the data.
+
+Usage:
+    with RecordWriter('output/04_Regional_Modifiers/regional_modifiers', root_key='markets',
+                      columns=[...], flatten=lambda market: {...}) as writer:
+        writer.write(markets)
+    print(writer.paths)
+"""
+
+import json
+import os
+from typing import Callable, Dict, List, Optional, Sequence
+
+import pandas as pd
+
+from artifact_io import artifact_target, get_profile, open_output
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+FORMATS = ['csv', 'json', 'jsonl', 'parquet']
+
+
+def available_formats() -> List[str]:
+    """Formats this environment can write (parquet needs pyarrow)."""
+    return [fmt for fmt in FORMATS if fmt != 'parquet' or pq is not None]
+
+
+class RecordWriter:
+    """Fan one record stream out to <stem>.<format> for each requested format."""
+
+    def __init__(self, stem: str, root_key: str, formats: Optional[Sequence[str]] = None,
+                 columns: Optional[List[str]] = None, flatten: Optional[Callable[[Dict], Dict]] = None):
+        """
+        Args:
+            stem: Output path without extension
+            root_key: Key holding the record list in the JSON file
+            formats: Formats to write (default: all available); unavailable ones are skipped
+            columns: Flat column order for csv/parquet (default: order of the first chunk)
+            flatten: Record -> flat row for csv/parquet (default: pd.json_normalize)
+        """
+        requested = available_formats() if formats is None else formats
+        unknown = set(requested) - set(FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown format(s): {', '.join(sorted(unknown))}")
+
+        self.formats = [fmt for fmt in requested if fmt in available_formats()]
+        self.paths = {fmt: f'{stem}.{fmt}' if fmt == 'parquet' else artifact_target(f'{stem}.{fmt}')
+                      for fmt in self.formats}
+        self.stem = stem
+        self.pretty = get_profile().format == 'pretty'
+        self.root_key = root_key
+        self.columns = columns
+        self.flatten = flatten
+        self.count = 0
+
+        self._files = {}
+        self._parquet = None
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def open(self):
+        """Open every output file."""
+        for fmt, path in self.paths.items():
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            if fmt != 'parquet':
+                self._files[fmt] = open_output(f'{self.stem}.{fmt}', newline='' if fmt == 'csv' else None)
+
+        if 'json' in self._files:
+            if self.pretty:
+                self._files['json'].write('{\n  ' + json.dumps(self.root_key) + ': [')
+            else:
+                self._files['json'].write('{' + json.dumps(self.root_key) + ':[')
+
+    def write(self, records: List[Dict], table: Optional[pd.DataFrame] = None):
+        """
+        Append one chunk of records to every output.
+
+        Args:
+            records: Nested records (json/jsonl)
+            table: Flat rows for csv/parquet if the caller already has them
+        """
+        if not records:
+            return
+
+        if 'json' in self._files:
+            if self.pretty:
+                items = ['\n'.join('    ' + line for line in json.dumps(record, indent=2).split('\n'))
+                         for record in records]
+                self._files['json'].write(('\n' if self.count == 0 else ',\n') + ',\n'.join(items))
+            else:
+                items = [json.dumps(record, separators=(',', ':')) for record in records]
+                self._files['json'].write(('' if self.count == 0 else ',') + ','.join(items))
+
+        if 'jsonl' in self._files:
+            separators = None if self.pretty else (',', ':')
+            self._files['jsonl'].writelines(json.dumps(record, separators=separators) + '\n' for record in records)
+
+        if 'csv' in self._files or 'parquet' in self.paths:
+            if table is None:
+                table = self._flat_table(records)
+            if self.columns is None:
+                self.columns = list(table.columns)
+            table = table[self.columns]
+
+            if 'csv' in self._files:
+                # \r\n like the csv module, so files match the hand-written ones
+                table.to_csv(self._files['csv'], header=(self.count == 0), index=False, lineterminator='\r\n')
+            if 'parquet' in self.paths:
+                self._write_parquet(table)
+
+        self.count += len(records)
+
+    def _flat_table(self, records: List[Dict]) -> pd.DataFrame:
+        """One flat DataFrame per chunk, shared by csv and parquet."""
+        if self.flatten is not None:
+            return pd.DataFrame([self.flatten(record) for record in records])
+        return pd.json_normalize(records)
+
+    def _write_parquet(self, table: pd.DataFrame):
+        """Append the chunk as a row group, keeping the first chunk's schema."""
+        batch = pa.Table.from_pandas(table, preserve_index=False)
+        if self._parquet is None:
+            self._parquet = pq.ParquetWriter(self.paths['parquet'], batch.schema)
+        else:
+            batch = batch.cast(self._parquet.schema)
+        self._parquet.write_table(batch)
+
+    def close(self):
+        """Finish the JSON document and close every output."""
+        if 'json' in self._files:
+            if not self.pretty:
+                self._files['json'].write(']}')
+            else:
+                self._files['json'].write('\n  ]\n}' if self.count else ']\n}')
+
+        for f in self._files.values():
+            f.close()
+        self._files = {}
+
+        if self._parquet is not None:
+            self._parquet.close()
+            self._parquet = None
+
+
+def write_records(stem: str, root_key: str, records: List[Dict], **kwargs) -> RecordWriter:
+    """Write a complete (small) record list in one chunk; returns the closed writer."""
+    with RecordWriter(stem, root_key, **kwargs) as writer:
+        writer.write(records)
+    return writer
@@ -6,30 +6,38 @@ Replaces original Phase 1 meetings with enhanced versions.
 Teams conversations remain unchanged (already excellent).
 """
 
+import argparse
 import os
-import shutil
-from datetime import datetime, timedelta
+from datetime import timedelta
 from generate_meeting_transcripts_v2 import EnhancedMeetingGenerator
+from run_context import add_run_arguments, configure_run, get_clock
+from snapshot_backup import create_snapshot, prune_snapshots
 
+TRANSCRIPTS_DIR = 'output/07_Conversations/meeting_transcripts'
+SNAPSHOT_ROOT = 'output/07_Conversations_snapshots'
 
-def backup_original_data():
-    """Backup original Phase 1 data."""
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    backup_dir = f'output/07_Conversations_backup_{timestamp}'
 
-    if os.path.exists('output/07_Conversations/meeting_transcripts'):
-        shutil.copytree(
-            'output/07_Conversations/meeting_transcripts',
-            f'{backup_dir}/meeting_transcripts'
-        )
-        print(f"✓ Backed up original meetings to {backup_dir}")
+def backup_original_data(keep=None):
+    """Snapshot original Phase 1 meetings (only changed files are copied)."""
+    if not os.path.exists(TRANSCRIPTS_DIR):
+        return None
 
-    return backup_dir
+    stats = create_snapshot(TRANSCRIPTS_DIR, SNAPSHOT_ROOT)
+    print(f"✓ Backed up original meetings to {stats['path']} "
+          f"({stats['copied']} copied, {stats['linked']} unchanged)")
 
+    if keep:
+        removed = prune_snapshots(keep, SNAPSHOT_ROOT)
+        if removed:
+            print(f"✓ Pruned {len(removed)} old snapshots")
 
-def regenerate_all_meetings():
+    return stats['path']
+
+
+def regenerate_all_meetings(seed=None):
     """Regenerate all Phase 1 meetings with enhanced dialogue."""
-    generator = EnhancedMeetingGenerator()
+    generator = EnhancedMeetingGenerator(seed=seed)
+    run_date = get_clock().now()
 
     stats = {
         'generated': 0,
@@ -47,7 +55,7 @@ def regenerate_all_meetings():
             config = {
                 'meeting_type': 'site_visit_debrief',
                 'store_id': store_id,
-                'date': (datetime.now() - timedelta(days=30-i*5)).strftime('%Y-%m-%d'),
+                'date': (run_date - timedelta(days=30-i*5)).strftime('%Y-%m-%d'),
                 'participants': 'Sarah Chen|Tom Wilson|Mike Rodriguez'
             }
             generator.generate_transcript('site_visit_debrief', config)
@@ -62,7 +70,7 @@ def regenerate_all_meetings():
             config = {
                 'meeting_type': 'vendor_negotiation',
                 'topic': f'hvac-vendors-q{i+1}',
-                'date': (datetime.now() - timedelta(days=60-i*10)).strftime('%Y-%m-%d'),
+                'date': (run_date - timedelta(days=60-i*10)).strftime('%Y-%m-%d'),
                 'participants': 'Jennifer Liu|Tom Wilson'
             }
             generator.generate_transcript('vendor_negotiation', config)
@@ -77,7 +85,7 @@ def regenerate_all_meetings():
             config = {
                 'meeting_type': 'lessons_learned',
                 'store_id': store_id,
-                'date': (datetime.now() - timedelta(days=90-i*7)).strftime('%Y-%m-%d'),
+                'date': (run_date - timedelta(days=90-i*7)).strftime('%Y-%m-%d'),
                 'participants': 'Sarah Chen|Tom Wilson|David Park|Lisa Thompson'
             }
             generator.generate_transcript('lessons_learned', config)
@@ -93,7 +101,7 @@ def regenerate_all_meetings():
                 'meeting_type': 'design_review',
                 'topic': f'template-{version}',
                 'template_version': version,
-                'date': (datetime.now() - timedelta(days=120-i*90)).strftime('%Y-%m-%d'),
+                'date': (run_date - timedelta(days=120-i*90)).strftime('%Y-%m-%d'),
                 'participants': 'Carlos Martinez|Angela Wu|David Park'
             }
             generator.generate_transcript('design_review', config)
@@ -108,7 +116,7 @@ def regenerate_all_meetings():
             config = {
                 'meeting_type': 'weekly_dev_sync',
                 'topic': 'Columbus-Market',
-                'date': (datetime.now() - timedelta(days=14-i*7)).strftime('%Y-%m-%d'),
+                'date': (run_date - timedelta(days=14-i*7)).strftime('%Y-%m-%d'),
                 'participants': 'Sarah Chen|Jennifer Liu'
             }
             generator.generate_transcript('weekly_dev_sync', config)
@@ -121,17 +129,24 @@ def regenerate_all_meetings():
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description='Regenerate Phase 1 meetings with enhanced dialogue')
+    parser.add_argument('--keep-snapshots', type=int, default=None,
+                        help='Prune backup snapshots down to the newest N after backing up')
+    add_run_arguments(parser)
+    args = parser.parse_args()
+    seed = configure_run(args)
+
     print("\n" + "="*60)
     print("PHASE 1 ENHANCED REGENERATION")
     print("="*60)
 
     # Backup original
     print("\n[Step 1] Backing up original meetings...")
-    backup_dir = backup_original_data()
+    backup_dir = backup_original_data(keep=args.keep_snapshots)
 
     # Regenerate
     print("\n[Step 2] Regenerating with enhanced dialogue...")
-    stats = regenerate_all_meetings()
+    stats = regenerate_all_meetings(seed=seed)
 
     # Summary
     print("\n" + "="*60)
@@ -146,7 +161,9 @@ def main():
     else:
         print("✓ No errors")
 
-    print(f"\n✓ Original meetings backed up to: {backup_dir}")
+    if backup_dir:
+        print(f"\n✓ Original meetings backed up to: {backup_dir}")
+        print(f"  Restore with: python scripts/snapshot_backup.py restore --name {os.path.basename(backup_dir)}")
     print("✓ Teams conversations unchanged (already excellent quality)")
     print("\n" + "="*60)
 
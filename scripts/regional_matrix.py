@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Regional Modifier Matrix
+
+Dense markets x categories view of 04_Regional_Modifiers, so adjustments are array
+indexing instead of a linear search by market name and a dict lookup per category:
+
+- values[m, c] is the modifier for market m and category c
+- market_index / category_index map names to rows and columns
+- one extra neutral row (all 1.0) sits at index -1; unknown markets resolve to it,
+  so a vectorized lookup never needs a mask
+- adjust() scales estimates for many (project, market) pairs in one broadcasted multiply
+
+Usage:
+    matrix = RegionalModifierMatrix.load('output')
+    matrix.lookup('Cincinnati', 'electrical')              # 1.08
+    matrix.row('Cincinnati')                               # {'construction': 1.05, ...}
+
+    estimates = np.array([[226625, 77700, ...], ...])      # projects x CATEGORIES
+    adjusted = matrix.adjust(estimates, ['Columbus', 'Detroit', ...])
+
+    python regional_matrix.py
+"""
+
+import argparse
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from artifact_io import artifact_exists, load_json
+
+MODIFIERS_FILE = '04_Regional_Modifiers/regional_modifiers.json'
+
+CATEGORIES = ['construction', 'electrical', 'hvac', 'plumbing', 'fixtures', 'technology', 'soft_costs']
+
+
+class RegionalModifierMatrix:
+    """Market x category modifier matrix with name -> index maps."""
+
+    def __init__(self, markets: List[Dict], categories: Sequence[str] = CATEGORIES):
+        """
+        Args:
+            markets: Market records as in regional_modifiers.json ('market', 'modifiers', ...)
+            categories: Column order
+        """
+        self.markets = [market['market'] for market in markets]
+        self.categories = list(categories)
+        self.market_index = {name: i for i, name in enumerate(self.markets)}
+        self.category_index = {name: j for j, name in enumerate(self.categories)}
+
+        # Last row is neutral: index -1 (unknown market) multiplies by 1.0
+        self.values = np.ones((len(self.markets) + 1, len(self.categories)), dtype=np.float64)
+        for i, market in enumerate(markets):
+            self.values[i] = [market['modifiers'].get(category, 1.0) for category in self.categories]
+
+        self.notes = {market['market']: market.get('notes') for market in markets}
+        self._markets = pd.Index(self.markets)
+
+    @staticmethod
+    def available(data_dir: str = 'output') -> bool:
+        """True when the regional modifiers have been generated."""
+        return artifact_exists(f'{data_dir}/{MODIFIERS_FILE}')
+
+    @classmethod
+    def load(cls, data_dir: str = 'output') -> 'RegionalModifierMatrix':
+        """Build the matrix from 04_Regional_Modifiers/regional_modifiers.json."""
+        return cls(load_json(f'{data_dir}/{MODIFIERS_FILE}')['markets'])
+
+    @classmethod
+    def from_frame(cls, table: pd.DataFrame) -> 'RegionalModifierMatrix':
+        """Build the matrix from the flat regional_modifiers.csv layout (one column per category)."""
+        categories = [category for category in CATEGORIES if category in table.columns]
+        markets = [
+            {'market': row['market'], 'notes': row.get('notes'),
+             'modifiers': {category: float(row[category]) for category in categories}}
+            for row in table.to_dict('records')
+        ]
+        return cls(markets, categories)
+
+    def indices(self, markets: Sequence[str]) -> np.ndarray:
+        """Row index per market name (-1, the neutral row, for unknown markets)."""
+        return self._markets.get_indexer(pd.Index(markets))
+
+    def lookup(self, market: str, category: str) -> float:
+        """Modifier for one market and category (1.0 for an unknown market)."""
+        return float(self.values[self.market_index.get(market, -1), self.category_index[category]])
+
+    def row(self, market: str) -> Dict[str, float]:
+        """All category modifiers for a market ({} for an unknown market)."""
+        if market not in self.market_index:
+            return {}
+        return dict(zip(self.categories, self.values[self.market_index[market]].tolist()))
+
+    def column(self, category: str, markets: Sequence[str]) -> np.ndarray:
+        """One category's modifier for each of `markets`."""
+        return self.values[self.indices(markets), self.category_index[category]]
+
+    def adjust(self, estimates: np.ndarray, markets: Sequence[str],
+               categories: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Apply market modifiers to estimates in one broadcasted multiply.
+
+        Args:
+            estimates: (n, k) costs per category, or (n,) costs for a single category
+            markets: Market of each row (n)
+            categories: Column categories of estimates (default: all, in matrix order)
+
+        Returns:
+            Adjusted estimates, same shape as `estimates`
+        """
+        estimates = np.asarray(estimates, dtype=np.float64)
+        columns = [self.category_index[c] for c in (categories or self.categories)]
+        factors = self.values[self.indices(markets)][:, columns]
+
+        if estimates.ndim == 1:
+            if len(columns) != 1:
+                raise ValueError("1-D estimates need exactly one category")
+            return estimates * factors[:, 0]
+        return estimates * factors
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Show the regional modifier matrix')
+    parser.add_argument('--data-dir', default='output', help='Structured data directory (default: output)')
+
+    args = parser.parse_args()
+
+    matrix = RegionalModifierMatrix.load(args.data_dir)
+    table = pd.DataFrame(matrix.values[:-1], index=matrix.markets, columns=matrix.categories)
+    print(table.to_string(float_format='{:.2f}'.format))
+
+
+if __name__ == '__main__':
+    main()
@@ -15,20 +15,23 @@ import argparse
 import json
 import os
 import sys
-from datetime import datetime, timedelta
-import random
+from datetime import timedelta
 
 # Import generators
 from generate_meeting_transcripts import MeetingTranscriptGenerator
 from generate_teams_conversations import TeamsConversationGenerator
+from artifact_io import add_output_arguments, configure_output
+from run_context import add_run_arguments, configure_run, get_clock, job_rng
 
 
 class DataGenerationOrchestrator:
     """Orchestrate full data generation workflow."""
 
-    def __init__(self):
-        self.meeting_generator = MeetingTranscriptGenerator()
-        self.teams_generator = TeamsConversationGenerator()
+    def __init__(self, seed=None):
+        self.meeting_generator = MeetingTranscriptGenerator(seed=seed)
+        self.teams_generator = TeamsConversationGenerator(seed=seed)
+        self.run_date = get_clock().now()
+        self.rng = job_rng(seed, 'orchestrator', 'teams')
 
         # Load store list (or generate mock stores)
         self.stores = self._load_or_generate_stores()
@@ -61,7 +64,7 @@ class DataGenerationOrchestrator:
             config = {
                 'meeting_type': 'site_visit_debrief',
                 'store_id_or_topic': store_id,
-                'date': (datetime.now() - timedelta(days=30-i*5)).strftime('%Y-%m-%d'),
+                'date': (self.run_date - timedelta(days=30-i*5)).strftime('%Y-%m-%d'),
                 'participants': [
                     {'name': 'Sarah Chen'},
                     {'name': 'Tom Wilson'},
@@ -84,7 +87,7 @@ class DataGenerationOrchestrator:
             config = {
                 'meeting_type': 'vendor_negotiation',
                 'store_id_or_topic': f'hvac-vendors-q{i+1}',
-                'date': (datetime.now() - timedelta(days=60-i*10)).strftime('%Y-%m-%d'),
+                'date': (self.run_date - timedelta(days=60-i*10)).strftime('%Y-%m-%d'),
                 'participants': [
                     {'name': 'Jennifer Liu'},
                     {'name': 'Tom Wilson'}
@@ -102,7 +105,7 @@ class DataGenerationOrchestrator:
             config = {
                 'meeting_type': 'lessons_learned',
                 'store_id_or_topic': store_id,
-                'date': (datetime.now() - timedelta(days=90-i*7)).strftime('%Y-%m-%d'),
+                'date': (self.run_date - timedelta(days=90-i*7)).strftime('%Y-%m-%d'),
                 'participants': [
                     {'name': 'Sarah Chen'},
                     {'name': 'Tom Wilson'},
@@ -125,7 +128,7 @@ class DataGenerationOrchestrator:
             config = {
                 'meeting_type': 'design_review',
                 'store_id_or_topic': f'template-v2.{3+i}',
-                'date': (datetime.now() - timedelta(days=120-i*90)).strftime('%Y-%m-%d'),
+                'date': (self.run_date - timedelta(days=120-i*90)).strftime('%Y-%m-%d'),
                 'participants': [
                     {'name': 'Carlos Martinez'},
                     {'name': 'Angela Wu'},
@@ -144,7 +147,7 @@ class DataGenerationOrchestrator:
             config = {
                 'meeting_type': 'weekly_dev_sync',
                 'store_id_or_topic': 'Columbus-Market',
-                'date': (datetime.now() - timedelta(days=14-i*7)).strftime('%Y-%m-%d'),
+                'date': (self.run_date - timedelta(days=14-i*7)).strftime('%Y-%m-%d'),
                 'participants': [
                     {'name': 'Sarah Chen'},
                     {'name': 'Jennifer Liu'}
@@ -168,8 +171,8 @@ class DataGenerationOrchestrator:
 
         for channel, theme in channels_and_themes:
             # Generate 2-3 threads per channel
-            for i in range(random.randint(2, 3)):
-                store_id = random.choice(list(stats['stores_covered']))
+            for i in range(self.rng.randint(2, 3)):
+                store_id = self.rng.choice(sorted(stats['stores_covered']))
 
                 config = {
                     'channel_name': channel,
@@ -177,7 +180,7 @@ class DataGenerationOrchestrator:
                         {
                             'theme': theme,
                             'store_id': store_id,
-                            'date': (datetime.now() - timedelta(days=random.randint(5, 60))).strftime('%Y-%m-%d')
+                            'date': (self.run_date - timedelta(days=self.rng.randint(5, 60))).strftime('%Y-%m-%d')
                         }
                     ],
                     'participant_pool': ['Sarah Chen', 'Tom Wilson', 'Jennifer Liu']
@@ -263,10 +266,14 @@ def main():
                         help='Generation phase (1=MVP, 2=Scaling, 3=Production)')
     parser.add_argument('--validate', action='store_true',
                         help='Run validation after generation')
+    add_run_arguments(parser)
+    add_output_arguments(parser)
 
     args = parser.parse_args()
+    seed = configure_run(args)
+    configure_output(args)
 
-    orchestrator = DataGenerationOrchestrator()
+    orchestrator = DataGenerationOrchestrator(seed=seed)
 
     # Run selected phase
     if args.phase == 1:
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+"""
+Run Metrics
+
+Instrumentation for the phase runners: where the time goes, how fast artifacts are
+produced and how much memory a run needs. Written as JSON next to the run output.
+
+- stages: wall and CPU time per stage (template_load, context_prep, render, write,
+  index_update, plus the runner's meetings / teams_conversations phases)
+- latency: per artifact type count, mean, p50/p95/p99, max and a log-scale histogram
+- bytes written, artifacts/sec
+- peak RSS of the run and of any worker processes (resource), and optionally the
+  peak traced Python allocation (tracemalloc, slows the run noticeably)
+- optional cProfile dump
+
+Stage CPU time is per thread, so stages running in pipeline threads are not
+double counted. Stage and latency totals from worker processes are merged in,
+so stage wall time can exceed the run's wall time.
+
+Usage:
+    metrics = RunMetrics(trace_memory=False, profile_path='output/run.prof')
+    metrics.start()
+    with metrics.job('design_review'):
+        with metrics.stage('render'):
+            ...
+        metrics.add_bytes(len(data))
+    metrics.finish()
+    metrics.write('output/07_Conversations/metadata/run_metrics.json')
+"""
+
+import cProfile
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Optional
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DEFAULT_METRICS_PATH = 'output/07_Conversations/metadata/run_metrics.json'
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+HISTOGRAM_BOUNDS_MS = [1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+
+class NullMetrics:
+    """Stand-in used when instrumentation is off; every hook is a no-op."""
+
+    enabled = False
+
+    def start(self):
+        pass
+
+    def finish(self):
+        pass
+
+    def stage(self, name: str):
+        return nullcontext()
+
+    def job(self, artifact_type: str):
+        return nullcontext()
+
+    def add_bytes(self, count: int):
+        pass
+
+
+NULL_METRICS = NullMetrics()
+
+
+class RunMetrics:
+    """Collects per-stage timings, per-type latencies, bytes written and peak memory."""
+
+    enabled = True
+
+    def __init__(self, trace_memory: bool = False, profile_path: Optional[str] = None):
+        self.trace_memory = trace_memory
+        self.profile_path = profile_path
+        self._lock = threading.Lock()
+        self._profiler = None
+        self._started = None
+        self._wall = None
+        self._cpu = None
+        self._traced_peak = None
+        self._reset_samples()
+
+    def _reset_samples(self):
+        self.stages = {}
+        self.latencies = {}
+        self.bytes_written = 0
+
+    def start(self):
+        """Start the run clock, memory tracing and profiler."""
+        self._started = (time.perf_counter(), time.process_time())
+        if self.trace_memory:
+            tracemalloc.start()
+        if self.profile_path:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+
+    def finish(self):
+        """Stop the run clock, memory tracing and profiler (dumping the profile)."""
+        self._wall = time.perf_counter() - self._started[0]
+        self._cpu = time.process_time() - self._started[1]
+
+        if self.trace_memory:
+            self._traced_peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+        if self._profiler is not None:
+            self._profiler.disable()
+            os.makedirs(os.path.dirname(self.profile_path) or '.', exist_ok=True)
+            self._profiler.dump_stats(self.profile_path)
+            self._profiler = None
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block under a stage name."""
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+            with self._lock:
+                totals = self.stages.setdefault(name, {'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0})
+                totals['calls'] += 1
+                totals['wall_seconds'] += wall
+                totals['cpu_seconds'] += cpu
+
+    @contextmanager
+    def job(self, artifact_type: str):
+        """Record the latency of one successfully produced artifact."""
+        start = time.perf_counter()
+        yield
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.latencies.setdefault(artifact_type, []).append(elapsed)
+
+    def add_bytes(self, count: int):
+        """Count bytes written to the output."""
+        with self._lock:
+            self.bytes_written += count
+
+    def drain(self) -> Dict:
+        """Return and reset samples recorded since the last drain (for worker processes)."""
+        with self._lock:
+            delta = {'stages': self.stages, 'latencies': self.latencies, 'bytes_written': self.bytes_written}
+            self._reset_samples()
+        return delta
+
+    def absorb(self, delta: Dict):
+        """Merge a drain() result from another process."""
+        with self._lock:
+            for name, totals in delta['stages'].items():
+                mine = self.stages.setdefault(name, {'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0})
+                for field, value in totals.items():
+                    mine[field] += value
+            for artifact_type, samples in delta['latencies'].items():
+                self.latencies.setdefault(artifact_type, []).extend(samples)
+            self.bytes_written += delta['bytes_written']
+
+    def _latency_summary(self, samples) -> Dict:
+        """Percentiles and histogram for one artifact type."""
+        ms = np.asarray(samples) * 1000.0
+        p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+        counts = np.bincount(np.searchsorted(HISTOGRAM_BOUNDS_MS, ms), minlength=len(HISTOGRAM_BOUNDS_MS) + 1)
+        labels = [f'<={bound}ms' for bound in HISTOGRAM_BOUNDS_MS] + [f'>{HISTOGRAM_BOUNDS_MS[-1]}ms']
+
+        return {
+            'count': int(len(ms)),
+            'mean_ms': round(float(ms.mean()), 3),
+            'p50_ms': round(float(p50), 3),
+            'p95_ms': round(float(p95), 3),
+            'p99_ms': round(float(p99), 3),
+            'max_ms': round(float(ms.max()), 3),
+            'histogram': {label: int(n) for label, n in zip(labels, counts) if n}
+        }
+
+    def report(self) -> Dict:
+        """Machine-readable summary of the run."""
+        artifacts = sum(len(samples) for samples in self.latencies.values())
+        wall = self._wall or 0.0
+
+        memory = {'peak_traced_bytes': self._traced_peak}
+        if resource is not None:
+            # ru_maxrss is KiB on Linux
+            memory['peak_rss_kb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            memory['peak_worker_rss_kb'] = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+
+        return {
+            'run': {
+                'wall_seconds': round(wall, 3),
+                'cpu_seconds': round(self._cpu or 0.0, 3),
+                'artifacts': artifacts,
+                'artifacts_per_second': round(artifacts / wall, 2) if wall else None,
+                'bytes_written': self.bytes_written
+            },
+            'memory': memory,
+            'stages': {
+                name: {
+                    'calls': totals['calls'],
+                    'wall_seconds': round(totals['wall_seconds'], 4),
+                    'cpu_seconds': round(totals['cpu_seconds'], 4)
+                }
+                for name, totals in self.stages.items()
+            },
+            'latency': {
+                artifact_type: self._latency_summary(samples)
+                for artifact_type, samples in sorted(self.latencies.items())
+            },
+            'profile': self.profile_path
+        }
+
+    def write(self, path: str) -> Dict:
+        """Write the report as JSON and return it."""
+        report = self.report()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'w') as f:
+            json.dump(report, f, indent=2)
+        return report
+
+
+def add_metrics_arguments(parser):
+    """Add --metrics, --trace-memory and --profile to a runner CLI."""
+    parser.add_argument('--metrics', nargs='?', const=DEFAULT_METRICS_PATH, default=None, metavar='PATH',
+                        help=f'Write per-stage timing/latency/memory JSON (default path: {DEFAULT_METRICS_PATH})')
+    parser.add_argument('--trace-memory', action='store_true',
+                        help='Also record peak Python allocations with tracemalloc (slower)')
+    parser.add_argument('--profile', default=None, metavar='PATH',
+                        help='Dump cProfile stats for the run to PATH')
+
+
+def configure_metrics(args):
+    """RunMetrics for parsed CLI args, or NULL_METRICS when instrumentation is off."""
+    if not (args.metrics or args.trace_memory or args.profile):
+        return NULL_METRICS
+    return RunMetrics(trace_memory=args.trace_memory, profile_path=args.profile)
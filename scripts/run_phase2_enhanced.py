@@ -9,20 +9,31 @@ Generates:
 - 6 channels with varied themes
 """
 
+import argparse
 import os
-import random
-from datetime import datetime, timedelta
+from datetime import timedelta
 from generate_meeting_transcripts_v2 import EnhancedMeetingGenerator
 from generate_teams_conversations import TeamsConversationGenerator
+from generation_cache import GenerationCache
+from parallel_meetings import meeting_job, run_meeting_jobs
+from artifact_io import add_output_arguments, configure_output
+from run_context import add_run_arguments, configure_run, get_clock, job_rng
+from run_metrics import DEFAULT_METRICS_PATH, NULL_METRICS, add_metrics_arguments, configure_metrics
 
 
 class Phase2Generator:
     """Generate Phase 2 scaled dataset."""
 
-    def __init__(self):
-        self.meeting_gen = EnhancedMeetingGenerator()
-        self.teams_gen = TeamsConversationGenerator()
+    def __init__(self, sink=None, cache=None, seed=None, metrics=None):
+        self.metrics = metrics or NULL_METRICS
+        self.meeting_gen = EnhancedMeetingGenerator(sink=sink, cache=cache, seed=seed, metrics=self.metrics)
+        self.teams_gen = TeamsConversationGenerator(seed=seed, cache=cache)
+        self.run_date = get_clock().now()
+        self.rng = job_rng(seed, 'phase2', 'teams')
         self.stores = [f'Store-{200+i}' for i in range(1, 101)]  # Store-201 to Store-300
+        # Store context for every store these meetings reference, computed in one pass
+        if self.meeting_gen.context_table is not None:
+            self.meeting_gen.context_table.build(self.stores + [f'Store-{170 + i}' for i in range(20)])
         self.stats = {
             'meetings_generated': 0,
             'teams_threads_generated': 0,
@@ -30,31 +41,25 @@ class Phase2Generator:
             'errors': []
         }
 
-    def generate_meetings(self):
-        """Generate 75 meeting transcripts across 100 stores."""
-        print("\n" + "="*60)
-        print("PHASE 2: MEETING TRANSCRIPT GENERATION")
-        print("="*60 + "\n")
+    def meeting_jobs(self):
+        """Meeting jobs in generation order, grouped into (heading, jobs) sections."""
+        sections = []
 
         # 1. Site Visit Debriefs (15 total)
-        print("[1/5] Generating 15 site visit debriefs...")
+        jobs = []
         for i in range(15):
             store_id = self.stores[i]
-            try:
-                config = {
-                    'meeting_type': 'site_visit_debrief',
-                    'store_id': store_id,
-                    'date': (datetime.now() - timedelta(days=180-i*10)).strftime('%Y-%m-%d'),
-                    'participants': 'Sarah Chen|Tom Wilson|Mike Rodriguez'
-                }
-                self.meeting_gen.generate_transcript('site_visit_debrief', config)
-                self.stats['meetings_generated'] += 1
-                self.stats['stores_covered'].add(store_id)
-            except Exception as e:
-                self.stats['errors'].append(f"Site visit {store_id}: {str(e)}")
+            config = {
+                'meeting_type': 'site_visit_debrief',
+                'store_id': store_id,
+                'date': (self.run_date - timedelta(days=180-i*10)).strftime('%Y-%m-%d'),
+                'participants': 'Sarah Chen|Tom Wilson|Mike Rodriguez'
+            }
+            jobs.append(meeting_job('site_visit_debrief', config, f"Site visit {store_id}", store_id))
+        sections.append(('Generating 15 site visit debriefs...', jobs))
 
         # 2. Vendor Negotiations (15 total)
-        print("\n[2/5] Generating 15 vendor negotiations...")
+        jobs = []
         vendor_topics = [
             'hvac-vendors-q1', 'hvac-vendors-q2', 'hvac-vendors-q3', 'hvac-vendors-q4',
             'electrical-contractors-spring', 'electrical-contractors-summer',
@@ -65,58 +70,48 @@ class Phase2Generator:
         ]
 
         for i, topic in enumerate(vendor_topics):
-            try:
-                config = {
-                    'meeting_type': 'vendor_negotiation',
-                    'topic': topic,
-                    'date': (datetime.now() - timedelta(days=200-i*12)).strftime('%Y-%m-%d'),
-                    'participants': 'Jennifer Liu|Tom Wilson'
-                }
-                self.meeting_gen.generate_transcript('vendor_negotiation', config)
-                self.stats['meetings_generated'] += 1
-            except Exception as e:
-                self.stats['errors'].append(f"Vendor negotiation {topic}: {str(e)}")
+            config = {
+                'meeting_type': 'vendor_negotiation',
+                'topic': topic,
+                'date': (self.run_date - timedelta(days=200-i*12)).strftime('%Y-%m-%d'),
+                'participants': 'Jennifer Liu|Tom Wilson'
+            }
+            jobs.append(meeting_job('vendor_negotiation', config, f"Vendor negotiation {topic}"))
+        sections.append(('Generating 15 vendor negotiations...', jobs))
 
         # 3. Lessons Learned (25 total)
-        print("\n[3/5] Generating 25 lessons learned meetings...")
+        jobs = []
         for i in range(25):
             store_id = f'Store-{170+i}'  # Historical stores
-            try:
-                config = {
-                    'meeting_type': 'lessons_learned',
-                    'store_id': store_id,
-                    'date': (datetime.now() - timedelta(days=220-i*7)).strftime('%Y-%m-%d'),
-                    'participants': 'Sarah Chen|Tom Wilson|David Park|Lisa Thompson'
-                }
-                self.meeting_gen.generate_transcript('lessons_learned', config)
-                self.stats['meetings_generated'] += 1
-                self.stats['stores_covered'].add(store_id)
-            except Exception as e:
-                self.stats['errors'].append(f"Lessons learned {store_id}: {str(e)}")
+            config = {
+                'meeting_type': 'lessons_learned',
+                'store_id': store_id,
+                'date': (self.run_date - timedelta(days=220-i*7)).strftime('%Y-%m-%d'),
+                'participants': 'Sarah Chen|Tom Wilson|David Park|Lisa Thompson'
+            }
+            jobs.append(meeting_job('lessons_learned', config, f"Lessons learned {store_id}", store_id))
+        sections.append(('Generating 25 lessons learned meetings...', jobs))
 
         # 4. Design Reviews (10 total)
-        print("\n[4/5] Generating 10 design reviews...")
+        jobs = []
         template_versions = [
             'v2.3', 'v2.4', 'v2.5', 'v2.6', 'v2.7',
             'v3.0', 'v3.1', 'v3.2', 'v3.3', 'v3.4'
         ]
 
         for i, version in enumerate(template_versions):
-            try:
-                config = {
-                    'meeting_type': 'design_review',
-                    'topic': f'template-{version}',
-                    'template_version': version,
-                    'date': (datetime.now() - timedelta(days=240-i*20)).strftime('%Y-%m-%d'),
-                    'participants': 'Carlos Martinez|Angela Wu|David Park'
-                }
-                self.meeting_gen.generate_transcript('design_review', config)
-                self.stats['meetings_generated'] += 1
-            except Exception as e:
-                self.stats['errors'].append(f"Design review {version}: {str(e)}")
+            config = {
+                'meeting_type': 'design_review',
+                'topic': f'template-{version}',
+                'template_version': version,
+                'date': (self.run_date - timedelta(days=240-i*20)).strftime('%Y-%m-%d'),
+                'participants': 'Carlos Martinez|Angela Wu|David Park'
+            }
+            jobs.append(meeting_job('design_review', config, f"Design review {version}"))
+        sections.append(('Generating 10 design reviews...', jobs))
 
         # 5. Weekly Dev Syncs (10 total)
-        print("\n[5/5] Generating 10 weekly dev syncs...")
+        jobs = []
         markets = [
             'Columbus-Market', 'Cincinnati-Market', 'Cleveland-Market',
             'Pittsburgh-Market', 'Indianapolis-Market', 'Louisville-Market',
@@ -124,17 +119,30 @@ class Phase2Generator:
         ]
 
         for i, market in enumerate(markets):
-            try:
-                config = {
-                    'meeting_type': 'weekly_dev_sync',
-                    'topic': market,
-                    'date': (datetime.now() - timedelta(days=70-i*7)).strftime('%Y-%m-%d'),
-                    'participants': 'Sarah Chen|Jennifer Liu'
-                }
-                self.meeting_gen.generate_transcript('weekly_dev_sync', config)
-                self.stats['meetings_generated'] += 1
-            except Exception as e:
-                self.stats['errors'].append(f"Weekly sync {market}: {str(e)}")
+            config = {
+                'meeting_type': 'weekly_dev_sync',
+                'topic': market,
+                'date': (self.run_date - timedelta(days=70-i*7)).strftime('%Y-%m-%d'),
+                'participants': 'Sarah Chen|Jennifer Liu'
+            }
+            jobs.append(meeting_job('weekly_dev_sync', config, f"Weekly sync {market}"))
+        sections.append(('Generating 10 weekly dev syncs...', jobs))
+
+        return sections
+
+    def generate_meetings(self, workers=1, pipeline=False):
+        """Generate 75 meeting transcripts across 100 stores."""
+        print("\n" + "="*60)
+        print("PHASE 2: MEETING TRANSCRIPT GENERATION")
+        print("="*60 + "\n")
+
+        for result in run_meeting_jobs(self.meeting_gen, self.meeting_jobs(), workers, pipeline):
+            if result['error']:
+                self.stats['errors'].append(result['error'])
+                continue
+            self.stats['meetings_generated'] += 1
+            if result['job']['store_id']:
+                self.stats['stores_covered'].add(result['job']['store_id'])
 
         print(f"\n✓ Meetings generated: {self.stats['meetings_generated']}/75")
 
@@ -205,8 +213,8 @@ class Phase2Generator:
             print(f"\nGenerating {thread_count} threads for '{channel}'...")
 
             for i in range(thread_count):
-                theme = random.choice(themes)
-                store_id = random.choice(self.stores[:50])  # Use first 50 stores
+                theme = self.rng.choice(themes)
+                store_id = self.rng.choice(self.stores[:50])  # Use first 50 stores
 
                 try:
                     config = {
@@ -215,13 +223,14 @@ class Phase2Generator:
                             {
                                 'theme': theme,
                                 'store_id': store_id,
-                                'date': (datetime.now() - timedelta(days=random.randint(5, 150))).strftime('%Y-%m-%d')
+                                'date': (self.run_date - timedelta(days=self.rng.randint(5, 150))).strftime('%Y-%m-%d')
                             }
                         ],
                         'participant_pool': ['Sarah Chen', 'Tom Wilson', 'Jennifer Liu', 'Mike Rodriguez', 'David Park']
                     }
 
-                    result = self.teams_gen.generate_conversations(config)
+                    with self.metrics.job('teams_thread'):
+                        result = self.teams_gen.generate_conversations(config)
                     total_threads += len(result['threads'])
                     self.stats['teams_threads_generated'] += len(result['threads'])
 
@@ -238,6 +247,8 @@ class Phase2Generator:
         print(f"\nMeetings Generated:         {self.stats['meetings_generated']}/75")
         print(f"Teams Threads Generated:    {self.stats['teams_threads_generated']}")
         print(f"Stores Covered:             {len(self.stats['stores_covered'])}")
+        if self.meeting_gen.cache is not None:
+            print(f"Generation Cache:           {self.meeting_gen.cache.summary()}")
 
         if self.stats['errors']:
             print(f"\n⚠ Errors encountered:       {len(self.stats['errors'])}")
@@ -250,7 +261,7 @@ class Phase2Generator:
 
         print("\n" + "="*60)
 
-    def run(self):
+    def run(self, workers=1, pipeline=False):
         """Run full Phase 2 generation."""
         print("\n" + "="*60)
         print("PHASE 2: SCALING TO 100 STORES")
@@ -262,11 +273,21 @@ class Phase2Generator:
         print("  - 6 channels")
         print("\n" + "="*60)
 
+        self.metrics.start()
+
         # Generate meetings
-        self.generate_meetings()
+        with self.metrics.stage('meetings'):
+            self.generate_meetings(workers, pipeline)
+        if self.meeting_gen.cache is not None:
+            self.meeting_gen.cache.save()
 
         # Generate Teams conversations
-        self.generate_teams_conversations()
+        with self.metrics.stage('teams_conversations'):
+            self.generate_teams_conversations()
+        if self.teams_gen.cache is not None:
+            self.teams_gen.cache.save()
+
+        self.metrics.finish()
 
         # Print summary
         self.print_summary()
@@ -274,8 +295,32 @@ class Phase2Generator:
 
 def main():
     """Main entry point."""
-    generator = Phase2Generator()
-    generator.run()
+    parser = argparse.ArgumentParser(description='Phase 2 enhanced data generation')
+    parser.add_argument('--cache', action='store_true',
+                        help='Skip meetings and Teams threads whose inputs are unchanged since the last cached run')
+    parser.add_argument('--cache-dir', default='output/.generation_cache',
+                        help='Generation cache location (default: output/.generation_cache)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Render meetings across N worker processes (default: 1, serial)')
+    parser.add_argument('--pipeline', action='store_true',
+                        help='Write transcripts behind a bounded queue while the next ones render')
+    add_metrics_arguments(parser)
+    add_run_arguments(parser)
+    add_output_arguments(parser)
+
+    args = parser.parse_args()
+    seed = configure_run(args)
+    configure_output(args)
+    metrics = configure_metrics(args)
+
+    cache = GenerationCache(args.cache_dir) if args.cache else None
+    generator = Phase2Generator(cache=cache, seed=seed, metrics=metrics)
+    generator.run(workers=args.workers, pipeline=args.pipeline)
+
+    if metrics.enabled:
+        path = args.metrics or DEFAULT_METRICS_PATH
+        report = metrics.write(path)
+        print(f"✓ Run metrics: {report['run']['artifacts_per_second']} artifacts/sec -> {path}")
 
 
 if __name__ == '__main__':
@@ -10,22 +10,32 @@ Generates:
 - 8 channels with comprehensive themes
 """
 
+import argparse
 import os
-import random
-from datetime import datetime, timedelta
+from datetime import timedelta
 from generate_meeting_transcripts_v2 import EnhancedMeetingGenerator
 from generate_teams_conversations import TeamsConversationGenerator
+from generation_cache import GenerationCache
+from parallel_meetings import meeting_job, run_meeting_jobs
+from artifact_io import add_output_arguments, configure_output
+from run_context import add_run_arguments, configure_run, get_clock, job_rng
+from run_metrics import DEFAULT_METRICS_PATH, NULL_METRICS, add_metrics_arguments, configure_metrics
 
 
 class Phase3Generator:
     """Generate Phase 3 production dataset."""
 
-    def __init__(self):
-        self.meeting_gen = EnhancedMeetingGenerator()
-        self.teams_gen = TeamsConversationGenerator()
+    def __init__(self, sink=None, cache=None, seed=None, metrics=None):
+        self.metrics = metrics or NULL_METRICS
+        self.meeting_gen = EnhancedMeetingGenerator(sink=sink, cache=cache, seed=seed, metrics=self.metrics)
+        self.teams_gen = TeamsConversationGenerator(seed=seed, cache=cache)
+        self.rng = job_rng(seed, 'phase3', 'teams')
         # Expanded store range: Store-101 to Store-400 (300 stores)
         self.stores = [f'Store-{100+i}' for i in range(1, 301)]
-        self.base_date = datetime.now() - timedelta(days=365)  # 12 months ago
+        self.base_date = get_clock().now() - timedelta(days=365)  # 12 months ago
+        # Store context for every store these meetings reference, computed in one pass
+        if self.meeting_gen.context_table is not None:
+            self.meeting_gen.context_table.build(self.stores + [f'Store-{50 + i}' for i in range(80)])
         self.stats = {
             'meetings_generated': 0,
             'teams_threads_generated': 0,
@@ -33,32 +43,26 @@ class Phase3Generator:
             'errors': []
         }
 
-    def generate_meetings(self):
-        """Generate 250 meeting transcripts across 300 stores with 12-month span."""
-        print("\n" + "="*60)
-        print("PHASE 3: PRODUCTION MEETING GENERATION")
-        print("="*60 + "\n")
+    def meeting_jobs(self):
+        """Meeting jobs in generation order, grouped into (heading, jobs) sections."""
+        sections = []
 
         # 1. Site Visit Debriefs (50 total)
-        print("[1/5] Generating 50 site visit debriefs...")
+        jobs = []
         for i in range(50):
             store_id = self.stores[i * 6]  # Spread across store range
             days_offset = 30 + (i * 7)  # Weekly cadence over year
-            try:
-                config = {
-                    'meeting_type': 'site_visit_debrief',
-                    'store_id': store_id,
-                    'date': (self.base_date + timedelta(days=days_offset)).strftime('%Y-%m-%d'),
-                    'participants': 'Sarah Chen|Tom Wilson|Mike Rodriguez'
-                }
-                self.meeting_gen.generate_transcript('site_visit_debrief', config)
-                self.stats['meetings_generated'] += 1
-                self.stats['stores_covered'].add(store_id)
-            except Exception as e:
-                self.stats['errors'].append(f"Site visit {store_id}: {str(e)}")
+            config = {
+                'meeting_type': 'site_visit_debrief',
+                'store_id': store_id,
+                'date': (self.base_date + timedelta(days=days_offset)).strftime('%Y-%m-%d'),
+                'participants': 'Sarah Chen|Tom Wilson|Mike Rodriguez'
+            }
+            jobs.append(meeting_job('site_visit_debrief', config, f"Site visit {store_id}", store_id))
+        sections.append(('Generating 50 site visit debriefs...', jobs))
 
         # 2. Vendor Negotiations (50 total - quarterly patterns)
-        print("\n[2/5] Generating 50 vendor negotiations...")
+        jobs = []
         vendor_topics = [
             # Q1 topics
             'hvac-vendors-q1-2025', 'electrical-contractors-q1', 'plumbing-vendors-q1',
@@ -85,39 +89,32 @@ class Phase3Generator:
         for i, topic in enumerate(vendor_topics[:50]):
             quarter = (i // 13) + 1  # Roughly 13 per quarter
             days_offset = (quarter - 1) * 90 + (i % 13) * 7
-            try:
-                config = {
-                    'meeting_type': 'vendor_negotiation',
-                    'topic': topic,
-                    'date': (self.base_date + timedelta(days=days_offset)).strftime('%Y-%m-%d'),
-                    'participants': 'Jennifer Liu|Tom Wilson'
-                }
-                self.meeting_gen.generate_transcript('vendor_negotiation', config)
-                self.stats['meetings_generated'] += 1
-            except Exception as e:
-                self.stats['errors'].append(f"Vendor negotiation {topic}: {str(e)}")
+            config = {
+                'meeting_type': 'vendor_negotiation',
+                'topic': topic,
+                'date': (self.base_date + timedelta(days=days_offset)).strftime('%Y-%m-%d'),
+                'participants': 'Jennifer Liu|Tom Wilson'
+            }
+            jobs.append(meeting_job('vendor_negotiation', config, f"Vendor negotiation {topic}"))
+        sections.append(('Generating 50 vendor negotiations...', jobs))
 
         # 3. Lessons Learned (80 total)
-        print("\n[3/5] Generating 80 lessons learned meetings...")
+        jobs = []
         for i in range(80):
             # Reference historical stores (Store-50 to Store-129)
             store_id = f'Store-{50 + i}'
             days_offset = 60 + (i * 4)  # Every 4 days over the year
-            try:
-                config = {
-                    'meeting_type': 'lessons_learned',
-                    'store_id': store_id,
-                    'date': (self.base_date + timedelta(days=days_offset)).strftime('%Y-%m-%d'),
-                    'participants': 'Sarah Chen|Tom Wilson|David Park|Lisa Thompson'
-                }
-                self.meeting_gen.generate_transcript('lessons_learned', config)
-                self.stats['meetings_generated'] += 1
-                self.stats['stores_covered'].add(store_id)
-            except Exception as e:
-                self.stats['errors'].append(f"Lessons learned {store_id}: {str(e)}")
+            config = {
+                'meeting_type': 'lessons_learned',
+                'store_id': store_id,
+                'date': (self.base_date + timedelta(days=days_offset)).strftime('%Y-%m-%d'),
+                'participants': 'Sarah Chen|Tom Wilson|David Park|Lisa Thompson'
+            }
+            jobs.append(meeting_job('lessons_learned', config, f"Lessons learned {store_id}", store_id))
+        sections.append(('Generating 80 lessons learned meetings...', jobs))
 
         # 4. Design Reviews (40 total - monthly cadence)
-        print("\n[4/5] Generating 40 design reviews...")
+        jobs = []
         template_versions = []
         # Generate version numbers v2.0 to v5.9
         for major in [2, 3, 4, 5]:
@@ -130,21 +127,18 @@ class Phase3Generator:
 
         for i, version in enumerate(template_versions[:40]):
             days_offset = 15 + (i * 9)  # Roughly every 9 days
-            try:
-                config = {
-                    'meeting_type': 'design_review',
-                    'topic': f'template-{version}',
-                    'template_version': version,
-                    'date': (self.base_date + timedelta(days=days_offset)).strftime('%Y-%m-%d'),
-                    'participants': 'Carlos Martinez|Angela Wu|David Park'
-                }
-                self.meeting_gen.generate_transcript('design_review', config)
-                self.stats['meetings_generated'] += 1
-            except Exception as e:
-                self.stats['errors'].append(f"Design review {version}: {str(e)}")
+            config = {
+                'meeting_type': 'design_review',
+                'topic': f'template-{version}',
+                'template_version': version,
+                'date': (self.base_date + timedelta(days=days_offset)).strftime('%Y-%m-%d'),
+                'participants': 'Carlos Martinez|Angela Wu|David Park'
+            }
+            jobs.append(meeting_job('design_review', config, f"Design review {version}"))
+        sections.append(('Generating 40 design reviews...', jobs))
 
         # 5. Weekly Dev Syncs (30 total - weekly cadence across markets)
-        print("\n[5/5] Generating 30 weekly dev syncs...")
+        jobs = []
         markets = [
             'Columbus-Market', 'Cincinnati-Market', 'Cleveland-Market',
             'Pittsburgh-Market', 'Indianapolis-Market', 'Louisville-Market',
@@ -159,17 +153,30 @@ class Phase3Generator:
         for i in range(30):
             market = markets[i]
             days_offset = 7 + (i * 12)  # Every 12 days (just under weekly)
-            try:
-                config = {
-                    'meeting_type': 'weekly_dev_sync',
-                    'topic': market,
-                    'date': (self.base_date + timedelta(days=days_offset)).strftime('%Y-%m-%d'),
-                    'participants': 'Sarah Chen|Jennifer Liu'
-                }
-                self.meeting_gen.generate_transcript('weekly_dev_sync', config)
-                self.stats['meetings_generated'] += 1
-            except Exception as e:
-                self.stats['errors'].append(f"Weekly sync {market}: {str(e)}")
+            config = {
+                'meeting_type': 'weekly_dev_sync',
+                'topic': market,
+                'date': (self.base_date + timedelta(days=days_offset)).strftime('%Y-%m-%d'),
+                'participants': 'Sarah Chen|Jennifer Liu'
+            }
+            jobs.append(meeting_job('weekly_dev_sync', config, f"Weekly sync {market}"))
+        sections.append(('Generating 30 weekly dev syncs...', jobs))
+
+        return sections
+
+    def generate_meetings(self, workers=1, pipeline=False):
+        """Generate 250 meeting transcripts across 300 stores with 12-month span."""
+        print("\n" + "="*60)
+        print("PHASE 3: PRODUCTION MEETING GENERATION")
+        print("="*60 + "\n")
+
+        for result in run_meeting_jobs(self.meeting_gen, self.meeting_jobs(), workers, pipeline):
+            if result['error']:
+                self.stats['errors'].append(result['error'])
+                continue
+            self.stats['meetings_generated'] += 1
+            if result['job']['store_id']:
+                self.stats['stores_covered'].add(result['job']['store_id'])
 
         print(f"\n✓ Meetings generated: {self.stats['meetings_generated']}/250")
 
@@ -267,11 +274,11 @@ class Phase3Generator:
             print(f"\nGenerating {thread_count} threads for '{channel}'...")
 
             for i in range(thread_count):
-                theme = random.choice(themes)
+                theme = self.rng.choice(themes)
                 # Use broader store range for Teams conversations
-                store_id = random.choice(self.stores[:150])
+                store_id = self.rng.choice(self.stores[:150])
                 # Spread across 12 months
-                days_offset = random.randint(0, 365)
+                days_offset = self.rng.randint(0, 365)
 
                 try:
                     config = {
@@ -290,7 +297,8 @@ class Phase3Generator:
                         ]
                     }
 
-                    result = self.teams_gen.generate_conversations(config)
+                    with self.metrics.job('teams_thread'):
+                        result = self.teams_gen.generate_conversations(config)
                     total_threads += len(result['threads'])
                     self.stats['teams_threads_generated'] += len(result['threads'])
 
@@ -307,6 +315,8 @@ class Phase3Generator:
         print(f"\nMeetings Generated:         {self.stats['meetings_generated']}/250")
         print(f"Teams Threads Generated:    {self.stats['teams_threads_generated']}")
         print(f"Stores Covered:             {len(self.stats['stores_covered'])}")
+        if self.meeting_gen.cache is not None:
+            print(f"Generation Cache:           {self.meeting_gen.cache.summary()}")
 
         if self.stats['errors']:
             print(f"\n⚠ Errors encountered:       {len(self.stats['errors'])}")
@@ -319,7 +329,7 @@ class Phase3Generator:
 
         print("\n" + "="*60)
 
-    def run(self):
+    def run(self, workers=1, pipeline=False):
         """Run full Phase 3 generation."""
         print("\n" + "="*60)
         print("PHASE 3: PRODUCTION SCALE - 300 STORES")
@@ -332,11 +342,21 @@ class Phase3Generator:
         print("  - 12-month temporal span")
         print("\n" + "="*60)
 
+        self.metrics.start()
+
         # Generate meetings
-        self.generate_meetings()
+        with self.metrics.stage('meetings'):
+            self.generate_meetings(workers, pipeline)
+        if self.meeting_gen.cache is not None:
+            self.meeting_gen.cache.save()
 
         # Generate Teams conversations
-        self.generate_teams_conversations()
+        with self.metrics.stage('teams_conversations'):
+            self.generate_teams_conversations()
+        if self.teams_gen.cache is not None:
+            self.teams_gen.cache.save()
+
+        self.metrics.finish()
 
         # Print summary
         self.print_summary()
@@ -344,8 +364,32 @@ class Phase3Generator:
 
 def main():
     """Main entry point."""
-    generator = Phase3Generator()
-    generator.run()
+    parser = argparse.ArgumentParser(description='Phase 3 production data generation')
+    parser.add_argument('--cache', action='store_true',
+                        help='Skip meetings and Teams threads whose inputs are unchanged since the last cached run')
+    parser.add_argument('--cache-dir', default='output/.generation_cache',
+                        help='Generation cache location (default: output/.generation_cache)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Render meetings across N worker processes (default: 1, serial)')
+    parser.add_argument('--pipeline', action='store_true',
+                        help='Write transcripts behind a bounded queue while the next ones render')
+    add_metrics_arguments(parser)
+    add_run_arguments(parser)
+    add_output_arguments(parser)
+
+    args = parser.parse_args()
+    seed = configure_run(args)
+    configure_output(args)
+    metrics = configure_metrics(args)
+
+    cache = GenerationCache(args.cache_dir) if args.cache else None
+    generator = Phase3Generator(cache=cache, seed=seed, metrics=metrics)
+    generator.run(workers=args.workers, pipeline=args.pipeline)
+
+    if metrics.enabled:
+        path = args.metrics or DEFAULT_METRICS_PATH
+        report = metrics.write(path)
+        print(f"✓ Run metrics: {report['run']['artifacts_per_second']} artifacts/sec -> {path}")
 
 
 if __name__ == '__main__':
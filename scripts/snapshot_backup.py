@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Incremental Snapshot Backups
+
+Backs up a directory tree (e.g. output/07_Conversations/meeting_transcripts) as a series
+of snapshots whose cost is proportional to what changed since the previous one:
+
+- each snapshot has a manifest of relative path -> sha256, size, mtime
+- files whose size and mtime match the previous manifest are not re-hashed
+- files with the same hash as in the previous snapshot are hardlinked to it
+- only new or changed files are copied
+
+Snapshot files are never hardlinked to the live tree, because generators rewrite
+transcripts in place. Snapshots are assembled in a temporary directory and renamed
+into place, so an interrupted backup never looks complete.
+
+Layout:
+    <root>/<name>/manifest.json
+    <root>/<name>/files/<relative path>
+
+Usage:
+    python snapshot_backup.py create --source output/07_Conversations/meeting_transcripts
+    python snapshot_backup.py list
+    python snapshot_backup.py restore --name 20250101_000000 --dest output/07_Conversations/meeting_transcripts
+    python snapshot_backup.py prune --keep 5
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+from datetime import datetime
+from typing import Dict, List, Optional
+
+MANIFEST_FILENAME = 'manifest.json'
+MANIFEST_VERSION = 1
+DEFAULT_ROOT = 'output/07_Conversations_snapshots'
+
+
+def _hash_file(path: str) -> str:
+    """SHA-256 of a file, read in 1 MB chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _load_manifest(snapshot_dir: str) -> Optional[Dict]:
+    """Load a snapshot manifest, or None for incomplete snapshots."""
+    path = os.path.join(snapshot_dir, MANIFEST_FILENAME)
+    if not os.path.exists(path):
+        return None
+
+    with open(path, 'r') as f:
+        manifest = json.load(f)
+
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def list_snapshots(root: str = DEFAULT_ROOT) -> List[str]:
+    """Names of complete snapshots, oldest first."""
+    if not os.path.isdir(root):
+        return []
+
+    snapshots = []
+    for name in os.listdir(root):
+        if name.endswith('.tmp'):
+            continue
+        manifest = _load_manifest(os.path.join(root, name))
+        if manifest is not None:
+            snapshots.append((manifest['sequence'], name))
+
+    return [name for _, name in sorted(snapshots)]
+
+
+def _walk(source: str):
+    """Yield relative paths of all files under source, in sorted order."""
+    for dirpath, dirnames, filenames in os.walk(source):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            full = os.path.join(dirpath, filename)
+            yield os.path.relpath(full, source).replace(os.sep, '/')
+
+
+def _snapshot_name(root: str) -> str:
+    """Timestamped name (wall clock: backups record when they ran), suffixed if taken."""
+    base = datetime.now().strftime('%Y%m%d_%H%M%S')
+    name, counter = base, 1
+    while os.path.exists(os.path.join(root, name)):
+        name = f'{base}-{counter}'
+        counter += 1
+    return name
+
+
+def create_snapshot(source: str, root: str = DEFAULT_ROOT, name: Optional[str] = None) -> Dict:
+    """
+    Snapshot a directory tree.
+
+    Returns:
+        Dictionary with the snapshot path and counts of linked, copied and hashed files
+    """
+    os.makedirs(root, exist_ok=True)
+    name = name or _snapshot_name(root)
+    final_dir = os.path.join(root, name)
+    tmp_dir = final_dir + '.tmp'
+    if os.path.exists(tmp_dir):
+        shutil.rmtree(tmp_dir)
+
+    previous = list_snapshots(root)
+    prev_dir = os.path.join(root, previous[-1]) if previous else None
+    prev_manifest = _load_manifest(prev_dir) if prev_dir else {'sequence': 0, 'files': {}}
+    prev_files = prev_manifest['files']
+
+    files = {}
+    stats = {'path': final_dir, 'linked': 0, 'copied': 0, 'hashed': 0}
+    created_dirs = set()
+
+    for rel in _walk(source):
+        src = os.path.join(source, rel)
+        st = os.stat(src)
+        prev = prev_files.get(rel)
+
+        # Stat cache: same size and mtime as last time means same content
+        if prev and prev['size'] == st.st_size and prev['mtime_ns'] == st.st_mtime_ns:
+            digest = prev['sha256']
+        else:
+            digest = _hash_file(src)
+            stats['hashed'] += 1
+
+        dest = os.path.join(tmp_dir, 'files', *rel.split('/'))
+        dest_dir = os.path.dirname(dest)
+        if dest_dir not in created_dirs:
+            os.makedirs(dest_dir, exist_ok=True)
+            created_dirs.add(dest_dir)
+
+        if prev and prev['sha256'] == digest:
+            os.link(os.path.join(prev_dir, 'files', *rel.split('/')), dest)
+            stats['linked'] += 1
+        else:
+            shutil.copy2(src, dest)
+            stats['copied'] += 1
+
+        files[rel] = {'sha256': digest, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+    os.makedirs(tmp_dir, exist_ok=True)
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'sequence': prev_manifest['sequence'] + 1,
+        'source': source,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'files': files
+    }
+    with open(os.path.join(tmp_dir, MANIFEST_FILENAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    os.replace(tmp_dir, final_dir)
+    return stats
+
+
+def restore_snapshot(name: str, dest: str, root: str = DEFAULT_ROOT, verify: bool = True) -> int:
+    """
+    Replace dest with the contents of a snapshot. Returns the number of files restored.
+
+    Files are copied, not linked, so later in-place rewrites cannot alter the snapshot.
+    """
+    snapshot_dir = os.path.join(root, name)
+    manifest = _load_manifest(snapshot_dir)
+    if manifest is None:
+        raise FileNotFoundError(f"No complete snapshot named {name} in {root}")
+
+    dest = dest.rstrip('/')
+    staging = dest + '.restore.tmp'
+    if os.path.exists(staging):
+        shutil.rmtree(staging)
+
+    for rel, entry in sorted(manifest['files'].items()):
+        src = os.path.join(snapshot_dir, 'files', *rel.split('/'))
+        target = os.path.join(staging, *rel.split('/'))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copy2(src, target)
+
+        if verify and _hash_file(target) != entry['sha256']:
+            shutil.rmtree(staging)
+            raise ValueError(f"Checksum mismatch restoring {rel} from {name}")
+
+    os.makedirs(staging, exist_ok=True)
+
+    # Swap the restored tree into place
+    if os.path.exists(dest):
+        old = dest + '.restore.old'
+        if os.path.exists(old):
+            shutil.rmtree(old)
+        os.replace(dest, old)
+        os.replace(staging, dest)
+        shutil.rmtree(old)
+    else:
+        os.makedirs(os.path.dirname(dest) or '.', exist_ok=True)
+        os.replace(staging, dest)
+
+    return len(manifest['files'])
+
+
+def prune_snapshots(keep: int, root: str = DEFAULT_ROOT) -> List[str]:
+    """Delete all but the newest `keep` snapshots (and leftover temp dirs). Returns removed names."""
+    snapshots = list_snapshots(root)
+    removed = snapshots[:-keep] if keep > 0 else snapshots
+
+    # Hardlinked files stay alive in the snapshots that still reference them
+    for name in removed:
+        shutil.rmtree(os.path.join(root, name))
+
+    if os.path.isdir(root):
+        for name in os.listdir(root):
+            if name.endswith('.tmp'):
+                shutil.rmtree(os.path.join(root, name))
+
+    return removed
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Incremental hardlink snapshot backups')
+    parser.add_argument('--root', default=DEFAULT_ROOT, help=f'Snapshot directory (default: {DEFAULT_ROOT})')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    create = subparsers.add_parser('create', help='Snapshot a directory tree')
+    create.add_argument('--source', default='output/07_Conversations/meeting_transcripts', help='Tree to back up')
+    create.add_argument('--name', help='Snapshot name (default: run timestamp)')
+
+    subparsers.add_parser('list', help='List snapshots')
+
+    restore = subparsers.add_parser('restore', help='Restore a snapshot')
+    restore.add_argument('--name', help='Snapshot name (default: latest)')
+    restore.add_argument('--dest', default='output/07_Conversations/meeting_transcripts', help='Tree to replace')
+
+    prune = subparsers.add_parser('prune', help='Delete old snapshots')
+    prune.add_argument('--keep', type=int, default=5, help='Number of newest snapshots to keep')
+
+    args = parser.parse_args()
+
+    if args.command == 'create':
+        stats = create_snapshot(args.source, args.root, args.name)
+        print(f"✓ Snapshot {stats['path']}: {stats['copied']} copied, {stats['linked']} linked, "
+              f"{stats['hashed']} hashed")
+    elif args.command == 'list':
+        for name in list_snapshots(args.root):
+            manifest = _load_manifest(os.path.join(args.root, name))
+            print(f"{name}  {len(manifest['files'])} files  {manifest['source']}")
+    elif args.command == 'restore':
+        snapshots = list_snapshots(args.root)
+        name = args.name or (snapshots[-1] if snapshots else None)
+        if name is None:
+            parser.error(f"No snapshots in {args.root}")
+        count = restore_snapshot(name, args.dest, args.root)
+        print(f"✓ Restored {count} files from {name} into {args.dest}")
+    elif args.command == 'prune':
+        removed = prune_snapshots(args.keep, args.root)
+        print(f"✓ Pruned {len(removed)} snapshots, kept {min(args.keep, len(list_snapshots(args.root)))}")
+
+
+if __name__ == '__main__':
+    main()
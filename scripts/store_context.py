@@ -0,0 +1,461 @@
+#!/usr/bin/env python3
+"""
+Store Context Table
+
+Precomputes the dialogue context used by EnhancedMeetingGenerator from the structured
+data in output/ (folders 01-06) instead of per-meeting constants:
+
+- site_visit_debrief: reference project, regional modifier, electrical estimate and breakdown
+- lessons_learned:    estimated vs actual electrical, variance, backup vendor, schedule outcome
+- vendor_negotiation: lead times, unit pricing, discounts and terms per vendor category
+- weekly_dev_sync:    pipeline size, budget variance and lead times per market
+
+Store rows are computed for a whole list of stores in one vectorized pass, so rendering
+thousands of transcripts is a dict lookup per meeting.
+
+Usage:
+    table = StoreContextTable('output')
+    table.build([f'Store-{n}' for n in range(101, 401)])
+    context = table.context('site_visit_debrief', {'store_id': 'Store-217', 'date': '2025-03-01'})
+
+    python store_context.py --stores 101-400 --out /tmp/store_context.csv
+"""
+
+import argparse
+import re
+from datetime import datetime
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+from artifact_io import artifact_exists, load_json, open_artifact
+from historical_projects import read_projects
+from regional_matrix import RegionalModifierMatrix
+from vendor_index import VendorPriceIndex
+
+# New stores are planned on the suburban prototype (see 05_Cost_Models)
+DEFAULT_STORE_TYPE = 'suburban_standard'
+DEFAULT_SQFT = 3500
+
+# Electrical estimate split into labor / materials / permits
+MATERIALS_SHARE = 0.51
+PERMITS_SHARE = 0.06
+
+# Topic keywords -> vendor catalog category
+TOPIC_CATEGORIES = [
+    ('hvac', 'HVAC'),
+    ('electrical', 'Electrical'),
+    ('lighting', 'Electrical'),
+    ('plumbing', 'Plumbing'),
+    ('fire-suppression', 'Plumbing'),
+    ('general-contractor', 'General Contractor'),
+    ('flooring', 'Fixtures'),
+    ('signage', 'Fixtures'),
+    ('security', 'Technology'),
+]
+
+SITE_VISIT_FIELDS = [
+    'store_id', 'historical_store', 'ref_market', 'ref_market_clause', 'cost', 'historical_cost', 'market',
+    'modifier', 'modifier_pct', 'modifier_direction', 'modifier_reason', 'labor', 'materials', 'permits'
+]
+LESSONS_FIELDS = [
+    'store_id', 'electrical_estimated', 'electrical_actual', 'variance', 'variance_pct',
+    'direction', 'backup_vendor', 'vendor_pricing_note', 'vendor_recommendation', 'timeline_status',
+    'learning_financial', 'learning_operational'
+]
+
+# Weekly sync explanation of the budget variance, by direction
+VARIANCE_REASONS = {
+    'under': 'favorable vendor pricing on recent contracts',
+    'over': 'change orders and higher labor rates on recent contracts',
+}
+
+
+def _percent(value) -> int:
+    """Parse '7%' / '12-15%' style catalog values (first number)."""
+    match = re.search(r'\d+(?:\.\d+)?', str(value))
+    return int(round(float(match.group(0)))) if match else 0
+
+
+def _lower_first(text: str) -> str:
+    """Lower-case the first letter so catalog notes read mid-sentence."""
+    return text[:1].lower() + text[1:] if text else text
+
+
+class StoreContextTable:
+    """Vectorized per-store and per-topic context built from the structured data folders."""
+
+    def __init__(self, data_dir: str = 'output'):
+        self.data_dir = data_dir
+
+        self.projects = self._load_projects()
+        with open_artifact(f'{data_dir}/04_Regional_Modifiers/regional_modifiers.csv') as f:
+            self.markets = pd.read_csv(f)
+        self.modifiers = RegionalModifierMatrix.from_frame(self.markets)
+        self.vendors = load_json(f'{data_dir}/06_Vendor_Data/vendor_catalog.json')['vendors']
+        with open_artifact(f'{data_dir}/06_Vendor_Data/vendor_pricing.csv') as f:
+            self.pricing = pd.read_csv(f)
+
+        self.vendor_index = VendorPriceIndex.from_tables(self.vendors, self.pricing, self.markets)
+
+        self.market_names = self.markets['market'].tolist()
+
+        self.table = pd.DataFrame(columns=['store_id']).set_index('store_id')
+        self._rows: Dict[str, Dict] = {}
+        self._vendor_context = self._build_vendor_context()
+        self._market_context = {}
+
+    @staticmethod
+    def available(data_dir: str = 'output') -> bool:
+        """True when the structured data the table needs has been generated."""
+        return all(artifact_exists(f'{data_dir}/{path}') for path in (
+            '03_Historical_Projects/historical_projects.json',
+            '04_Regional_Modifiers/regional_modifiers.csv',
+            '06_Vendor_Data/vendor_catalog.json',
+            '06_Vendor_Data/vendor_pricing.csv',
+        ))
+
+    def _load_projects(self) -> pd.DataFrame:
+        """Historical projects flattened to one row per store."""
+        jsonl_path = f'{self.data_dir}/03_Historical_Projects/historical_projects.jsonl'
+        if artifact_exists(jsonl_path):
+            # Streamed in chunks, so the raw records are never all held at once
+            df = pd.concat(read_projects(jsonl_path), ignore_index=True)
+        else:
+            df = pd.json_normalize(load_json(f'{self.data_dir}/03_Historical_Projects/historical_projects.json')['projects'])
+
+        df['store_num'] = df['store_id'].str.extract(r'(\d+)$')[0].astype(int)
+        df['permit_delay'] = df['lessons_learned'].map(lambda items: 'Delayed by permit issues' in items)
+        df['vendor_substitution'] = df['lessons_learned'].map(lambda items: 'Vendor substitution required' in items)
+        df['completion_date'] = pd.to_datetime(df['completion_date'])
+
+        # Schedule outcome relative to the typical build time for the store type
+        df['timeline_delta'] = df.groupby('store_type')['timeline_days'].transform('median').round().astype(int) \
+            - df['timeline_days']
+
+        return df.sort_values('store_num').reset_index(drop=True)
+
+    # ------------------------------------------------------------------
+    # Vendors
+    # ------------------------------------------------------------------
+
+    def _primary_vendors(self) -> Dict[str, Dict]:
+        """Highest-volume vendor per category."""
+        primary = {}
+        for vendor in self.vendors:
+            current = primary.get(vendor['category'])
+            if current is None or vendor['performance']['projects_completed'] > current['performance']['projects_completed']:
+                primary[vendor['category']] = vendor
+        return primary
+
+    def _backup_vendor_by_market(self) -> Dict[str, str]:
+        """Best on-budget non-primary vendor per market, else the primary electrical vendor."""
+        primary = self._primary_vendors()
+        primary_ids = {v['vendor_id'] for v in primary.values()}
+        electrical = primary.get('Electrical', {}).get('name', 'TempMaster')
+
+        backups = sorted(
+            (v for v in self.vendors if v['vendor_id'] not in primary_ids),
+            key=lambda v: -v['performance']['on_budget_rate']
+        )
+
+        result = {}
+        for market in self.market_names:
+            serving = [v['name'] for v in backups if self.vendor_index.serves(v['name'], market)]
+            result[market] = serving[0] if serving else electrical
+        return result
+
+    def _build_vendor_context(self) -> Dict[str, Dict]:
+        """Negotiation context per vendor category, from the catalog and price list."""
+        context = {}
+        index = self.vendor_index
+
+        for category, vendor in self._primary_vendors().items():
+            lead_time = index.lead_time_weeks[vendor['name']]
+            if lead_time is None:
+                continue  # Nothing to negotiate on without a stated lead time
+            performance = vendor['performance']
+
+            price = index.first_price(vendor['name'])
+            if price is not None:
+                unit_cost = int(price)
+            else:
+                # No catalog price: negotiate the typical per-store construction package
+                unit_cost = int(round(self.projects['categories.construction'].mean(), -2))
+
+            # Competing quotes for the same category set last quarter's reference price
+            competitors = [
+                int(index.first_price(v['name'])) for v in self.vendors
+                if v['category'] == category and v is not vendor and v['name'] in index.by_vendor
+            ]
+            old_unit_cost = min(competitors) if competitors else \
+                int(round(unit_cost / (2 - performance['on_budget_rate']), -2))
+
+            discount_pct = _percent(vendor['pricing'].get('volume_discount_5_units', 5))
+            higher_discount_pct = _percent(vendor['pricing'].get('volume_discount_10_units', discount_pct * 2))
+
+            context[category] = {
+                'vendor': vendor['name'],
+                'current_lead_time': lead_time,
+                'old_lead_time': max(1, int(round(lead_time * performance['on_time_rate']))),
+                'unit_cost': unit_cost,
+                'old_unit_cost': old_unit_cost,
+                'price_increase_pct': int(round((unit_cost - old_unit_cost) / old_unit_cost * 100)),
+                'discount_pct': discount_pct,
+                'higher_discount_pct': higher_discount_pct,
+                'discounted_cost': int(round(unit_cost * (1 - discount_pct / 100))),
+                'payment_terms': vendor['pricing'].get('payment_terms', 'Standard net 30')
+            }
+
+        return context
+
+    # ------------------------------------------------------------------
+    # Stores
+    # ------------------------------------------------------------------
+
+    def build(self, store_ids: List[str]) -> pd.DataFrame:
+        """Compute context rows for all given stores in one pass and add them to the table."""
+        new_ids = [s for s in dict.fromkeys(store_ids) if s not in self._rows]
+        if not new_ids:
+            return self.table
+
+        rows = self._compute(new_ids)
+        self.table = pd.concat([self.table, rows]) if len(self.table) else rows
+        self._rows.update(rows.to_dict('index'))
+        self._market_context = {}
+
+        return self.table
+
+    def _compute(self, store_ids: List[str]) -> pd.DataFrame:
+        """Vectorized context computation for a batch of stores."""
+        hist = self.projects
+
+        stores = pd.DataFrame({'store_id': store_ids})
+        stores['store_num'] = stores['store_id'].str.extract(r'(\d+)$')[0].astype(int)
+
+        # Store profile: historical row if built, otherwise planned on the default prototype
+        stores = stores.merge(hist[['store_id', 'store_type', 'square_footage', 'market']], on='store_id', how='left')
+        stores['in_history'] = stores['market'].notna()
+        planned_market = np.array(self.market_names, dtype=object)[stores['store_num'] % len(self.market_names)]
+        stores['market'] = stores['market'].where(stores['in_history'], planned_market)
+        stores['store_type'] = stores['store_type'].where(stores['in_history'], DEFAULT_STORE_TYPE)
+        stores['square_footage'] = stores['square_footage'].where(stores['in_history'], DEFAULT_SQFT).astype(int)
+
+        # Reference project: closest earlier completed store in the same market,
+        # falling back to the closest earlier store anywhere, then the first on record
+        ordered = stores.sort_values('store_num')
+        refs = hist[['store_num', 'market', 'store_id']].rename(
+            columns={'store_num': 'ref_num', 'store_id': 'ref_same_market'})
+        by_market = pd.merge_asof(ordered, refs, left_on='store_num', right_on='ref_num',
+                                  by='market', allow_exact_matches=False)
+        anywhere = pd.merge_asof(ordered[['store_num']], refs.drop(columns='market').rename(
+            columns={'ref_same_market': 'ref_anywhere'}), left_on='store_num', right_on='ref_num',
+            allow_exact_matches=False)
+        ordered['historical_store'] = by_market['ref_same_market'].fillna(anywhere['ref_anywhere']) \
+            .fillna(hist['store_id'].iloc[0]).values
+        stores = ordered.sort_index()
+
+        project_cols = ['store_id', 'market', 'square_footage', 'categories.electrical', 'variance_from_budget',
+                        'completion_date', 'timeline_delta', 'permit_delay', 'vendor_substitution']
+        ref = hist[project_cols].add_prefix('ref_').rename(columns={'ref_store_id': 'historical_store'})
+        stores = stores.merge(ref, on='historical_store', how='left')
+
+        # Lessons learned reviews the store's own project, or its reference if not yet built
+        stores['project_id'] = stores['store_id'].where(stores['in_history'], stores['historical_store'])
+        proj = hist[project_cols].add_prefix('proj_').rename(columns={'proj_store_id': 'project_id'})
+        stores = stores.merge(proj, on='project_id', how='left')
+
+        # --- site visit: estimate scaled from the reference by market modifier and size
+        stores['modifier'] = self.modifiers.column('electrical', stores['market'])
+        ref_modifier = self.modifiers.column('electrical', stores['ref_market'])
+        estimate = stores['ref_categories.electrical'] / ref_modifier * stores['modifier'] \
+            * stores['square_footage'] / stores['ref_square_footage']
+        stores['cost'] = ((estimate / 500).round() * 500).astype(int)
+        stores['historical_cost'] = stores['ref_categories.electrical'].astype(int)
+        stores['ref_market_clause'] = np.select(
+            [stores['ref_market'] == stores['market'], ref_modifier < stores['modifier'],
+             ref_modifier > stores['modifier']],
+            ['in this same market, so its labor rates carry over',
+             'in the ' + stores['ref_market'] + ' market where labor rates are lower',
+             'in the ' + stores['ref_market'] + ' market where labor rates are higher'],
+            'in the ' + stores['ref_market'] + ' market where labor rates are about the same'
+        )
+        stores['modifier_pct'] = ((stores['modifier'] - 1).abs() * 100).round().astype(int)
+        stores['modifier_direction'] = np.where(stores['modifier'] < 1, 'lower', 'higher')
+        stores['modifier_reason'] = stores['market'].map(self.modifiers.notes).fillna('regional labor rates') \
+            .map(_lower_first)
+        stores['materials'] = (stores['cost'] * MATERIALS_SHARE).round(-2).astype(int)
+        stores['permits'] = (stores['cost'] * PERMITS_SHARE).round(-2).astype(int)
+        stores['labor'] = stores['cost'] - stores['materials'] - stores['permits']
+
+        # --- lessons learned: budget derived from the recorded variance
+        actual = stores['proj_categories.electrical']
+        estimated = (actual / (1 + stores['proj_variance_from_budget'] / 100)).round(-2)
+        stores['electrical_actual'] = actual.astype(int)
+        stores['electrical_estimated'] = estimated.astype(int)
+        stores['variance'] = (actual - estimated).abs().astype(int)
+        stores['variance_pct'] = (stores['variance'] / estimated * 100).round(1)
+        under = actual < estimated
+        stores['direction'] = np.where(under, 'under', 'over')
+        stores['backup_vendor'] = stores['market'].map(self._backup_vendor_by_market())
+        stores['completion_date'] = stores['proj_completion_date']
+
+        delta = stores['proj_timeline_delta']
+        stores['timeline_status'] = np.select(
+            [delta > 0, delta < 0],
+            ['finished ' + delta.abs().astype(str) + ' days ahead of schedule',
+             'ran ' + delta.abs().astype(str) + ' days over schedule'],
+            'finished right on schedule'
+        )
+
+        variance_text = stores['variance'].map('${:,}'.format)
+        pct_text = stores['variance_pct'].map('{:.0f}%'.format)
+        stores['vendor_pricing_note'] = np.where(
+            under,
+            'Their pricing came in ' + pct_text + ' under our estimate and quality was excellent.',
+            'Their pricing came in ' + pct_text + ' over our estimate, though quality was excellent.'
+        )
+        stores['vendor_recommendation'] = np.where(
+            under,
+            "Based on this project, I'd recommend adding them to our preferred vendor list. The " + pct_text
+            + ' cost savings could be significant across our portfolio.',
+            "Based on this project, I'd keep them as a backup rather than a preferred vendor. A " + pct_text
+            + ' overrun would add up quickly across our portfolio.'
+        )
+        stores['learning_financial'] = np.where(
+            under,
+            'this saved us ' + variance_text + ' and shows backup vendors can offer better value',
+            'this cost us an extra ' + variance_text + ', so our electrical estimates need more contingency'
+        )
+        stores['learning_operational'] = np.select(
+            [stores['proj_permit_delay'], stores['proj_vendor_substitution']],
+            ['we need to start permit applications earlier in the schedule',
+             'we should always get quotes from at least two contractors'],
+            'the standard vendor process worked and we should keep using it'
+        )
+
+        columns = sorted(set(SITE_VISIT_FIELDS + LESSONS_FIELDS + ['store_type', 'square_footage',
+                                                                   'completion_date', 'in_history']))
+        return stores[columns].set_index('store_id', drop=False)
+
+    def _row(self, store_id: str) -> Dict:
+        """Context row for a store, computing it on demand if it was not prebuilt."""
+        if store_id not in self._rows:
+            self.build([store_id])
+        return self._rows[store_id]
+
+    # ------------------------------------------------------------------
+    # Markets
+    # ------------------------------------------------------------------
+
+    def _market_row(self, market: str) -> Dict:
+        """
+        Weekly sync context for a market, from its history and the planned stores built so far.
+
+        Recomputed after every build(), so it always reflects the full table. Markets with
+        no planned stores of their own report the portfolio average pipeline; with no
+        planned stores built at all the pipeline is unknown (None, left to the defaults).
+        """
+        if not self._market_context:
+            hist = self.projects
+            stats = hist.groupby('market').agg(
+                budget_variance=('variance_from_budget', 'mean'),
+                substitutions=('vendor_substitution', 'sum'),
+                permit_delays=('permit_delay', 'sum')
+            )
+            planned = self.table[~self.table['in_history'].astype(bool)] if len(self.table) else self.table
+            pipeline = planned.groupby('market').size() if len(planned) else pd.Series(dtype=int)
+            critical = planned.sort_values('cost', ascending=False).groupby('market')['store_id'].first() \
+                if len(planned) else pd.Series(dtype=object)
+
+            overall = {
+                'budget_variance': hist['variance_from_budget'].mean(),
+                'substitutions': hist['vendor_substitution'].sum() / max(len(stats), 1),
+            }
+            portfolio_pipeline = round(len(planned) / max(len(self.market_names), 1)) if len(planned) else None
+            portfolio_critical = planned.sort_values('cost', ascending=False)['store_id'].iloc[0] \
+                if len(planned) else None
+
+            for name in sorted(set(stats.index) | set(self.market_names)) + ['*']:
+                row = stats.loc[name].to_dict() if name in stats.index else overall
+                self._market_context[name] = {
+                    'active_project_count': int(pipeline[name]) if name in pipeline.index else portfolio_pipeline,
+                    'affected_store_count': int(round(row['substitutions'])),
+                    'budget_variance_pct': int(round(abs(row['budget_variance']))),
+                    'budget_direction': 'over' if row['budget_variance'] > 0 else 'under',
+                    'variance_reason': VARIANCE_REASONS['over' if row['budget_variance'] > 0 else 'under'],
+                    'critical_store': critical.get(name, portfolio_critical),
+                }
+
+        # Markets without history or planned stores get portfolio-wide figures
+        return self._market_context.get(market, self._market_context['*'])
+
+    # ------------------------------------------------------------------
+    # Lookup
+    # ------------------------------------------------------------------
+
+    def context(self, meeting_type: str, config: Dict) -> Dict:
+        """Data-driven context fields for one meeting (empty for meeting types it does not cover)."""
+        if meeting_type == 'site_visit_debrief':
+            row = self._row(config.get('store_id') or 'Store-201')
+            return {field: row[field] for field in SITE_VISIT_FIELDS}
+
+        if meeting_type == 'lessons_learned':
+            row = self._row(config.get('store_id') or 'Store-189')
+            context = {field: row[field] for field in LESSONS_FIELDS}
+            meeting_date = datetime.strptime(config['date'], '%Y-%m-%d')
+            context['days_since_completion'] = max(1, (meeting_date - row['completion_date'].to_pydatetime()).days)
+            return context
+
+        if meeting_type == 'vendor_negotiation':
+            topic = (config.get('topic') or '').lower()
+            category = next((cat for key, cat in TOPIC_CATEGORIES if key in topic), 'HVAC')
+            context = dict(self._vendor_context.get(category, self._vendor_context['HVAC']))
+            context.pop('vendor')
+            return context
+
+        if meeting_type == 'weekly_dev_sync':
+            market = re.sub(r'-Market$', '', config.get('topic') or '').replace('-', ' ')
+            context = {k: v for k, v in self._market_row(market).items() if v is not None}
+            hvac = self._vendor_context.get('HVAC')
+            if hvac:
+                context['lead_time'] = hvac['current_lead_time']
+            return context
+
+        return {}
+
+
+def _parse_store_range(spec: str) -> List[str]:
+    """Parse '101-400', 'Store-101,Store-102' or a mix into store ids."""
+    store_ids = []
+    for part in (p.strip() for p in spec.split(',')):
+        if re.fullmatch(r'\d+-\d+', part):
+            start, end = map(int, part.split('-'))
+            store_ids.extend(f'Store-{n}' for n in range(start, end + 1))
+        elif part:
+            store_ids.append(part)
+    return store_ids
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Build the per-store meeting context table')
+    parser.add_argument('--data-dir', default='output', help='Root of the structured data folders')
+    parser.add_argument('--stores', default='101-400', help="Store range ('101-400') or comma-separated ids")
+    parser.add_argument('--out', help='Write the table to this CSV')
+
+    args = parser.parse_args()
+
+    table = StoreContextTable(args.data_dir)
+    df = table.build(_parse_store_range(args.stores))
+
+    if args.out:
+        df.to_csv(args.out, index=False)
+        print(f"✓ Wrote {len(df)} store context rows to {args.out}")
+    else:
+        print(df.head(10).to_string())
+
+
+if __name__ == '__main__':
+    main()
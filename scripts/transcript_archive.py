@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Sharded Transcript Archive
+
+Packs many small transcripts into large append-only shard files plus a compact
+offset index, so the corpus does not cost one inode per transcript and any
+transcript can be read back by name without scanning.
+
+Layout:
+    <archive_dir>/shard-00000.dat   concatenated UTF-8 transcript bodies
+    <archive_dir>/shard-00001.dat   ...
+    <archive_dir>/index.json        logical name -> [shard, offset, length, crc32]
+
+Logical names are the sink keys used by the generators
+(e.g. 'meeting_transcripts/design_review/design_review_template-v2.3_2025-03-19.txt').
+
+Usage:
+    python transcript_archive.py pack --src output/07_Conversations --archive output/07_Conversations/archive
+    python transcript_archive.py unpack --archive output/07_Conversations/archive --dest /tmp/restored
+    python transcript_archive.py list --archive output/07_Conversations/archive
+    python transcript_archive.py cat --archive output/07_Conversations/archive meeting_transcripts/design_review/<file>.txt
+"""
+
+import argparse
+import json
+import mmap
+import os
+import zlib
+from typing import Dict, List
+
+from output_sinks import DirectorySink, OutputSink, StreamWriter
+
+INDEX_FILENAME = 'index.json'
+INDEX_VERSION = 1
+
+
+def _shard_name(shard_no: int) -> str:
+    """File name for a shard number."""
+    return f'shard-{shard_no:05d}.dat'
+
+
+def _load_index(archive_dir: str) -> Dict:
+    """Load the archive index, or an empty one for a new archive."""
+    index_path = os.path.join(archive_dir, INDEX_FILENAME)
+
+    if not os.path.exists(index_path):
+        return {'version': INDEX_VERSION, 'shards': [], 'entries': {}}
+
+    with open(index_path, 'r') as f:
+        index = json.load(f)
+
+    if index.get('version') != INDEX_VERSION:
+        raise ValueError(f"Unsupported archive index version: {index.get('version')}")
+
+    return index
+
+
+class ArchiveWriter:
+    """Append transcripts to rolling shard files and maintain the offset index."""
+
+    def __init__(self, archive_dir: str, max_shard_bytes: int = 256 * 1024 * 1024):
+        self.archive_dir = archive_dir
+        self.max_shard_bytes = max_shard_bytes
+
+        os.makedirs(archive_dir, exist_ok=True)
+        self.index = _load_index(archive_dir)
+        self._shard = None
+        self._shard_no = None
+        self._offset = 0
+
+        # Resume appending to the last shard of an existing archive
+        if self.index['shards']:
+            self._open_shard(len(self.index['shards']) - 1)
+
+    def _open_shard(self, shard_no: int):
+        """Open a shard for appending."""
+        if self._shard is not None:
+            self._shard.close()
+
+        name = _shard_name(shard_no)
+        if shard_no == len(self.index['shards']):
+            self.index['shards'].append(name)
+
+        self._shard = open(os.path.join(self.archive_dir, name), 'ab')
+        self._shard_no = shard_no
+        self._offset = self._shard.tell()
+
+    def write(self, name: str, data) -> List:
+        """Append one transcript and return its index entry."""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+
+        if self._shard is None:
+            self._open_shard(0)
+        elif self._offset > 0 and self._offset + len(data) > self.max_shard_bytes:
+            self._open_shard(self._shard_no + 1)
+
+        self._shard.write(data)
+        entry = [self._shard_no, self._offset, len(data), zlib.crc32(data)]
+        self.index['entries'][name] = entry
+        self._offset += len(data)
+
+        return entry
+
+    def open(self, name: str) -> '_EntryWriter':
+        """Start streaming one transcript into the current shard; the entry is recorded on close."""
+        if self._shard is None:
+            self._open_shard(0)
+        elif self._offset >= self.max_shard_bytes:
+            self._open_shard(self._shard_no + 1)
+
+        return _EntryWriter(self, name)
+
+    def flush(self):
+        """Flush shard data and atomically rewrite the index."""
+        if self._shard is not None:
+            self._shard.flush()
+
+        index_path = os.path.join(self.archive_dir, INDEX_FILENAME)
+        tmp_path = index_path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.index, f, separators=(',', ':'), sort_keys=True)
+        os.replace(tmp_path, index_path)
+
+    def sync(self):
+        """fsync the current shard, then rewrite the index, so indexed entries are durable."""
+        if self._shard is not None:
+            self._shard.flush()
+            os.fsync(self._shard.fileno())
+        self.flush()
+
+    def close(self):
+        """Flush and close the current shard."""
+        self.flush()
+        if self._shard is not None:
+            self._shard.close()
+            self._shard = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class _EntryWriter:
+    """Appends one streamed transcript to the open shard, tracking its length and crc32."""
+
+    def __init__(self, writer: ArchiveWriter, name: str):
+        self.writer = writer
+        self.name = name
+        self.offset = writer._offset
+        self.length = 0
+        self.crc = 0
+        self.entry = None
+
+    def write(self, text):
+        data = text.encode('utf-8') if isinstance(text, str) else text
+        self.writer._shard.write(data)
+        self.crc = zlib.crc32(data, self.crc)
+        self.length += len(data)
+
+    def close(self) -> List:
+        if self.entry is None:
+            self.entry = [self.writer._shard_no, self.offset, self.length, self.crc]
+            self.writer.index['entries'][self.name] = self.entry
+            self.writer._offset += self.length
+        return self.entry
+
+
+class ArchiveReader:
+    """Random-access reader that memory-maps shards on first use."""
+
+    def __init__(self, archive_dir: str, verify: bool = True):
+        self.archive_dir = archive_dir
+        self.verify = verify
+        self.index = _load_index(archive_dir)
+        self._maps = {}
+        self._files = {}
+
+    def _map(self, shard_no: int):
+        """Return the mmap for a shard, opening it lazily."""
+        if shard_no not in self._maps:
+            path = os.path.join(self.archive_dir, self.index['shards'][shard_no])
+            f = open(path, 'rb')
+            self._files[shard_no] = f
+            self._maps[shard_no] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._maps[shard_no]
+
+    def names(self) -> List[str]:
+        """All logical names in the archive, sorted."""
+        return sorted(self.index['entries'])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index['entries']
+
+    def __len__(self) -> int:
+        return len(self.index['entries'])
+
+    def read_bytes(self, name: str) -> bytes:
+        """Return the raw bytes stored under a logical name."""
+        if name not in self.index['entries']:
+            raise KeyError(f"Transcript not in archive: {name}")
+
+        shard_no, offset, length, crc = self.index['entries'][name]
+        if length == 0:
+            data = b''
+        else:
+            data = self._map(shard_no)[offset:offset + length]
+
+        if self.verify and zlib.crc32(data) != crc:
+            raise ValueError(f"Checksum mismatch for {name} in {self.index['shards'][shard_no]}")
+
+        return data
+
+    def read(self, name: str) -> str:
+        """Return the transcript text stored under a logical name."""
+        return self.read_bytes(name).decode('utf-8')
+
+    def close(self):
+        """Release all memory maps."""
+        for m in self._maps.values():
+            m.close()
+        for f in self._files.values():
+            f.close()
+        self._maps = {}
+        self._files = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+class ArchiveSink(OutputSink):
+    """Output sink that appends transcripts to a sharded archive."""
+
+    kind = 'archive'
+
+    def __init__(self, archive_dir: str, **options):
+        self.writer = ArchiveWriter(archive_dir, **options)
+
+    def _location(self, key: str, shard_no: int, offset: int) -> str:
+        """Human-readable location of an archived transcript."""
+        return f"{os.path.join(self.writer.archive_dir, _shard_name(shard_no))}@{offset}:{key}"
+
+    def write(self, key: str, text: str) -> str:
+        shard_no, offset, _, _ = self.writer.write(key, text)
+        return self._location(key, shard_no, offset)
+
+    def open(self, key: str) -> StreamWriter:
+        entry = self.writer.open(key)
+
+        def finish():
+            shard_no, offset, _, _ = entry.close()
+            return self._location(key, shard_no, offset)
+
+        return StreamWriter(entry, finish)
+
+    def read(self, key: str):
+        entry = self.writer.index['entries'].get(key)
+        if entry is None:
+            return None
+
+        shard_no, offset, length, crc = entry
+        if self.writer._shard is not None:
+            self.writer._shard.flush()
+        with open(os.path.join(self.writer.archive_dir, _shard_name(shard_no)), 'rb') as f:
+            f.seek(offset)
+            data = f.read(length)
+
+        if zlib.crc32(data) != crc:
+            return None
+        return data.decode('utf-8')
+
+    def sync(self):
+        self.writer.sync()
+
+    def close(self):
+        self.writer.close()
+
+
+def pack_tree(src_root: str, archive_dir: str, subdir: str = 'meeting_transcripts',
+              max_shard_bytes: int = 256 * 1024 * 1024) -> int:
+    """Pack <src_root>/<subdir>/<type>/*.txt into an archive. Returns the count packed."""
+    count = 0
+    base = os.path.join(src_root, subdir)
+
+    with ArchiveWriter(archive_dir, max_shard_bytes=max_shard_bytes) as writer:
+        for meeting_type in sorted(os.listdir(base)):
+            type_dir = os.path.join(base, meeting_type)
+            if not os.path.isdir(type_dir):
+                continue
+
+            for filename in sorted(os.listdir(type_dir)):
+                if not filename.endswith('.txt'):
+                    continue
+                with open(os.path.join(type_dir, filename), 'rb') as f:
+                    writer.write(f'{subdir}/{meeting_type}/{filename}', f.read())
+                count += 1
+
+    return count
+
+
+def unpack_archive(archive_dir: str, dest_root: str) -> int:
+    """Expand an archive back into the <dest_root>/meeting_transcripts/<type>/*.txt tree."""
+    sink = DirectorySink(dest_root)
+
+    with ArchiveReader(archive_dir) as reader:
+        names = reader.names()
+        for name in names:
+            sink.write(name, reader.read(name))
+
+    return len(names)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Pack, unpack and read sharded transcript archives')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    pack = subparsers.add_parser('pack', help='Pack a transcript tree into an archive')
+    pack.add_argument('--src', default='output/07_Conversations', help='Root containing meeting_transcripts/')
+    pack.add_argument('--archive', required=True, help='Archive directory')
+    pack.add_argument('--max-shard-mb', type=int, default=256, help='Roll to a new shard after this many MB')
+
+    unpack = subparsers.add_parser('unpack', help='Expand an archive into a transcript tree')
+    unpack.add_argument('--archive', required=True, help='Archive directory')
+    unpack.add_argument('--dest', required=True, help='Destination root for meeting_transcripts/')
+
+    listing = subparsers.add_parser('list', help='List transcripts in an archive')
+    listing.add_argument('--archive', required=True, help='Archive directory')
+
+    cat = subparsers.add_parser('cat', help='Print one transcript')
+    cat.add_argument('--archive', required=True, help='Archive directory')
+    cat.add_argument('name', help='Logical transcript name')
+
+    args = parser.parse_args()
+
+    if args.command == 'pack':
+        count = pack_tree(args.src, args.archive, max_shard_bytes=args.max_shard_mb * 1024 * 1024)
+        print(f"✓ Packed {count} transcripts into {args.archive}")
+    elif args.command == 'unpack':
+        count = unpack_archive(args.archive, args.dest)
+        print(f"✓ Unpacked {count} transcripts into {args.dest}")
+    elif args.command == 'list':
+        with ArchiveReader(args.archive) as reader:
+            for name in reader.names():
+                print(name)
+    elif args.command == 'cat':
+        with ArchiveReader(args.archive) as reader:
+            print(reader.read(args.name))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Vendor Price Index
+
+Normalized view of 06_Vendor_Data, so vendor questions are dict lookups instead of
+scans over the free-form catalog and the string-typed price sheet:
+
+- lead times parsed to whole weeks, rounded up ("10 weeks", "90 days" -> 13, "6-8 weeks" -> upper bound)
+- coverage phrases ("National", "All Midwest", "All OH, IN, KY markets", market names)
+  expanded to the concrete markets of 04_Regional_Modifiers
+- price entries hashed by category, (category, item), market and (category, market),
+  each bucket sorted by price, so the cheapest match is the first entry that passes
+  the lead time filter
+
+"Cheapest in-market HVAC unit with lead time <= 8 weeks" is one dict lookup plus a
+walk over the k entries of that (category, market) bucket.
+
+Usage:
+    index = VendorPriceIndex.load('output')
+    index.cheapest('HVAC', market='Columbus', max_lead_weeks=8)   # TempMaster, $15,000
+    index.serves('CoolAir Systems', 'Detroit')                     # False
+    index.lead_time_weeks['BuildRight Construction']               # 13
+
+    python vendor_index.py --category HVAC --market Columbus --max-lead-weeks 8
+"""
+
+import argparse
+import math
+import re
+from collections import defaultdict
+from fractions import Fraction
+from typing import Dict, Iterable, List, Optional, Set
+
+import pandas as pd
+
+from artifact_io import load_json, open_artifact
+
+CATALOG_FILE = '06_Vendor_Data/vendor_catalog.json'
+PRICING_FILE = '06_Vendor_Data/vendor_pricing.csv'
+MARKETS_FILE = '04_Regional_Modifiers/regional_modifiers.csv'
+
+# Vendor coverage phrases used in the vendor catalog
+MIDWEST_STATES = {'OH', 'IN', 'KY', 'MI', 'IL', 'WI', 'MN', 'IA', 'MO', 'PA'}
+
+# Exact ratios, so whole-week durations ('3 months', '21 days') don't round up on float noise
+WEEKS_PER_UNIT = {'day': Fraction(1, 7), 'week': 1, 'month': Fraction(52, 12)}
+
+LEAD_TIME_PATTERN = re.compile(r'(\d+(?:\.\d+)?)(?:\s*-\s*(\d+(?:\.\d+)?))?\s*(day|week|month)', re.IGNORECASE)
+
+
+def parse_lead_time(text) -> Optional[int]:
+    """
+    Parse a lead time string to whole weeks, rounded up (59 days is 9 weeks, not 8).
+
+    Args:
+        text: e.g. '10 weeks', '90 days', '6-8 weeks' (ranges use the upper bound)
+
+    Returns:
+        Weeks, or None when the text has no recognizable duration
+    """
+    match = LEAD_TIME_PATTERN.search(str(text))
+    if not match:
+        return None
+    value = Fraction(match.group(2) or match.group(1))
+    return math.ceil(value * WEEKS_PER_UNIT[match.group(3).lower()])
+
+
+def catalog_lead_time(vendor: Dict) -> Optional[int]:
+    """Lead time in weeks (days rounded up) from a catalog vendor's pricing dict, or None if unstated."""
+    pricing = vendor.get('pricing', {})
+    if 'typical_lead_time_weeks' in pricing:
+        return int(pricing['typical_lead_time_weeks'])
+    if 'typical_lead_time_days' in pricing:
+        return math.ceil(pricing['typical_lead_time_days'] / 7)
+    return None
+
+
+def expand_coverage(coverage: Iterable[str], market_state: Dict[str, str]) -> Set[str]:
+    """
+    Concrete markets behind a vendor's coverage phrases.
+
+    Args:
+        coverage: Catalog 'markets' entries
+        market_state: Market name -> state code
+    """
+    markets = set()
+    for phrase in coverage:
+        if phrase == 'National':
+            return set(market_state)
+        if phrase in market_state:
+            markets.add(phrase)
+            continue
+        states = MIDWEST_STATES if phrase == 'All Midwest' else set(re.findall(r'\b[A-Z]{2}\b', phrase))
+        markets.update(market for market, state in market_state.items() if state in states)
+    return markets
+
+
+def _item_key(item: str) -> str:
+    """Case- and spacing-insensitive item name."""
+    return ' '.join(str(item).lower().split())
+
+
+def _price_key(entry: Dict):
+    """Cheapest first, then shortest lead time; unknown lead times sort last."""
+    lead_time = entry['lead_time_weeks']
+    return entry['price'], lead_time is None, lead_time or 0
+
+
+class VendorPriceIndex:
+    """Price entries with hash indexes by category, item and market."""
+
+    def __init__(self, vendors: List[Dict], pricing: List[Dict], market_state: Dict[str, str]):
+        """
+        Args:
+            vendors: Catalog vendors as in vendor_catalog.json
+            pricing: Price sheet rows as in vendor_pricing.csv (Vendor, Category, Item, Price, ...)
+            market_state: Market name -> state code (regional_modifiers.csv)
+        """
+        self.vendors = {vendor['name']: vendor for vendor in vendors}
+        self.markets = {name: expand_coverage(vendor.get('markets', []), market_state)
+                        for name, vendor in self.vendors.items()}
+        self.lead_time_weeks = {name: catalog_lead_time(vendor) for name, vendor in self.vendors.items()}
+
+        self.entries = [self._entry(row) for row in pricing]
+
+        self.by_vendor = defaultdict(list)
+        self.by_category = defaultdict(list)
+        self.by_item = defaultdict(list)
+        self.by_market = defaultdict(list)
+        self.by_category_market = defaultdict(list)
+
+        # Vendor buckets keep sheet order; the rest are sorted cheapest first
+        for entry in self.entries:
+            self.by_vendor[entry['vendor']].append(entry)
+
+        for entry in sorted(self.entries, key=_price_key):
+            self.by_category[entry['category']].append(entry)
+            self.by_item[(entry['category'], _item_key(entry['item']))].append(entry)
+            for market in entry['markets']:
+                self.by_market[market].append(entry)
+                self.by_category_market[(entry['category'], market)].append(entry)
+
+    def _entry(self, row: Dict) -> Dict:
+        """Normalize one price sheet row."""
+        vendor = row['Vendor']
+        lead_time = parse_lead_time(row.get('Lead Time'))
+        notes = row.get('Notes')
+
+        return {
+            'vendor': vendor,
+            'vendor_id': self.vendors.get(vendor, {}).get('vendor_id'),
+            'category': row['Category'],
+            'item': row['Item'],
+            'price': float(row['Price']),
+            'unit': row.get('Unit'),
+            'lead_time_weeks': lead_time if lead_time is not None else self.lead_time_weeks.get(vendor),
+            'notes': notes if isinstance(notes, str) else '',
+            'markets': frozenset(self.markets.get(vendor, ()))
+        }
+
+    @classmethod
+    def from_tables(cls, vendors: List[Dict], pricing: pd.DataFrame, markets: pd.DataFrame) -> 'VendorPriceIndex':
+        """Build the index from already-loaded catalog, price sheet and market tables."""
+        return cls(vendors, pricing.to_dict('records'), dict(zip(markets['market'], markets['state'])))
+
+    @classmethod
+    def load(cls, data_dir: str = 'output') -> 'VendorPriceIndex':
+        """Build the index from 06_Vendor_Data and 04_Regional_Modifiers."""
+        with open_artifact(f'{data_dir}/{PRICING_FILE}') as f:
+            pricing = pd.read_csv(f)
+        with open_artifact(f'{data_dir}/{MARKETS_FILE}') as f:
+            markets = pd.read_csv(f)
+        return cls.from_tables(load_json(f'{data_dir}/{CATALOG_FILE}')['vendors'], pricing, markets)
+
+    def serves(self, vendor: str, market: str) -> bool:
+        """Whether a catalog vendor covers a market."""
+        return market in self.markets.get(vendor, ())
+
+    def first_price(self, vendor: str) -> Optional[float]:
+        """Price of the vendor's first price sheet line, or None if it has none."""
+        entries = self.by_vendor.get(vendor)
+        return entries[0]['price'] if entries else None
+
+    def find(self, category: Optional[str] = None, item: Optional[str] = None,
+             market: Optional[str] = None, max_lead_weeks: Optional[int] = None) -> List[Dict]:
+        """
+        Matching price entries, cheapest first.
+
+        Args:
+            category: Price sheet category (e.g. 'HVAC')
+            item: Item name (needs category; case-insensitive)
+            market: Only vendors covering this market
+            max_lead_weeks: Only entries deliverable within this many weeks (entries with
+                no known lead time are excluded)
+
+        Returns:
+            Entries from the narrowest index bucket that passes every filter
+        """
+        if item is not None:
+            if category is None:
+                raise ValueError("item lookups need a category")
+            bucket = self.by_item.get((category, _item_key(item)), [])
+        elif category is not None and market is not None:
+            bucket = self.by_category_market.get((category, market), [])
+        elif category is not None:
+            bucket = self.by_category.get(category, [])
+        elif market is not None:
+            bucket = self.by_market.get(market, [])
+        else:
+            bucket = sorted(self.entries, key=_price_key)
+
+        return [
+            entry for entry in bucket
+            if (market is None or market in entry['markets'])
+            and (max_lead_weeks is None
+                 or (entry['lead_time_weeks'] is not None and entry['lead_time_weeks'] <= max_lead_weeks))
+        ]
+
+    def cheapest(self, category: Optional[str] = None, item: Optional[str] = None,
+                 market: Optional[str] = None, max_lead_weeks: Optional[int] = None) -> Optional[Dict]:
+        """Cheapest entry matching find()'s filters, or None."""
+        matches = self.find(category, item, market, max_lead_weeks)
+        return matches[0] if matches else None
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Query the vendor price index')
+    parser.add_argument('--data-dir', default='output', help='Structured data directory (default: output)')
+    parser.add_argument('--category', help='Price sheet category (e.g. HVAC)')
+    parser.add_argument('--item', help='Item name (with --category)')
+    parser.add_argument('--market', help='Only vendors covering this market')
+    parser.add_argument('--max-lead-weeks', type=int, help='Maximum lead time in weeks')
+
+    args = parser.parse_args()
+    if args.item and not args.category:
+        parser.error("--item needs --category")
+
+    index = VendorPriceIndex.load(args.data_dir)
+    matches = index.find(args.category, args.item, args.market, args.max_lead_weeks)
+
+    if not matches:
+        print("⚠ No matching vendor prices")
+        return
+
+    for entry in matches:
+        lead_time = entry['lead_time_weeks'] if entry['lead_time_weeks'] is not None else '?'
+        print(f"  {entry['vendor']:<22} {entry['category']:<11} {entry['item']:<26} "
+              f"${entry['price']:>9,.0f}/{entry['unit']:<7} {lead_time:>2} weeks  "
+              f"({len(entry['markets'])} markets)")
+
+
+if __name__ == '__main__':
+    main()
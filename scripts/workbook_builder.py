@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Streaming Workbook Builder
+
+Row-by-row layer over openpyxl's write-only mode for the generated Excel artifacts.
+Regular openpyxl workbooks keep a Cell object per assigned cell and restyle each one
+attribute by attribute; here rows are streamed to disk as they are appended, so memory
+stays flat and 100k+ line-item rows cost one pass:
+
+- styles live in a StyleRegistry: each name becomes one openpyxl NamedStyle in the
+  workbook the first time it is used, and is resolved to a style array once; every
+  later cell copies the array instead of re-hashing fonts, fills, borders and alignments
+- a style is a registered name, a dict of cell attributes (font, fill, alignment,
+  border, number_format), or a tuple of those applied in order (a leading name is the
+  cell's named style, the rest are overrides)
+- column widths and frozen panes are declared when the sheet is created (write-only
+  sheets emit them before the first row); merged ranges can be added at any point
+  before saving
+- append() returns the row number it wrote, for merges and formulas that refer back
+
+StyleRegistry also serves regular (random access) workbooks:
+
+    styles = StyleRegistry(wb, {'header': {...}, 'bold': {'font': Font(bold=True)}})
+    styles.apply(ws['A1'], 'header')
+    styles.apply(ws['B7'], 'bold', number_format='$#,##0')
+
+Usage:
+    book = WorkbookBuilder()
+    book.add_style('header', {'font': Font(bold=True), 'fill': PatternFill(...)})
+    book.add_style('money', {'number_format': '$#,##0'})
+
+    sheet = book.add_sheet('Detailed Line Items', widths={'A': 18, 'B': 35}, freeze='A4')
+    sheet.append(["Detailed Line Items"], style={'font': Font(bold=True, size=14)}, merge='G')
+    sheet.skip()
+    sheet.append(['Category', 'Item', 'Total'], style='header')
+    for item in items:
+        sheet.append(['', item['item'], item['total']], styles={3: 'money'})
+
+    book.save('output/08_Budget_Artifacts/budget_plans/plan.xlsx')
+"""
+
+from copy import copy
+from typing import Callable, Dict, Optional, Sequence, Union
+
+from openpyxl import Workbook
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.styles import Alignment, Border, NamedStyle, Protection
+from openpyxl.styles.borders import DEFAULT_BORDER
+from openpyxl.styles.fills import DEFAULT_EMPTY_FILL
+from openpyxl.styles.fonts import DEFAULT_FONT
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.utils import column_index_from_string
+
+STYLE_ATTRIBUTES = ('font', 'fill', 'alignment', 'border', 'number_format', 'protection')
+
+NAMED_STYLE_DEFAULTS = {
+    'font': DEFAULT_FONT,
+    'fill': DEFAULT_EMPTY_FILL,
+    'border': DEFAULT_BORDER,
+    'alignment': Alignment(),
+    'protection': Protection()
+}
+
+Style = Union[str, Dict, tuple, None]
+
+
+class StyleRegistry:
+    """Cell styles registered once per workbook as openpyxl NamedStyles and applied by name."""
+
+    def __init__(self, workbook, styles: Optional[Dict[str, Dict]] = None, prefix: str = ''):
+        """
+        Args:
+            workbook: Regular or write-only openpyxl Workbook
+            styles: Style name -> cell attributes
+            prefix: Prepended to the NamedStyle names in the file (keeps them clear of
+                Excel's built-in 'Title', 'Note', 'Output', ... which match case-insensitively)
+        """
+        self.workbook = workbook
+        self.prefix = prefix
+        self.styles: Dict[str, Dict] = {}
+        self._registered = set()
+        for name, attributes in (styles or {}).items():
+            self.add(name, attributes)
+
+    def add(self, name: str, attributes: Dict) -> 'StyleRegistry':
+        """
+        Register a style.
+
+        Args:
+            name: Name used in apply() / append(style=/styles=)
+            attributes: Cell attributes, e.g. {'font': Font(bold=True), 'number_format': '$#,##0'}
+        """
+        unknown = set(attributes) - set(STYLE_ATTRIBUTES)
+        if unknown:
+            raise ValueError(f"Unknown style attribute(s): {', '.join(sorted(unknown))}")
+        if name in self._registered:
+            raise ValueError(f"Style '{name}' is already in use in this workbook")
+        self.styles[name] = attributes
+        return self
+
+    def named_style(self, name: str) -> str:
+        """Workbook NamedStyle name for a style, adding it to the workbook on first use."""
+        if name not in self._registered:
+            # Unset attributes keep the workbook defaults (NamedStyle would use an empty Font())
+            attributes = {**NAMED_STYLE_DEFAULTS, **self.styles[name]}
+            self.workbook.add_named_style(NamedStyle(name=f'{self.prefix}{name}', **attributes))
+            self._registered.add(name)
+        return f'{self.prefix}{name}'
+
+    def apply(self, cell, name: str, **overrides):
+        """
+        Give a cell a named style, then any attribute overrides (e.g. number_format).
+
+        Returns:
+            The cell
+        """
+        cell.style = self.named_style(name)
+        for attribute, value in overrides.items():
+            setattr(cell, attribute, value)
+        return cell
+
+
+class WorkbookBuilder:
+    """Write-only workbook with a registry of pre-resolved cell styles."""
+
+    def __init__(self, styles: Optional[Dict[str, Dict]] = None, prefix: str = ''):
+        """
+        Args:
+            styles: Style name -> cell attributes (see StyleRegistry)
+            prefix: NamedStyle name prefix (see StyleRegistry)
+        """
+        self.workbook = Workbook(write_only=True)
+        self.styles = StyleRegistry(self.workbook, styles, prefix)
+        self._resolved: Dict = {}
+        self._edges: Dict = {}
+        self.sheets = []
+
+    def add_style(self, name: str, attributes: Dict) -> 'WorkbookBuilder':
+        """Register a style (see StyleRegistry.add)."""
+        self.styles.add(name, attributes)
+        return self
+
+    def add_sheet(self, title: str, widths: Optional[Dict[str, float]] = None,
+                  freeze: Optional[str] = None) -> 'SheetBuilder':
+        """
+        Create the next worksheet.
+
+        Args:
+            title: Sheet name
+            widths: Column letter -> width
+            freeze: Top-left unfrozen cell (e.g. 'A4')
+        """
+        sheet = SheetBuilder(self, self.workbook.create_sheet(title), widths, freeze)
+        self.sheets.append(sheet)
+        return sheet
+
+    def style_array(self, style: Style, worksheet) -> Optional[StyleArray]:
+        """Resolve a style spec to an openpyxl style array (cached for names and tuples of names)."""
+        if style is None:
+            return None
+
+        key = style if _cacheable(style) else None
+        if key is not None and key in self._resolved:
+            return self._resolved[key]
+
+        cell = WriteOnlyCell(worksheet)
+        for position, part in enumerate(style if isinstance(style, tuple) else (style,)):
+            if position == 0 and isinstance(part, str):
+                self.styles.apply(cell, part)
+                continue
+            attributes = self.styles.styles[part] if isinstance(part, str) else part
+            for attribute, value in attributes.items():
+                setattr(cell, attribute, value)
+
+        if key is not None:
+            self._resolved[key] = cell._style
+        return cell._style
+
+    def save(self, filename: str, saver: Optional[Callable] = None) -> str:
+        """
+        Close every sheet and write the file.
+
+        Args:
+            saver: Optional saver(workbook, filename), e.g. to stamp document times
+        """
+        if saver is not None:
+            saver(self.workbook, filename)
+        else:
+            self.workbook.save(filename)
+        return filename
+
+
+class SheetBuilder:
+    """One streamed worksheet; rows are written in order and cannot be revisited."""
+
+    def __init__(self, book: WorkbookBuilder, worksheet, widths: Optional[Dict[str, float]] = None,
+                 freeze: Optional[str] = None):
+        self.book = book
+        self.worksheet = worksheet
+        self.row = 0
+
+        for column, width in (widths or {}).items():
+            worksheet.column_dimensions[column].width = width
+        if freeze:
+            worksheet.freeze_panes = freeze
+
+    def append(self, values: Sequence, style: Style = None, styles: Optional[Dict] = None,
+               merge: Optional[str] = None) -> int:
+        """
+        Write the next row.
+
+        Args:
+            values: Cell values from column A (None leaves a cell empty)
+            style: Style for every non-empty cell in the row
+            styles: Per-column styles, keyed by 1-based index or letter (override `style`)
+            merge: Last column of a merged range starting in column A (e.g. 'D');
+                covered cells get the first cell's edge borders, as ws.merge_cells() does
+
+        Returns:
+            The row number written
+        """
+        styles = {_column_index(column): value for column, value in (styles or {}).items()}
+        cells = []
+
+        for column, value in enumerate(values, 1):
+            cell_style = styles.get(column, style)
+            if cell_style is None or value is None:
+                cells.append(value)
+                continue
+
+            cell = WriteOnlyCell(self.worksheet, value=value)
+            cell._style = copy(self.book.style_array(cell_style, self.worksheet))
+            cells.append(cell)
+
+        if merge:
+            self._merge_borders(cells, _column_index(merge))
+
+        self.worksheet.append(cells)
+        self.row += 1
+
+        if merge:
+            self.merge(f'A{self.row}:{merge}{self.row}')
+        return self.row
+
+    def _merge_borders(self, cells: list, last: int):
+        """Pad a row to a merge's last column, carrying the first cell's top/bottom/right borders."""
+        cells.extend([None] * (last - len(cells)))
+        first = cells[0] if cells else None
+        if not isinstance(first, Cell):
+            return
+
+        sides = {name: getattr(first.border, name) for name in ('top', 'bottom', 'right')}
+        sides = {name: side for name, side in sides.items() if side is not None and side.style is not None}
+        if not sides:
+            return
+
+        for column in range(2, last + 1):
+            if cells[column - 1] is not None:
+                continue
+            edge = tuple(name for name in sides if name != 'right' or column == last)
+            if not edge:
+                continue
+            key = (first.style_id, edge)
+            if key not in self.book._edges:
+                border = Border(**{name: sides[name] for name in edge})
+                self.book._edges[key] = self.book.style_array({'border': border}, self.worksheet)
+            cell = WriteOnlyCell(self.worksheet)
+            cell._style = copy(self.book._edges[key])
+            cells[column - 1] = cell
+
+    def skip(self, rows: int = 1):
+        """Leave blank rows."""
+        for _ in range(rows):
+            self.worksheet.append([])
+        self.row += rows
+
+    def merge(self, cell_range: str):
+        """Merge a range (written when the sheet is saved, so earlier rows are fine)."""
+        self.worksheet.merged_cells.add(cell_range)
+
+
+def _column_index(column: Union[int, str]) -> int:
+    """1-based column index from an index or a letter."""
+    return column if isinstance(column, int) else column_index_from_string(column)
+
+
+def _cacheable(style: Style) -> bool:
+    """Names and tuples of names are cached; dicts are resolved each time."""
+    if isinstance(style, str):
+        return True
+    return isinstance(style, tuple) and all(isinstance(part, str) for part in style)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Write-Behind Pipeline
+
+Separates rendering from storage I/O for batch runs, so rendering never waits on disk:
+
+- jobs are rendered in an executor (render_workers threads); the event loop stays free
+- rendered artifacts go onto a bounded asyncio queue; when the writer falls behind,
+  rendering pauses (backpressure caps how many transcripts are held in memory)
+- a writer task drains the queue in batches of up to batch_size, writes each batch
+  to the sink from a dedicated I/O thread, and calls sink.sync() (fsync) every
+  fsync_every artifacts and once at the end
+- results come back in job order, so callers can build the index deterministically
+
+Usage:
+    def render(job):
+        return {'key': transcript_key(...), 'text': transcript}   # or None to skip writing
+
+    pipeline = WriteBehindPipeline(sink, max_pending=64, batch_size=16, fsync_every=256)
+    for result in pipeline.run(jobs, render):
+        if result['error']: ...
+    print(pipeline.summary())
+"""
+
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List
+
+from run_metrics import NULL_METRICS
+
+# Queued by the producer after the last artifact
+_DONE = object()
+
+
+class WriteBehindPipeline:
+    """Render jobs in an executor and write their artifacts behind a bounded queue."""
+
+    def __init__(self, sink, max_pending: int = 64, batch_size: int = 16, fsync_every: int = 256,
+                 render_workers: int = 1, metrics=None):
+        self.sink = sink
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.fsync_every = fsync_every
+        self.render_workers = render_workers
+        self.metrics = metrics or NULL_METRICS
+        self.stats = {'written': 0, 'batches': 0, 'syncs': 0, 'backpressure_waits': 0}
+
+    def run(self, jobs: List, render: Callable) -> List[Dict]:
+        """
+        Render and write all jobs.
+
+        Returns:
+            One {'artifact', 'location', 'error'} result per job, in job order
+        """
+        return asyncio.run(self._run(jobs, render))
+
+    async def _run(self, jobs: List, render: Callable) -> List[Dict]:
+        results = [{'artifact': None, 'location': None, 'error': None} for _ in jobs]
+        queue = asyncio.Queue(maxsize=self.max_pending)
+
+        # Separate pools: a slow disk must not hold up rendering threads and vice versa
+        with ThreadPoolExecutor(max_workers=self.render_workers) as render_pool, \
+                ThreadPoolExecutor(max_workers=1) as io_pool:
+            producer = asyncio.ensure_future(self._produce(jobs, render, render_pool, queue, results))
+            writer = asyncio.ensure_future(self._write(io_pool, queue, results))
+
+            done, pending = await asyncio.wait([producer, writer], return_when=asyncio.FIRST_EXCEPTION)
+            for task in pending:
+                task.cancel()
+            for task in done:
+                task.result()  # re-raise writer/producer failures
+
+        return results
+
+    async def _produce(self, jobs: List, render: Callable, render_pool, queue, results):
+        """Render jobs (up to render_workers at once) and queue artifacts in job order."""
+        loop = asyncio.get_running_loop()
+        in_flight = deque()
+
+        for seq, job in enumerate(jobs):
+            in_flight.append((seq, loop.run_in_executor(render_pool, _render_safely, render, job)))
+            if len(in_flight) >= self.render_workers:
+                await self._emit(*in_flight.popleft(), queue, results)
+
+        while in_flight:
+            await self._emit(*in_flight.popleft(), queue, results)
+
+        await queue.put(_DONE)
+
+    async def _emit(self, seq: int, future, queue, results):
+        """Record a render result and queue its artifact, waiting if the writer is behind."""
+        artifact, error = await future
+        results[seq]['artifact'] = artifact
+        results[seq]['error'] = error
+
+        if artifact is not None:
+            if queue.full():
+                self.stats['backpressure_waits'] += 1
+            await queue.put((seq, artifact))
+
+    async def _write(self, io_pool, queue, results):
+        """Drain the queue in batches and write them from the I/O thread."""
+        loop = asyncio.get_running_loop()
+        unsynced = 0
+        finished = False
+
+        while not finished:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            if batch[-1] is _DONE:
+                batch.pop()
+                finished = True
+
+            if batch:
+                await loop.run_in_executor(io_pool, self._write_batch, batch, results)
+                self.stats['batches'] += 1
+                unsynced += len(batch)
+
+            if unsynced and (finished or unsynced >= self.fsync_every):
+                await loop.run_in_executor(io_pool, self._sync)
+                self.stats['syncs'] += 1
+                unsynced = 0
+
+    def _write_batch(self, batch: List, results: List[Dict]):
+        """Write one batch of (seq, artifact) pairs to the sink."""
+        with self.metrics.stage('write'):
+            for seq, artifact in batch:
+                results[seq]['location'] = self.sink.write(artifact['key'], artifact['text'])
+                self.metrics.add_bytes(len(artifact['text'].encode('utf-8')))
+        self.stats['written'] += len(batch)
+
+    def _sync(self):
+        """fsync everything written so far."""
+        with self.metrics.stage('sync'):
+            self.sink.sync()
+
+    def summary(self) -> str:
+        """One-line write summary."""
+        return (f"{self.stats['written']} written in {self.stats['batches']} batches, "
+                f"{self.stats['syncs']} syncs, {self.stats['backpressure_waits']} backpressure waits")
+
+
+def _render_safely(render: Callable, job):
+    """Run render in the executor, returning (artifact, error) instead of raising."""
+    try:
+        return render(job), None
+    except Exception as e:
+        return None, e